@@ -17,9 +17,10 @@ The environment is controlled via config.py.
 """
 
 import logging
+import sys
 import time
 import threading
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict, List, Any, Optional, Callable
 from config import BASE_URL, API_KEY, API_SECRET
 from auth import CoincallAuth
@@ -31,7 +32,7 @@ logger = logging.getLogger(__name__)
 # Data Classes - Typed snapshots for positions and account state
 # =============================================================================
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PositionSnapshot:
     """
     Point-in-time view of a single position.
@@ -56,7 +57,7 @@ class PositionSnapshot:
     timestamp: float = 0.0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AccountSnapshot:
     """
     Point-in-time view of account state plus all open positions.
@@ -79,17 +80,25 @@ class AccountSnapshot:
     net_theta: float = 0.0
     net_vega: float  = 0.0
     timestamp: float = 0.0
-    
+    # Derived: symbols of all positions, for O(1) membership checks, and
+    # symbol → first position with that symbol, for get_position()
+    position_symbols: frozenset = field(init=False, repr=False, compare=False)
+    _positions_by_symbol: dict = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        by_symbol: dict = {}
+        for p in self.positions:
+            by_symbol.setdefault(p.symbol, p)
+        object.__setattr__(self, "_positions_by_symbol", by_symbol)
+        object.__setattr__(self, "position_symbols", frozenset(by_symbol))
+
     @property
     def position_count(self) -> int:
         return len(self.positions)
     
     def get_position(self, symbol: str) -> Optional[PositionSnapshot]:
         """Find a position by symbol, or None."""
-        for p in self.positions:
-            if p.symbol == symbol:
-                return p
-        return None
+        return self._positions_by_symbol.get(symbol)
     
     def summary_str(self) -> str:
         """Human-readable one-liner."""
@@ -451,7 +460,9 @@ class PositionMonitor:
             
             ps = PositionSnapshot(
                 position_id=str(pos.get('position_id', '')),
-                symbol=pos.get('symbol', ''),
+                # Interned like TradeLeg.symbol: one shared str per contract
+                # across polls, and leg/position compares hit identity first
+                symbol=sys.intern(str(pos.get('symbol', ''))),
                 qty=pos.get('qty', 0.0),
                 side=side,
                 entry_price=pos.get('avg_price', 0.0),
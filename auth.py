@@ -18,18 +18,49 @@ Content Types:
 import hashlib
 import hmac
 import json
+import random
 import time
 import logging
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Dict, Any, Optional
 
 from retry import retry
 
+# orjson is optional — a much faster JSON codec for request/response bodies.
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 # Default timeout for all API requests (30 seconds)
 DEFAULT_REQUEST_TIMEOUT = 30.0
 
+# Keep-alive connections held per host.  requests' default of 10 is below
+# the number of threads that can hit Coincall at once (strategy ticks,
+# fill managers, dashboard, account polling), and connections beyond the
+# pool are closed after use — paying a fresh TLS handshake next time.
+HTTP_POOL_SIZE = 16
+
+
+def _encode_body(data: Any) -> bytes:
+    """Serialize a request body to UTF-8 JSON (orjson when installed)."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data)
+        except TypeError:  # e.g. ints beyond 64 bits — let stdlib handle it
+            pass
+    return json.dumps(data).encode('utf-8')
+
+
+def _decode_body(raw: bytes) -> Any:
+    """Parse a JSON response body (orjson when installed)."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
 class CoincallAuth:
     """Handles Coincall API authentication and request signing"""
@@ -38,6 +69,14 @@ class CoincallAuth:
     _UNREACHABLE_THRESHOLD = 3
     # After this many consecutive failures, recreate the HTTP session
     _SESSION_REFRESH_THRESHOLD = 5
+    # Request validity window sent with every signed request (ms)
+    _X_REQ_TS_DIFF = 5000
+    # Resends after HTTP 429 (any method) or 5xx (GET only)
+    _HTTP_RETRIES = 2
+    # Wait used when a 429 carries no usable Retry-After, and the cap on
+    # any Retry-After so a bad header cannot stall every caller
+    _RETRY_AFTER_DEFAULT = 1.0
+    _RETRY_AFTER_MAX = 10.0
 
     def __init__(self, api_key: str, api_secret: str, base_url: str):
         """
@@ -51,8 +90,37 @@ class CoincallAuth:
         self.api_key = api_key
         self.api_secret = api_secret
         self.base_url = base_url
-        self.session = requests.Session()
+        # Keyed HMAC state (inner/outer pads already absorbed); each
+        # signature starts from a copy instead of re-keying.
+        self._hmac_template = hmac.new(
+            (api_secret or '').encode('utf-8'), digestmod=hashlib.sha256,
+        )
+        # Per-request constants, built once: header fields that never change
+        # and the signed auth-suffix prefix (only ts varies).
+        self._static_headers = {
+            'X-CC-APIKEY': api_key,
+            'X-REQ-TS-DIFF': str(self._X_REQ_TS_DIFF),
+            'Content-Type': 'application/json',
+        }
+        self._auth_suffix_head = f"uuid={api_key}&ts="
+        self.session = self._new_session()
         self._consecutive_failures = 0
+        # Epoch seconds until which Coincall asked us to back off (HTTP 429)
+        self.rate_limited_until: float = 0.0
+
+    @staticmethod
+    def _new_session() -> requests.Session:
+        """Session with a keep-alive pool of HTTP_POOL_SIZE connections.
+
+        Transport-level retries stay off: retries are handled by the
+        @retry decorator on _request_with_timeout, and a silent resend of
+        an order POST could place it twice.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
 
     @property
     def reachable(self) -> bool:
@@ -81,7 +149,28 @@ class CoincallAuth:
                 self.session.close()
             except Exception:
                 pass
-            self.session = requests.Session()
+            self.session = self._new_session()
+
+    @property
+    def rate_limited(self) -> bool:
+        """True while a 429 back-off window is in effect."""
+        return time.time() < self.rate_limited_until
+
+    def _note_rate_limit(self, response: requests.Response) -> float:
+        """Record a 429's Retry-After window; return its length in seconds."""
+        try:
+            delay = float(response.headers.get('Retry-After', self._RETRY_AFTER_DEFAULT))
+        except (TypeError, ValueError):
+            delay = self._RETRY_AFTER_DEFAULT  # HTTP-date form not worth parsing
+        delay = min(max(delay, 0.0), self._RETRY_AFTER_MAX)
+        self.rate_limited_until = max(self.rate_limited_until, time.time() + delay)
+        return delay
+
+    def _wait_for_rate_limit(self) -> None:
+        """Hold a request back until any 429 window has passed."""
+        delay = self.rate_limited_until - time.time()
+        if delay > 0:
+            time.sleep(min(delay, self._RETRY_AFTER_MAX))
 
     def _create_signature(
         self, 
@@ -112,29 +201,23 @@ class CoincallAuth:
                 prehash += '?' + '&'.join(f"{k}={v}" for k, v in param_list)
         
         # Append auth parameters
-        auth_suffix = f"uuid={self.api_key}&ts={ts}&x-req-ts-diff={x_req_ts_diff}"
+        auth_suffix = f"{self._auth_suffix_head}{ts}&x-req-ts-diff={x_req_ts_diff}"
         prehash += ('&' if '?' in prehash else '?') + auth_suffix
         
         # Sign the prehash
-        return hmac.new(
-            self.api_secret.encode('utf-8'),
-            prehash.encode('utf-8'),
-            hashlib.sha256
-        ).hexdigest().upper()
+        mac = self._hmac_template.copy()
+        mac.update(prehash.encode('utf-8'))
+        return mac.hexdigest().upper()
 
     def _get_headers(self, method: str, endpoint: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, str]:
         """Get authentication headers for API request."""
         ts = int(time.time() * 1000)
-        x_req_ts_diff = 5000
-        signature = self._create_signature(method, endpoint, ts, x_req_ts_diff, data)
-        
-        return {
-            'X-CC-APIKEY': self.api_key,
-            'sign': signature,
-            'ts': str(ts),
-            'X-REQ-TS-DIFF': str(x_req_ts_diff),
-            'Content-Type': 'application/json'
-        }
+        signature = self._create_signature(method, endpoint, ts, self._X_REQ_TS_DIFF, data)
+
+        headers = self._static_headers.copy()
+        headers['sign'] = signature
+        headers['ts'] = str(ts)
+        return headers
 
     @retry(
         max_attempts=3,
@@ -167,7 +250,8 @@ class CoincallAuth:
                 headers['Content-Type'] = 'application/x-www-form-urlencoded'
                 return self.session.post(url, data=data, headers=headers, timeout=timeout)
             else:
-                return self.session.post(url, json=data, headers=headers, timeout=timeout)
+                body = _encode_body(data) if data is not None else None
+                return self.session.post(url, data=body, headers=headers, timeout=timeout)
         else:
             raise ValueError(f"Unsupported HTTP method: {method}")
 
@@ -181,6 +265,10 @@ class CoincallAuth:
     ) -> Dict[str, Any]:
         """
         Make authenticated API request with timeout and automatic retries.
+
+        HTTP 429 responses are resent after the Retry-After window (capped
+        at _RETRY_AFTER_MAX), and later requests wait out that window too.
+        5xx responses to GETs are resent with jittered backoff.
         
         Args:
             method: HTTP method ('GET' or 'POST')
@@ -192,37 +280,64 @@ class CoincallAuth:
         Returns:
             Parsed JSON response dict, or error dict on failure
         """
-        headers = self._get_headers(method, endpoint, data)
         url = f'{self.base_url}{endpoint}'
-        
-        try:
-            response = self._request_with_timeout(
-                method=method,
-                url=url,
-                headers=headers,
-                data=data,
-                use_form_data=use_form_data,
-                timeout=timeout,
-            )
-            response.raise_for_status()
-            self._record_success()
-            return response.json()
-        except requests.HTTPError as e:
-            # Client errors (4xx) are valid responses — exchange is reachable
-            if e.response is not None and e.response.status_code < 500:
+
+        for attempt in range(self._HTTP_RETRIES + 1):
+            self._wait_for_rate_limit()
+            headers = self._get_headers(method, endpoint, data)
+            try:
+                response = self._request_with_timeout(
+                    method=method,
+                    url=url,
+                    headers=headers,
+                    data=data,
+                    use_form_data=use_form_data,
+                    timeout=timeout,
+                )
+                if attempt < self._HTTP_RETRIES:
+                    # 429: the request was refused, so resending is safe for
+                    # any method.  Other 4xx won't improve on retry; 5xx is
+                    # only retried for GET since a POST may have gone through.
+                    if response.status_code == 429:
+                        delay = self._note_rate_limit(response)
+                        logger.warning(
+                            f"Rate limited on {endpoint} — backing off {delay:.1f}s"
+                        )
+                        continue
+                    if response.status_code >= 500 and method.upper() == 'GET':
+                        delay = 0.5 * (2 ** attempt) * random.uniform(0.8, 1.2)
+                        logger.warning(
+                            f"HTTP {response.status_code} on {endpoint} — "
+                            f"retrying in {delay:.2f}s"
+                        )
+                        time.sleep(delay)
+                        continue
+                response.raise_for_status()
                 self._record_success()
-            else:
+                return _decode_body(response.content)
+            except requests.HTTPError as e:
+                # Client errors (4xx) are valid responses — exchange is reachable
+                if e.response is not None and e.response.status_code < 500:
+                    if e.response.status_code == 429:
+                        self._note_rate_limit(e.response)
+                    self._record_success()
+                else:
+                    self._record_failure()
+                logger.error(f"HTTP error {e.response.status_code}: {e}")
+                return {'code': e.response.status_code, 'msg': str(e), 'data': None}
+            except requests.Timeout as e:
+                self._record_failure()
+                logger.error(f"API request timeout after {timeout}s: {e}")
+                return {'code': 408, 'msg': 'Request timeout', 'data': None}
+            except requests.RequestException as e:
+                self._record_failure()
+                logger.error(f"API request failed (after retries): {e}")
+                return {'code': 500, 'msg': str(e), 'data': None}
+            except ValueError as e:
+                # Unparseable body (e.g. an HTML error page from a proxy)
                 self._record_failure()
-            logger.error(f"HTTP error {e.response.status_code}: {e}")
-            return {'code': e.response.status_code, 'msg': str(e), 'data': None}
-        except requests.Timeout as e:
-            self._record_failure()
-            logger.error(f"API request timeout after {timeout}s: {e}")
-            return {'code': 408, 'msg': 'Request timeout', 'data': None}
-        except requests.RequestException as e:
-            self._record_failure()
-            logger.error(f"API request failed (after retries): {e}")
-            return {'code': 500, 'msg': str(e), 'data': None}
+                logger.error(f"API returned invalid JSON: {e}")
+                return {'code': 500, 'msg': f'Invalid JSON: {e}', 'data': None}
 
     def get(self, endpoint: str) -> Dict[str, Any]:
         """Make GET request"""
@@ -202,7 +202,7 @@ def _create_app(
         for r in runners:
             strategy_data.append({
                 "name": r.config.name,
-                "enabled": r._enabled,
+                "enabled": r.enabled,
                 "active_trades": len(r.active_trades),
                 "max_trades": r.config.max_concurrent_trades,
                 "stats": r.stats,
@@ -349,7 +349,7 @@ def _create_app(
             st = r.stats
             strategy_data.append({
                 "name": r.config.name,
-                "enabled": r._enabled,
+                "enabled": r.enabled,
                 "active_trades": len(r.active_trades),
                 "max_trades": r.config.max_concurrent_trades,
                 "stats": {
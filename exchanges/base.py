@@ -8,8 +8,29 @@ only on these interfaces, never on concrete exchange implementations.
 See docs/MIGRATION_PLAN_DERIBIT.md § 5 for full design rationale.
 """
 
+import threading
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+# Upper bound on concurrent requests from get_option_orderbooks().
+_MAX_ORDERBOOK_FETCHES = 8
+
+# One worker pool shared by every get_option_orderbooks() call, created on
+# first use — fetches run every tick, so threads are reused, not respawned.
+_orderbook_pool: Optional[ThreadPoolExecutor] = None
+_orderbook_pool_lock = threading.Lock()
+
+
+def _get_orderbook_pool() -> ThreadPoolExecutor:
+    global _orderbook_pool
+    if _orderbook_pool is None:
+        with _orderbook_pool_lock:
+            if _orderbook_pool is None:
+                _orderbook_pool = ThreadPoolExecutor(
+                    max_workers=_MAX_ORDERBOOK_FETCHES, thread_name_prefix="orderbook",
+                )
+    return _orderbook_pool
 
 
 class ExchangeAuth(ABC):
@@ -60,6 +81,17 @@ class ExchangeMarketData(ABC):
         """Get orderbook for a specific option."""
         ...
 
+    def get_option_orderbooks(self, symbols: List[str]) -> Dict[str, Optional[dict]]:
+        """Get orderbooks for several options, fetched concurrently.
+
+        The requests are I/O-bound, so N books cost about one round-trip
+        instead of N.  Returns {symbol: get_option_orderbook(symbol)}.
+        """
+        if len(symbols) < 2:
+            return {s: self.get_option_orderbook(s) for s in symbols}
+        pool = _get_orderbook_pool()
+        return dict(zip(symbols, pool.map(self.get_option_orderbook, symbols)))
+
 
 class ExchangeExecutor(ABC):
     """Order lifecycle operations.  Side is always 'buy' or 'sell' (string)."""
@@ -88,6 +120,48 @@ class ExchangeExecutor(ABC):
         """Query current order status. Returns exchange-specific status dict."""
         ...
 
+    def place_orders(self, orders: List[dict]) -> List[Optional[dict]]:
+        """Place several orders; each dict holds place_order() keyword args.
+
+        Returns one place_order()-style result (or None) per input, in
+        order.  The default places them one at a time; adapters with a
+        batch endpoint override this to use a single request.
+        """
+        return [self.place_order(**o) for o in orders]
+
+    def cancel_orders(self, order_ids: List[str]) -> List[bool]:
+        """Cancel several orders.  Returns one success flag per input.
+
+        The default cancels one at a time; see place_orders().
+        """
+        return [self.cancel_order(oid) for oid in order_ids]
+
+    def list_open_orders(self) -> Optional[dict]:
+        """All open orders in one request, as {order_id: status dict}.
+
+        Status dicts have the get_order_status() shape.  The default
+        returns None ("not supported") and callers poll each order.
+        """
+        return None
+
+    def get_order_by_client_id(self, client_order_id: str, symbol: str) -> Optional[dict]:
+        """Look up an order by the client_order_id it was placed with.
+
+        Used when a placement response was lost, to learn whether the
+        order reached the exchange.  Returns a get_order_status()-shaped
+        dict, or None if not found or not supported (the default).
+        """
+        return None
+
+    def amend_order(self, order_id: str, qty: float, price: float) -> Optional[dict]:
+        """Change price/qty of a resting order in place (one round-trip).
+
+        Returns the same shape as place_order() on success.  The default
+        returns None — "not supported" — and callers fall back to
+        cancel_order() + place_order().
+        """
+        return None
+
 
 class ExchangeAccountManager(ABC):
     """Account and position queries."""
@@ -0,0 +1,111 @@
+"""
+Shared TTL cache for the market-data adapters.
+
+Lives outside market_data.py so adapters for other exchanges can use it
+without importing the Coincall client (config credentials, CoincallAuth).
+"""
+
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+
+# Seconds an option orderbook is reused by the market-data adapters.
+ORDERBOOK_TTL = 0.1
+
+
+# Simple cache with TTL
+class TTLCache:
+    """Simple dict-based cache with time-to-live and max size.
+
+    Thread-safe: entries are guarded by one lock, since the orderbook
+    cache is hit concurrently from the orderbook fetch pool.
+    """
+
+    def __init__(self, ttl_seconds: int = 30, max_size: int = 100):
+        """
+        Initialize cache.
+
+        Args:
+            ttl_seconds: Time-to-live for entries (default 30s)
+            max_size: Maximum number of entries (default 100)
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._cache: Dict[str, Tuple[Any, float]] = {}
+        self._lock = threading.Lock()
+        # key -> [lock, users]; an entry lives only while a fetch for the
+        # key is in progress or awaited
+        self._key_locks: Dict[str, list] = {}
+        self._key_locks_guard = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get cached value if it exists and hasn't expired."""
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            value, timestamp = entry
+            if time.time() - timestamp > self.ttl_seconds:
+                del self._cache[key]
+                return None
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Set cache entry, evicting oldest if at capacity."""
+        with self._lock:
+            if key not in self._cache and len(self._cache) >= self.max_size:
+                # Evict oldest entry
+                oldest_key = min(self._cache, key=lambda k: self._cache[k][1])
+                del self._cache[oldest_key]
+            self._cache[key] = (value, time.time())
+
+    def get_or_fetch(self, key: str, fetch) -> Optional[Any]:
+        """Return the cached value, or call fetch() once and cache it.
+
+        Concurrent misses on the same key are deduplicated: one thread
+        calls fetch() while the others wait on a per-key lock and then
+        read its result.  None results are not cached.  The per-key lock
+        is dropped once no thread is using it.
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        with self._key_locks_guard:
+            slot = self._key_locks.setdefault(key, [threading.Lock(), 0])
+            slot[1] += 1
+        try:
+            with slot[0]:
+                value = self.get(key)
+                if value is None:
+                    value = fetch()
+                    if value is not None:
+                        self.set(key, value)
+        finally:
+            with self._key_locks_guard:
+                slot[1] -= 1
+                if slot[1] == 0:
+                    del self._key_locks[key]
+        return value
+
+    def fresh_items(self):
+        """Yield (key, value) pairs for entries that have NOT expired.
+
+        Also evicts any expired entries encountered during iteration,
+        keeping the internal dict clean.
+        """
+        now = time.time()
+        fresh = []
+        with self._lock:
+            for key, (value, ts) in list(self._cache.items()):
+                if now - ts > self.ttl_seconds:
+                    del self._cache[key]
+                else:
+                    fresh.append((key, value))
+        yield from fresh
+
+    def clear(self) -> None:
+        """Clear all cache entries."""
+        with self._lock:
+            self._cache.clear()
@@ -45,8 +45,23 @@ class CoincallExecutorAdapter(ExchangeExecutor):
             reduce_only=reduce_only,
         )
 
+    def place_orders(self, orders):
+        return self._inner.place_orders_batch([
+            {**o, "qty": _snap_qty(o["qty"]), "side": _side_to_int(o["side"])}
+            for o in orders
+        ])
+
     def cancel_order(self, order_id):
         return self._inner.cancel_order(order_id)
 
+    # cancel_orders: inherited per-order default.  Coincall's batchCancel
+    # is unverified and does not report per order (see cancel_orders_batch).
+
     def get_order_status(self, order_id):
         return self._inner.get_order_status(order_id)
+
+    def list_open_orders(self):
+        return self._inner.list_open_orders()
+
+    def get_order_by_client_id(self, client_order_id, symbol):
+        return self._inner.get_order_by_client_id(client_order_id)
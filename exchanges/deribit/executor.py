@@ -139,6 +139,50 @@ class DeribitExecutorAdapter(ExchangeExecutor):
             "_trades": result.get("trades", []),
         }
 
+    def amend_order(self, order_id: str, qty: float, price: float) -> Optional[dict]:
+        """
+        Edit a resting order in place via private/edit.
+
+        The order keeps its order_id and its fills so far; ``qty`` is the
+        new total order amount.  Returns the place_order() dict shape, or
+        None if the edit was rejected (e.g. the order is already filled
+        or cancelled) — the caller then falls back to cancel + place.
+        """
+        params = {
+            "order_id": order_id,
+            "amount": _snap_qty(qty),
+            "price": _snap_to_tick(price),
+        }
+        resp = self._auth.call("private/edit", params)
+
+        if not self._auth.is_successful(resp):
+            error = resp.get("error", {})
+            logger.info(
+                f"Deribit edit rejected for {order_id}: "
+                f"{error.get('message', 'unknown')} (code={error.get('code')})"
+            )
+            return None
+
+        result = resp["result"]
+        order = result.get("order", {})
+        logger.info(
+            f"Deribit order amended: {order_id} "
+            f"{order.get('amount')} @ {order.get('price')} BTC "
+            f"state={order.get('order_state')}"
+        )
+        return {
+            "orderId": str(order.get("order_id", order_id)),
+            "clientOrderId": order.get("label", ""),
+            "state": order.get("order_state", ""),
+            "fillQty": float(order.get("filled_amount", 0)),
+            "avgPrice": float(order.get("average_price", 0)),
+            "symbol": order.get("instrument_name", ""),
+            "side": order.get("direction", ""),
+            "qty": float(order.get("amount", qty)),
+            "price": float(order.get("price", 0)),
+            "_trades": result.get("trades", []),
+        }
+
     def cancel_order(self, order_id: str) -> bool:
         """Cancel an order by Deribit order_id."""
         resp = self._auth.call("private/cancel", {"order_id": order_id})
@@ -179,3 +223,20 @@ class DeribitExecutorAdapter(ExchangeExecutor):
             "_order_type": o.get("order_type", ""),
             "_cancel_reason": o.get("cancel_reason", ""),
         }
+
+    def get_order_by_client_id(self, client_order_id: str, symbol: str) -> Optional[dict]:
+        """
+        Find an order by the label it was placed with (client_order_id).
+
+        private/get_order_state_by_label is scoped by currency, taken from
+        the instrument name prefix (e.g. "BTC-28MAR26-100000-C" → "BTC").
+        Returns the get_order_status() shape, or None if not found.
+        """
+        resp = self._auth.call("private/get_order_state_by_label", {
+            "currency": symbol.split("-", 1)[0],
+            "label": client_order_id[:64],
+        })
+        if not self._auth.is_successful(resp) or not resp.get("result"):
+            return None
+        order_id = resp["result"][0].get("order_id")
+        return self.get_order_status(order_id) if order_id else None
@@ -16,9 +16,14 @@ import time
 from typing import Any, Dict, List, Optional
 
 from exchanges.base import ExchangeMarketData
+from exchanges.cache import ORDERBOOK_TTL, TTLCache
 
 logger = logging.getLogger(__name__)
 
+# Price levels requested per side.  Every consumer prices off the best
+# bid/ask only, so deeper levels are bandwidth and parse time wasted.
+ORDERBOOK_DEPTH = 1
+
 
 class DeribitMarketDataAdapter(ExchangeMarketData):
     """Deribit market data with Coincall-compatible response shapes."""
@@ -27,6 +32,7 @@ class DeribitMarketDataAdapter(ExchangeMarketData):
         self._auth = auth
         self._index_cache = None
         self._index_cache_time = 0.0
+        self._orderbook_cache = TTLCache(ttl_seconds=ORDERBOOK_TTL, max_size=200)
 
     # ── ExchangeMarketData interface ─────────────────────────────────
 
@@ -139,10 +145,19 @@ class DeribitMarketDataAdapter(ExchangeMarketData):
         Returns bids/asks in BTC-native pricing (Deribit's native unit).
         Order placement and PnL calculations need native prices.
         The _index_price field allows callers to convert to USD if needed.
+
+        Served from a short TTL cache (exchanges.cache.ORDERBOOK_TTL); concurrent
+        requests for the same symbol share one fetch.
         """
+        return self._orderbook_cache.get_or_fetch(
+            symbol, lambda: self._fetch_option_orderbook(symbol)
+        )
+
+    def _fetch_option_orderbook(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """Fetch the orderbook via public/get_order_book (uncached)."""
         resp = self._auth.call("public/get_order_book", {
             "instrument_name": symbol,
-            "depth": 10,
+            "depth": ORDERBOOK_DEPTH,
         })
         if "result" not in resp:
             logger.debug(f"Deribit orderbook failed for {symbol}: {resp.get('error')}")
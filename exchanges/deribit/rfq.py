@@ -108,7 +108,8 @@ class DeribitRFQAdapter(ExchangeRFQExecutor):
         best_quote = None
 
         while time.time() < deadline:
-            time.sleep(poll_interval_seconds)
+            # Capped at the deadline so the last poll isn't pushed past it
+            time.sleep(max(0.0, min(poll_interval_seconds, deadline - time.time())))
             rfqs = self._get_rfqs()
             if not rfqs:
                 continue
@@ -207,7 +208,7 @@ class DeribitRFQAdapter(ExchangeRFQExecutor):
 
             resp = self._auth.call("public/get_order_book", {
                 "instrument_name": instr,
-                "depth": 5,
+                "depth": 1,  # only the best level is used
             })
             if not self._auth.is_successful(resp):
                 return None
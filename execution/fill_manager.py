@@ -16,7 +16,7 @@ from __future__ import annotations
 import logging
 import time
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, TYPE_CHECKING
 
 from execution.currency import Currency, OrderbookSnapshot, Price
 from execution.fees import extract_fee, sum_fees
@@ -57,6 +57,7 @@ def _bridge_params_to_profile(params: Any) -> ExecutionProfile:
             name="_bridged",
             open_phases=phases,
             close_phases=phases,
+            poll_interval_seconds=getattr(params, "poll_interval_seconds", 0.0),
         )
     # Legacy flat fields → single aggressive phase
     return ExecutionProfile(
@@ -73,6 +74,7 @@ def _bridge_params_to_profile(params: Any) -> ExecutionProfile:
             buffer_pct=params.aggressive_buffer_pct,
             reprice_interval=params.fill_timeout_seconds,
         )],
+        poll_interval_seconds=getattr(params, "poll_interval_seconds", 0.0),
     )
 
 
@@ -80,7 +82,24 @@ def _bridge_params_to_profile(params: Any) -> ExecutionProfile:
 # Internal leg state
 # ---------------------------------------------------------------------------
 
-@dataclass
+class _LegInput(NamedTuple):
+    """A caller's leg read once: TradeLeg-like objects and dicts alike."""
+    symbol: str
+    qty: float
+    side: str
+    orig: Any  # the caller's object, for writing order_id back
+
+
+def _normalize_legs(legs: List[Any]) -> List[_LegInput]:
+    """Read symbol/qty/side from each leg, deciding attr vs key access once per leg."""
+    return [
+        _LegInput(leg["symbol"], leg["qty"], leg["side"], leg) if isinstance(leg, dict)
+        else _LegInput(leg.symbol, leg.qty, leg.side, leg)
+        for leg in legs
+    ]
+
+
+@dataclass(slots=True)
 class _LegState:
     """Internal mutable tracking for one leg."""
     symbol: str
@@ -117,6 +136,9 @@ class FillManager:
     every tick until fills complete.
     """
 
+    # Seconds within which a ledger record counts as freshly polled.
+    STATUS_MAX_AGE = 1.0
+
     def __init__(
         self,
         order_manager: "OrderManager",
@@ -157,6 +179,8 @@ class FillManager:
         self._legs: List[_LegState] = []
         self._skipped_symbols: List[str] = []
         self._phase_index: int = 0
+        # Interval timestamps below are time.monotonic(); FillResult.timestamp
+        # and trade open/close times stay wall-clock (they are persisted).
         self._phase_started_at: float = 0.0
         self._last_reprice_at: float = 0.0
         self._started_at: float = 0.0
@@ -165,6 +189,8 @@ class FillManager:
         self._reduce_only: bool = False
         self._grace_exhausted: bool = False
         self._detected_currency: Optional[Currency] = None
+        # Orderbooks prefetched for the current placement/requote pass
+        self._books: Dict[str, Optional[dict]] = {}
 
     # -- Public API -----------------------------------------------------------
 
@@ -202,9 +228,13 @@ class FillManager:
         self._purpose = purpose
         self._reduce_only = reduce_only
         self._legs = []
+        if self._profile.poll_interval_seconds > 0:
+            self._order_manager.set_poll_interval(
+                lifecycle_id, self._profile.poll_interval_seconds,
+            )
         self._skipped_symbols = []
 
-        now = time.time()
+        now = time.monotonic()
         self._started_at = now
         self._phase_started_at = now
         self._last_reprice_at = now
@@ -224,12 +254,10 @@ class FillManager:
         })
 
         # Pre-validate prices for all legs
+        leg_inputs = _normalize_legs(legs)
+        self._prefetch_orderbooks([leg.symbol for leg in leg_inputs])
         leg_data: List[tuple] = []
-        for idx, leg in enumerate(legs):
-            symbol = leg.symbol if hasattr(leg, "symbol") else leg["symbol"]
-            qty = leg.qty if hasattr(leg, "qty") else leg["qty"]
-            side = leg.side if hasattr(leg, "side") else leg["side"]
-
+        for idx, (symbol, qty, side, leg) in enumerate(leg_inputs):
             price = self._compute_price(symbol, side, phase)
 
             if price is None or price.amount <= 0:
@@ -261,18 +289,21 @@ class FillManager:
             if isinstance(first_price, Price):
                 self._detected_currency = first_price.currency
 
-        # Place orders
-        for idx, leg, symbol, qty, side, price in leg_data:
-            record = self._order_manager.place_order(
-                lifecycle_id=lifecycle_id,
-                leg_index=idx,
-                purpose=purpose,
-                symbol=symbol,
-                side=side,
-                qty=qty,
-                price=price,
-                reduce_only=reduce_only,
-            )
+        # Place orders — one batch request where the exchange supports it
+        records = self._order_manager.place_orders([
+            {
+                "lifecycle_id": lifecycle_id,
+                "leg_index": idx,
+                "purpose": purpose,
+                "symbol": symbol,
+                "side": side,
+                "qty": qty,
+                "price": price,
+                "reduce_only": reduce_only,
+            }
+            for idx, _leg, symbol, qty, side, price in leg_data
+        ])
+        for (idx, leg, symbol, qty, side, price), record in zip(leg_data, records):
             if not record:
                 if self._best_effort:
                     logger.warning(
@@ -284,9 +315,9 @@ class FillManager:
                         skipped=True, skip_reason="placement_rejected",
                     ))
                     continue
-                # Atomic mode: cancel everything placed so far
+                # Atomic mode: cancel everything the batch placed
                 logger.error(f"FillManager: placement failed for {symbol} — cancelling all")
-                self._cancel_placed()
+                self._cancel_placed(records)
                 return self._make_result(
                     FillStatus.REFUSED, error=f"placement_failed:{symbol}"
                 )
@@ -339,13 +370,13 @@ class FillManager:
         # 1. Poll each unfilled leg
         self._poll_fills()
 
-        # 2. All filled?
-        placed = [l for l in self._legs if not l.skipped]
-        if all(l.is_filled for l in placed):
+        # 2. All filled?  The partition is reused by the requote below.
+        unfilled = self._unfilled_legs()
+        if not unfilled:
             return self._make_result(FillStatus.FILLED)
 
         # 3. Phase timeout / advancement
-        result_status = self._check_phases()
+        result_status = self._check_phases(unfilled)
 
         # 4. Grace tick on FAILED
         if result_status == FillStatus.FAILED:
@@ -356,9 +387,9 @@ class FillManager:
                     "(exchange fill reporting lag protection)"
                 )
                 return self._make_result(FillStatus.PENDING)
-            # Grace tick elapsed — final poll
-            self._poll_fills()
-            if all(l.is_filled for l in placed):
+            # Grace tick elapsed — final poll, straight from the exchange
+            self._poll_fills(max_age=0.0)
+            if all(l.is_filled for l in unfilled):
                 logger.info("FillManager: last-chance poll caught late fill(s)")
                 return self._make_result(FillStatus.FILLED)
 
@@ -376,8 +407,7 @@ class FillManager:
 
     @property
     def all_filled(self) -> bool:
-        placed = [l for l in self._legs if not l.skipped]
-        return all(l.is_filled for l in placed)
+        return all(l.is_filled for l in self._legs if not l.skipped)
 
     @property
     def has_skipped_legs(self) -> bool:
@@ -433,7 +463,7 @@ class FillManager:
             phase_index=self._phase_index + 1,
             phase_total=len(self._phases),
             phase_pricing=phase.pricing if phase else self._phases[-1].pricing,
-            elapsed_seconds=time.time() - self._started_at,
+            elapsed_seconds=time.monotonic() - self._started_at,
             error=error,
             total_fees=sum_fees(fees),
         )
@@ -454,13 +484,22 @@ class FillManager:
 
     # -- Internal: fill polling -----------------------------------------------
 
-    def _poll_fills(self) -> None:
-        """Poll OrderManager for fill updates on all legs."""
+    def _poll_fills(self, max_age: Optional[float] = None) -> None:
+        """Poll OrderManager for fill updates on all legs.
+
+        LifecycleEngine.tick() runs OrderManager.poll_all() just before
+        check(), so records it refreshed are read from the ledger instead
+        of being queried a second time (STATUS_MAX_AGE, or the profile's
+        poll_interval_seconds when that is longer).  Pass ``max_age=0``
+        to force a fresh exchange query for every leg.
+        """
+        if max_age is None:
+            max_age = max(self.STATUS_MAX_AGE, self._profile.poll_interval_seconds)
         for ls in self._legs:
             if ls.is_filled or not ls.order_id or ls.skipped:
                 continue
             try:
-                record = self._order_manager.poll_order(ls.order_id)
+                record = self._order_manager.poll_order(ls.order_id, max_age=max_age)
                 if record:
                     new_total = ls._fill_baseline + record.filled_qty
                     if new_total > ls.filled_qty:
@@ -486,9 +525,13 @@ class FillManager:
 
     # -- Internal: phase management -------------------------------------------
 
-    def _check_phases(self) -> FillStatus:
+    def _unfilled_legs(self) -> List[_LegState]:
+        """Placed (non-skipped) legs that are not yet fully filled."""
+        return [l for l in self._legs if not (l.skipped or l.is_filled)]
+
+    def _check_phases(self, unfilled: List[_LegState]) -> FillStatus:
         """Check phase timeout and advance or reprice as needed."""
-        now = time.time()
+        now = time.monotonic()
         phase = self._current_phase
 
         if phase is None:
@@ -527,7 +570,7 @@ class FillManager:
                 })
             self._phase_started_at = now
             self._last_reprice_at = now
-            self._requote_unfilled(is_phase_transition=True)
+            self._requote_unfilled(unfilled, is_phase_transition=True)
             return FillStatus.REQUOTED
 
         # Within-phase reprice
@@ -537,20 +580,22 @@ class FillManager:
                 f"({phase.pricing}) after {reprice_elapsed:.0f}s"
             )
             self._last_reprice_at = now
-            self._requote_unfilled()
+            self._requote_unfilled(unfilled)
             return FillStatus.REQUOTED
 
         return FillStatus.PENDING
 
-    def _requote_unfilled(self, is_phase_transition: bool = False) -> None:
-        """Cancel stale orders and re-place at fresh prices."""
+    def _requote_unfilled(self, unfilled: List[_LegState],
+                          is_phase_transition: bool = False) -> None:
+        """Cancel stale orders for the given unfilled legs and re-place at fresh prices."""
         phase = self._current_phase
         if phase is None:
             return
 
-        for ls in self._legs:
-            if ls.is_filled or not ls.order_id or ls.skipped:
-                continue
+        working = [ls for ls in unfilled if ls.order_id]
+        self._prefetch_orderbooks([ls.symbol for ls in working])
+        stale: List[Tuple[_LegState, Any]] = []  # (leg, new price)
+        for ls in working:
 
             price = self._compute_price(ls.symbol, ls.side, phase)
             if price is None:
@@ -586,50 +631,81 @@ class FillManager:
                         )
                         continue
 
-            try:
-                new_record = self._order_manager.requote_order(
-                    ls.order_id, new_price=price, new_qty=ls.remaining_qty,
+            stale.append((ls, price))
+
+        if not stale:
+            return
+
+        # All cancels go out in one batch, then all replacements in another
+        try:
+            new_records = self._order_manager.requote_orders([
+                (ls.order_id, price, ls.remaining_qty) for ls, price in stale
+            ])
+        except Exception as e:
+            logger.error(
+                f"FillManager: requote exception for "
+                f"{', '.join(ls.symbol for ls, _ in stale)}: {e}"
+            )
+            return
+
+        for (ls, price), new_record in zip(stale, new_records):
+            if new_record:
+                ls._fill_baseline = ls.filled_qty
+                ls.order_id = new_record.order_id
+                ls.requote_count += 1
+                if new_record.filled_qty > 0:
+                    ls.filled_qty += new_record.filled_qty
+                    ls.fill_price = new_record.avg_fill_price or ls.fill_price
+                if new_record.fee:
+                    ls.fee = new_record.fee if ls.fee is None else ls.fee + new_record.fee
+                logger.info(
+                    f"FillManager: requoted {ls.side} "
+                    f"{ls.remaining_qty}x {ls.symbol} @ {price} "
+                    f"(round {ls.requote_count})"
                 )
-                if new_record:
-                    ls._fill_baseline = ls.filled_qty
-                    ls.order_id = new_record.order_id
-                    ls.requote_count += 1
-                    if new_record.filled_qty > 0:
-                        ls.filled_qty += new_record.filled_qty
-                        ls.fill_price = new_record.avg_fill_price or ls.fill_price
-                    if new_record.fee:
-                        ls.fee = new_record.fee if ls.fee is None else ls.fee + new_record.fee
-                    logger.info(
-                        f"FillManager: requoted {ls.side} "
-                        f"{ls.remaining_qty}x {ls.symbol} @ {price} "
-                        f"(round {ls.requote_count})"
-                    )
+            else:
+                old_record = self._order_manager._orders.get(ls.order_id)
+                if old_record and old_record.status.value == "filled":
+                    logger.info(f"FillManager: {ls.symbol} filled during requote")
                 else:
-                    old_record = self._order_manager._orders.get(ls.order_id)
-                    if old_record and old_record.status.value == "filled":
-                        logger.info(f"FillManager: {ls.symbol} filled during requote")
-                    else:
-                        logger.warning(f"FillManager: {ls.symbol} requote failed")
-            except Exception as e:
-                logger.error(f"FillManager: requote exception for {ls.symbol}: {e}")
+                    logger.warning(f"FillManager: {ls.symbol} requote failed")
 
-    def _cancel_placed(self) -> None:
-        """Cancel all placed orders (used on atomic-mode failure)."""
-        for ls in self._legs:
-            if ls.order_id and not ls.is_filled:
+    def _cancel_placed(self, records: List[Any]) -> None:
+        """Cancel the batch's placed orders (used on atomic-mode failure)."""
+        for record in records:
+            if record and not record.is_terminal:
                 try:
-                    self._order_manager.cancel_order(ls.order_id)
+                    self._order_manager.cancel_order(record.order_id)
                 except Exception:
                     pass
 
     # -- Internal: pricing ----------------------------------------------------
 
+    def _prefetch_orderbooks(self, symbols: List[str]) -> None:
+        """Fetch the books for a multi-leg pass concurrently.
+
+        Used by the next _compute_price() call per symbol; single-leg
+        passes and market data without get_option_orderbooks() fetch
+        lazily as before.
+        """
+        self._books = {}
+        unique = list(dict.fromkeys(symbols))
+        fetch_many = getattr(self._market_data, "get_option_orderbooks", None)
+        if fetch_many is None or len(unique) < 2:
+            return
+        try:
+            books = fetch_many(unique)
+            if isinstance(books, dict):
+                self._books = books
+        except Exception as e:
+            logger.warning(f"FillManager: orderbook prefetch failed: {e}")
+
     def _compute_price(
         self, symbol: str, side: str, phase: PhaseConfig
     ) -> Optional[Price]:
         """Compute order price using PricingEngine. Returns Price with currency."""
         try:
-            ob = self._market_data.get_option_orderbook(symbol)
+            ob = self._books.pop(symbol, None) or self._market_data.get_option_orderbook(symbol)
             if not ob:
                 return None
 
@@ -7,6 +7,7 @@ Loaded from TOML, overridable per-slot.
 
 from __future__ import annotations
 
+import functools
 import os
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
@@ -57,6 +58,9 @@ class ExecutionProfile:
     # Intended for strategies that tolerate asymmetric positions, e.g. a strangle
     # where one leg filled 10 contracts and the other filled 9 or 0.
     open_best_effort_exhaustion: bool = False
+    # Minimum seconds between fill-status polls of this trade's orders;
+    # 0 = every tick.  Raise it for slow trades to spare the rate limit.
+    poll_interval_seconds: float = 0.0
 
     def apply_overrides(self, overrides: Dict[str, Any]) -> "ExecutionProfile":
         """Return a copy with field-level overrides applied.
@@ -103,20 +107,29 @@ def _collect_numbered_phases(
     return [PhaseConfig(**p) for _, p in phases]
 
 
+@functools.lru_cache(maxsize=4)
+def _read_toml(toml_path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a TOML file.  Cached per (path, mtime, size) — edits reload."""
+    with open(toml_path, "rb") as f:
+        return tomllib.load(f)
+
+
 def load_profiles(
     toml_path: Optional[str] = None,
 ) -> Dict[str, ExecutionProfile]:
     """Load all execution profiles from a TOML file.
 
     Default path: ``execution_profiles.toml`` in the project root.
+    The parsed TOML is cached until the file changes; each call still
+    returns freshly built ExecutionProfile objects.
     """
     if toml_path is None:
         toml_path = os.path.join(
             os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
             "execution_profiles.toml",
         )
-    with open(toml_path, "rb") as f:
-        data = tomllib.load(f)
+    st = os.stat(toml_path)
+    data = _read_toml(toml_path, st.st_mtime_ns, st.st_size)
 
     profiles: Dict[str, ExecutionProfile] = {}
     for name, section in data.get("profile", {}).items():
@@ -136,6 +149,7 @@ def load_profiles(
             close_best_effort=section.get("close_best_effort", True),
             rfq_mode=section.get("rfq_mode", "never"),
             open_best_effort_exhaustion=section.get("open_best_effort_exhaustion", False),
+            poll_interval_seconds=section.get("poll_interval_seconds", 0.0),
         )
     return profiles
 
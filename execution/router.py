@@ -92,53 +92,84 @@ class Router:
     def _determine_execution_mode(self, trade: "TradeLifecycle") -> str:
         if len(trade.open_legs) == 1:
             return "limit"
-        notional = self._calculate_notional(trade.open_legs)
+        # A caller-supplied estimate (create(metadata={"estimated_notional": x}))
+        # settles routing without any orderbook fetches.
+        notional = None
+        estimate = trade.metadata.get("estimated_notional")
+        if estimate is not None:
+            try:
+                notional = float(estimate)
+            except (TypeError, ValueError):
+                logger.warning(
+                    f"Trade {trade.id}: ignoring invalid estimated_notional {estimate!r}"
+                )
+        if notional is None:
+            notional = self._calculate_notional(trade.open_legs)
         if notional >= self.rfq_notional_threshold:
             return "rfq"
         return "limit"
 
     def _calculate_notional(self, legs: list) -> float:
+        # One lookup per distinct symbol; back-to-back opens are served by
+        # the market-data adapter's ORDERBOOK_TTL cache.
+        symbols = list(dict.fromkeys(leg.symbol for leg in legs))
+        books = self._fetch_orderbooks(symbols)
+        marks = {s: self._mark_price(s, books) for s in symbols}
         total = 0.0
         for leg in legs:
-            try:
-                ob = self._market_data.get_option_orderbook(leg.symbol)
-                if ob:
-                    mark = float(ob.get("mark", 0))
-                    if mark > 0:
-                        total += mark * leg.qty
-            except Exception as e:
-                logger.warning(f"Error calculating notional for {leg.symbol}: {e}")
+            mark = marks[leg.symbol]
+            if mark > 0:
+                total += mark * leg.qty
         return total
 
+    def _fetch_orderbooks(self, symbols: List[str]) -> dict:
+        """Fetch several books concurrently via get_option_orderbooks().
+
+        Returns {} for a single symbol, market data without the batch
+        method, or a failed batch — _mark_price() then fetches lazily.
+        """
+        fetch_many = getattr(self._market_data, "get_option_orderbooks", None)
+        if fetch_many is None or len(symbols) < 2:
+            return {}
+        try:
+            books = fetch_many(symbols)
+            return books if isinstance(books, dict) else {}
+        except Exception as e:
+            logger.warning(f"Orderbook batch for notional failed: {e}")
+            return {}
+
+    def _mark_price(self, symbol: str, books: dict) -> float:
+        """Mark price from the (prefetched) orderbook, or 0.0 if unavailable."""
+        try:
+            if symbol in books:
+                ob = books[symbol]
+            else:
+                ob = self._market_data.get_option_orderbook(symbol)
+            return float(ob.get("mark", 0)) if ob else 0.0
+        except Exception as e:
+            logger.warning(f"Error calculating notional for {symbol}: {e}")
+            return 0.0
+
     # ── Open implementations ─────────────────────────────────────────────
 
     def _open_rfq(self, trade: "TradeLifecycle") -> FillResult:
         """Open via RFQ — atomic multi-leg execution."""
-        from rfq import OptionLeg, RFQResult
-        from trade_lifecycle import TradeState
+        from rfq import RFQResult
+        from trade_lifecycle import RFQParams, TradeState
 
-        rfq_legs = [
-            OptionLeg(
-                instrument=leg.symbol,
-                side=leg.side.upper(),
-                qty=leg.qty,
-            )
-            for leg in trade.open_legs
-        ]
+        rfq_legs = self._rfq_legs(trade)
 
-        rp = trade.rfq_params
-        rfq_timeout = rp.timeout_seconds if rp else trade.metadata.get("rfq_timeout_seconds", 60)
-        min_improvement = rp.min_improvement_pct if rp else trade.metadata.get("rfq_min_improvement_pct", -999.0)
+        # Legacy rfq_* metadata keys were folded into rfq_params by create()
+        rp = trade.rfq_params or RFQParams()
 
         if trade.metadata.get("rfq_phased"):
-            phased_timeout = trade.metadata.get("rfq_timeout_seconds", rfq_timeout)
             min_improve = trade.metadata.get("rfq_min_book_improvement_pct", 2.2)
             if callable(min_improve):
                 min_improve = min_improve(trade)
             result: RFQResult = self._rfq_executor.execute_phased(
                 legs=rfq_legs,
                 action=trade.rfq_action,
-                timeout_seconds=phased_timeout,
+                timeout_seconds=rp.timeout_seconds,
                 initial_wait_seconds=trade.metadata.get("rfq_initial_wait_seconds", 30),
                 min_book_improvement_pct=min_improve,
                 relax_after_seconds=trade.metadata.get("rfq_relax_after_seconds", 300),
@@ -147,8 +178,8 @@ class Router:
             result: RFQResult = self._rfq_executor.execute(
                 legs=rfq_legs,
                 action=trade.rfq_action,
-                timeout_seconds=rfq_timeout,
-                min_improvement_pct=min_improvement,
+                timeout_seconds=rp.timeout_seconds,
+                min_improvement_pct=rp.min_improvement_pct,
             )
         trade.rfq_result = result
 
@@ -183,7 +214,7 @@ class Router:
             )
 
         # RFQ failed — try fallback
-        fallback = rp.fallback_mode if rp else trade.metadata.get("rfq_fallback")
+        fallback = rp.fallback_mode
         if fallback:
             logger.warning(f"Trade {trade.id} RFQ failed: {result.message} — fallback to '{fallback}'")
             trade.execution_mode = fallback
@@ -243,29 +274,19 @@ class Router:
 
     def _close_rfq(self, trade: "TradeLifecycle") -> FillResult:
         """Close via RFQ."""
-        from rfq import OptionLeg, RFQResult
-        from trade_lifecycle import TradeState
+        from rfq import RFQResult
+        from trade_lifecycle import RFQParams, TradeState
 
-        rfq_legs = [
-            OptionLeg(
-                instrument=leg.symbol,
-                side=leg.side.upper(),
-                qty=leg.filled_qty,
-            )
-            for leg in trade.open_legs
-            if leg.filled_qty > 0
-        ]
+        rfq_legs = self._rfq_legs(trade, filled=True)
         close_action = "sell" if trade.rfq_action == "buy" else "buy"
 
-        rp = trade.rfq_params
-        rfq_timeout = rp.timeout_seconds if rp else 60
-        min_improvement = rp.min_improvement_pct if rp else -999.0
+        rp = trade.rfq_params or RFQParams()
 
         result: RFQResult = self._rfq_executor.execute(
             legs=rfq_legs,
             action=close_action,
-            timeout_seconds=rfq_timeout,
-            min_improvement_pct=min_improvement,
+            timeout_seconds=rp.timeout_seconds,
+            min_improvement_pct=rp.min_improvement_pct,
         )
         trade.close_rfq_result = result
 
@@ -294,7 +315,7 @@ class Router:
             )
 
         # RFQ close failed — fallback
-        fallback = rp.fallback_mode if rp else trade.metadata.get("rfq_fallback")
+        fallback = rp.fallback_mode
         if fallback:
             trade.execution_mode = fallback
             return self._close_limit(trade)
@@ -314,22 +335,19 @@ class Router:
 
         # Rebuild close legs — prevents double-ordering on retry.
         # Only include legs that were actually filled on open (filled_qty > 0).
-        old_close_filled = {}
-        if trade.close_legs:
-            for cl in trade.close_legs:
-                if cl.filled_qty > 0:
-                    old_close_filled[cl.symbol] = cl.filled_qty
-
-        trade.close_legs = [
-            TradeLeg(
-                symbol=leg.symbol,
-                qty=leg.filled_qty - old_close_filled.get(leg.symbol, 0.0),
-                side=leg.close_side,
-            )
-            for leg in trade.open_legs
-            if leg.filled_qty > 0
-               and leg.filled_qty - old_close_filled.get(leg.symbol, 0.0) > 0
-        ]
+        old_close_filled = {
+            cl.symbol: cl.filled_qty for cl in trade.close_legs or () if cl.filled_qty > 0
+        }
+        close_legs = []
+        for leg in trade.open_legs:
+            if leg.filled_qty <= 0:
+                continue
+            remaining = leg.filled_qty - old_close_filled.get(leg.symbol, 0.0)
+            if remaining > 0:
+                close_legs.append(
+                    TradeLeg(symbol=leg.symbol, qty=remaining, side=leg.close_side)
+                )
+        trade.close_legs = close_legs
 
         if not trade.close_legs:
             trade.state = TradeState.CLOSED
@@ -407,18 +425,50 @@ class Router:
 
     # ── Helpers ──────────────────────────────────────────────────────────
 
+    def _rfq_legs(self, trade: "TradeLifecycle", filled: bool = False) -> tuple:
+        """Return the RFQ legs tuple for a trade's open legs.
+
+        The open-side template is built once and kept in
+        ``trade.metadata["_rfq_legs"]``.  With ``filled=True`` (close path)
+        legs are sized to ``filled_qty`` and unfilled legs are dropped;
+        template legs whose size already matches are reused as-is.
+        """
+        from dataclasses import replace
+        from rfq import OptionLeg
+
+        template = trade.metadata.get("_rfq_legs")
+        if template is None or len(template) != len(trade.open_legs):
+            template = tuple(
+                OptionLeg(instrument=leg.symbol, side=leg.side, qty=leg.qty)
+                for leg in trade.open_legs
+            )
+            trade.metadata["_rfq_legs"] = template
+        if not filled:
+            return template
+        return tuple(
+            ol if ol.qty == leg.filled_qty else replace(ol, qty=leg.filled_qty)
+            for ol, leg in zip(template, trade.open_legs)
+            if leg.filled_qty > 0
+        )
+
     def _resolve_profile(self, trade: "TradeLifecycle") -> Optional[ExecutionProfile]:
         """Get ExecutionProfile from trade metadata or None (let FillManager bridge)."""
         return trade.metadata.get("_execution_profile")
 
     def cancel_placed_orders(self, legs: list) -> None:
-        """Cancel any orders already placed for the given legs."""
-        for leg in legs:
-            if hasattr(leg, "order_id") and leg.order_id:
-                if hasattr(leg, "is_filled") and leg.is_filled:
-                    continue
-                try:
-                    self._order_manager.cancel_order(leg.order_id)
-                    logger.info(f"Cancelled orphaned order {leg.order_id} for {leg.symbol}")
-                except Exception as e:
-                    logger.warning(f"Failed to cancel {leg.order_id}: {e}")
+        """Cancel any orders already placed for the given legs.
+
+        Sent as one OrderManager.cancel_orders() batch, so the executor's
+        batch cancel is used when it has one.
+        """
+        order_ids = [
+            leg.order_id for leg in legs
+            if getattr(leg, "order_id", None) and not getattr(leg, "is_filled", False)
+        ]
+        if not order_ids:
+            return
+        try:
+            cancelled = self._order_manager.cancel_orders(order_ids)
+            logger.info(f"Cancelled {cancelled}/{len(order_ids)} orphaned orders: {order_ids}")
+        except Exception as e:
+            logger.warning(f"Failed to cancel orphaned orders {order_ids}: {e}")
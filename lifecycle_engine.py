@@ -33,12 +33,20 @@ Typical wiring in main.py:
 import json
 import logging
 import os
+import queue
+import threading
 import time
-from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from datetime import date, datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from exchanges.deribit.symbols import option_expiry_utc
 
+# orjson is optional — a much faster encoder for the per-tick trade snapshot.
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
 from account_manager import AccountSnapshot
 from order_manager import OrderManager, OrderPurpose
 from execution.currency import Currency, Price
@@ -56,6 +64,30 @@ from trade_lifecycle import (
 logger = logging.getLogger(__name__)
 _strategy_logger = logging.getLogger("ct.strategy")  # structured JSONL → logs/strategy.jsonl
 
+_TERMINAL = frozenset((TradeState.CLOSED, TradeState.FAILED))
+_CLOSEABLE = frozenset((TradeState.OPEN, TradeState.PENDING_CLOSE))
+
+
+def _dumps_compact(obj: Any) -> bytes:
+    """Serialize obj to compact UTF-8 JSON (orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _fsync_dir(path: str) -> None:
+    """fsync a directory so a rename inside it is durable (POSIX only)."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass  # e.g. Windows: directories can't be fsynced
+    finally:
+        os.close(fd)
+
 
 def _to_price(fill_price, currency: Optional[Currency]) -> Any:
     """Convert a raw fill_price to Price if currency is known."""
@@ -66,6 +98,18 @@ def _to_price(fill_price, currency: Optional[Currency]) -> Any:
     return fill_price
 
 
+def _sync_fills(legs: List[TradeLeg], mgr: FillManager) -> None:
+    """Copy fill state from a FillManager back onto trade legs, by symbol."""
+    fill_by_symbol = {ls.symbol: ls for ls in mgr.legs}
+    currency = mgr.detected_currency
+    for leg in legs:
+        ls = fill_by_symbol.get(leg.symbol)
+        if ls:
+            leg.filled_qty = ls.filled_qty
+            leg.fill_price = _to_price(ls.fill_price, currency)
+            leg.order_id = ls.order_id
+
+
 class LifecycleEngine:
     """
     Orchestrates one or more TradeLifecycles through their state machines.
@@ -96,6 +140,12 @@ class LifecycleEngine:
         expected_denomination: "Optional[Currency]" = None,
     ):
         self._trades: Dict[str, TradeLifecycle] = {}
+        # Secondary indices maintained by _register()
+        self._by_strategy: Dict[Optional[str], List[TradeLifecycle]] = {}
+        # Ids of trades not yet CLOSED/FAILED, in registration order (dict as
+        # ordered set).  Terminal trades are pruned by active_trades.
+        self._active_ids: Dict[str, None] = {}
+        self._daily_counts: Dict[Optional[str], Tuple[date, int]] = {}
         self._executor = executor
         self._rfq_executor = rfq_executor
         self._market_data = market_data
@@ -106,10 +156,25 @@ class LifecycleEngine:
         )
         self._account_manager = account_manager
         self._tick_counter: int = 0
+        # Wall-clock time captured once per tick(); None outside a tick
+        self._tick_now: Optional[float] = None
         self._last_reconciliation_warnings: List[str] = []
         self._last_reconciliation_time: Optional[float] = None
         self._notifier = None  # lazy-loaded TelegramNotifier
 
+        # Snapshot persistence — serialized on tick, written by a daemon thread
+        self._persist_queue: queue.Queue = queue.Queue(maxsize=1)
+        self._persist_lock = threading.Lock()
+        self._persist_thread: Optional[threading.Thread] = None
+        self._persist_seq: int = 0
+        self._persist_written_seq: int = 0
+        # Serialized form of CLOSED/FAILED trades (they no longer change;
+        # None until first serialized), and the chunks of the last snapshot
+        # handed to the writer.  Together with _active_ids this partitions
+        # every registered trade.
+        self._finished_chunks: Dict[str, Optional[bytes]] = {}
+        self._last_chunks: Optional[List[bytes]] = None
+
         self._router = Router(
             executor=self._executor,
             rfq_executor=self._rfq_executor,
@@ -120,6 +185,15 @@ class LifecycleEngine:
 
         self.rfq_notional_threshold = rfq_notional_threshold
 
+        # Per-state tick handlers; states without an entry wait for an
+        # external action (PENDING_OPEN) or are terminal.
+        self._tick_dispatch: Dict[TradeState, Callable[[TradeLifecycle, AccountSnapshot], None]] = {
+            TradeState.OPENING: lambda trade, _account: self._check_open_fills(trade),
+            TradeState.OPEN: self._tick_open,
+            TradeState.PENDING_CLOSE: self._tick_pending_close,
+            TradeState.CLOSING: lambda trade, _account: self._check_close_fills(trade),
+        }
+
     @property
     def order_manager(self) -> OrderManager:
         """Access the order ledger (for external queries, crash recovery, etc.)."""
@@ -127,11 +201,22 @@ class LifecycleEngine:
 
     @property
     def active_trades(self) -> List[TradeLifecycle]:
-        """All trades that are not CLOSED or FAILED."""
-        return [
-            t for t in self._trades.values()
-            if t.state not in (TradeState.CLOSED, TradeState.FAILED)
-        ]
+        """All trades that are not CLOSED or FAILED.
+
+        Walks only the active-id index, so the cost tracks the number of
+        live trades rather than every trade of the session.
+        """
+        active = []
+        finished = []
+        for trade_id in tuple(self._active_ids):
+            t = self._trades[trade_id]
+            if t.state in _TERMINAL:
+                finished.append(trade_id)
+            else:
+                active.append(t)
+        for trade_id in finished:
+            self._retire(trade_id)
+        return active
 
     @property
     def all_trades(self) -> List[TradeLifecycle]:
@@ -142,16 +227,72 @@ class LifecycleEngine:
 
     def get_trades_for_strategy(self, strategy_id: str) -> List[TradeLifecycle]:
         """All trades (any state) belonging to a strategy."""
-        return [t for t in self._trades.values() if t.strategy_id == strategy_id]
+        return list(self._by_strategy.get(strategy_id, ()))
 
     def active_trades_for_strategy(self, strategy_id: str) -> List[TradeLifecycle]:
         """Active (not CLOSED/FAILED) trades belonging to a strategy."""
-        return [t for t in self.active_trades if t.strategy_id == strategy_id]
+        bucket = self._by_strategy.get(strategy_id, ())
+        if len(self._active_ids) < len(bucket):
+            # Long sessions pile closed trades into the strategy bucket;
+            # the (lazily pruned) active index is then the shorter walk.
+            # Copied first: callers on other threads (dashboard) race the
+            # tick thread's pruning.
+            candidates = (self._trades[i] for i in tuple(self._active_ids))
+            return [
+                t for t in candidates
+                if t.strategy_id == strategy_id
+                and t.state not in _TERMINAL
+            ]
+        return [
+            t for t in bucket
+            if t.state not in _TERMINAL
+        ]
+
+    def count_trades_created_on(self, strategy_id: str, day: date) -> int:
+        """Number of a strategy's trades created on the given UTC date.
+
+        Backed by a per-strategy counter that resets when the first trade
+        of a new UTC day is registered, so the max_trades_per_day gate is
+        a dict lookup rather than a scan over every trade.
+        """
+        entry = self._daily_counts.get(strategy_id)
+        if entry is None or entry[0] != day:
+            return 0
+        return entry[1]
+
+    def _retire(self, trade_id: str) -> None:
+        """Move a CLOSED/FAILED trade from the active index to the finished set."""
+        self._active_ids.pop(trade_id, None)
+        self._finished_chunks.setdefault(trade_id, None)
+
+    def _register(self, trade: TradeLifecycle) -> None:
+        """Add a trade to the registry and its secondary indices."""
+        previous = self._trades.get(trade.id)
+        if previous is not None:
+            bucket = self._by_strategy.get(previous.strategy_id, [])
+            bucket[:] = [t for t in bucket if t.id != trade.id]
+        self._trades[trade.id] = trade
+        self._by_strategy.setdefault(trade.strategy_id, []).append(trade)
+        self._finished_chunks.pop(trade.id, None)
+        if trade.state not in _TERMINAL:
+            self._active_ids[trade.id] = None
+        else:
+            self._active_ids.pop(trade.id, None)
+            self._finished_chunks[trade.id] = None
+        if previous is not None:
+            return
+
+        day = datetime.fromtimestamp(trade.created_at, tz=timezone.utc).date()
+        entry = self._daily_counts.get(trade.strategy_id)
+        if entry is None or day > entry[0]:
+            self._daily_counts[trade.strategy_id] = (day, 1)
+        elif day == entry[0]:
+            self._daily_counts[trade.strategy_id] = (day, entry[1] + 1)
 
     def restore_trade(self, trade: TradeLifecycle) -> None:
         """Inject a recovered trade into the engine's trade registry."""
         trade._market_data = self._market_data
-        self._trades[trade.id] = trade
+        self._register(trade)
         logger.info(
             f"Restored trade {trade.id} (strategy={trade.strategy_id}, "
             f"state={trade.state.value}, legs={len(trade.open_legs)})"
@@ -171,6 +312,52 @@ class LifecycleEngine:
         metadata: Optional[Dict[str, Any]] = None,
     ) -> TradeLifecycle:
         """Register a new trade intent. Returns TradeLifecycle in PENDING_OPEN."""
+        trade = self._new_trade(
+            legs, exit_conditions, execution_mode, rfq_action,
+            execution_params, rfq_params, strategy_id, metadata,
+        )
+        self._register(trade)
+        logger.info(
+            f"Trade {trade.id} created: {len(legs)} legs, "
+            f"mode={execution_mode or 'auto-route'}, strategy={strategy_id}"
+        )
+        return trade
+
+    def create_many(self, specs: List[Dict[str, Any]]) -> List[TradeLifecycle]:
+        """Register several trade intents at once.
+
+        Each spec is a dict of create() keyword arguments (``legs`` is
+        required).  All trades are built before any is registered, so a
+        bad spec leaves the engine untouched.  Logs one summary line.
+
+        Returns:
+            The new TradeLifecycle objects (PENDING_OPEN), in spec order.
+        """
+        trades = [self._new_trade(**spec) for spec in specs]
+        for trade in trades:
+            self._register(trade)
+        if trades:
+            logger.info(
+                "Created %d trades: %s",
+                len(trades), ", ".join(f"{t.id}({t.strategy_id})" for t in trades),
+            )
+        return trades
+
+    def _new_trade(
+        self,
+        legs: List[TradeLeg],
+        exit_conditions: Optional[List[ExitCondition]] = None,
+        execution_mode: Optional[str] = None,
+        rfq_action: str = "buy",
+        execution_params: Optional[Any] = None,
+        rfq_params: Optional[RFQParams] = None,
+        strategy_id: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> TradeLifecycle:
+        """Build an unregistered PENDING_OPEN trade wired to this engine."""
+        if rfq_params is None and metadata:
+            # Legacy rfq_* metadata keys are promoted once, here
+            rfq_params = RFQParams.from_metadata(metadata)
         trade = TradeLifecycle(
             open_legs=legs,
             strategy_id=strategy_id,
@@ -182,11 +369,6 @@ class LifecycleEngine:
             metadata=metadata or {},
         )
         trade._market_data = self._market_data
-        self._trades[trade.id] = trade
-        logger.info(
-            f"Trade {trade.id} created: {len(legs)} legs, "
-            f"mode={execution_mode or 'auto-route'}, strategy={strategy_id}"
-        )
         return trade
 
     # ── Open / Close ─────────────────────────────────────────────────────
@@ -217,7 +399,7 @@ class LifecycleEngine:
         if not trade:
             logger.error(f"Trade {trade_id} not found")
             return False
-        if trade.state not in (TradeState.OPEN, TradeState.PENDING_CLOSE):
+        if trade.state not in _CLOSEABLE:
             logger.error(f"Trade {trade_id} not closeable (is {trade.state.value})")
             return False
         result = self._router.close(trade)
@@ -241,18 +423,13 @@ class LifecycleEngine:
             return
 
         result = mgr.check()
+        if result.status is FillStatus.PENDING:
+            return  # the common case on most ticks
 
         if result.status == FillStatus.FILLED:
             # Sync fills from FillManager legs → trade open legs
-            fill_by_symbol = {ls.symbol: ls for ls in mgr.legs}
-            _currency = mgr.detected_currency
-            trade.currency = _currency
-            for leg in trade.open_legs:
-                ls = fill_by_symbol.get(leg.symbol)
-                if ls:
-                    leg.filled_qty = ls.filled_qty
-                    leg.fill_price = _to_price(ls.fill_price, _currency)
-                    leg.order_id = ls.order_id
+            trade.currency = mgr.detected_currency
+            _sync_fills(trade.open_legs, mgr)
             # Capture open fees
             if result.total_fees:
                 trade.open_fees = result.total_fees
@@ -326,7 +503,7 @@ class LifecycleEngine:
                 return
 
             trade.state = TradeState.OPEN
-            trade.opened_at = time.time()
+            trade.opened_at = self._now()
             trade.metadata.pop("_open_skip_retry_count", None)
             logger.info(f"Trade {trade.id}: all open legs filled → OPEN")
             _strategy_logger.info({
@@ -343,14 +520,7 @@ class LifecycleEngine:
 
         elif result.status == FillStatus.FAILED:
             logger.error(f"Trade {trade.id}: fill manager exhausted phases")
-            fill_by_symbol = {ls.symbol: ls for ls in mgr.legs}
-            _currency = mgr.detected_currency
-            for leg in trade.open_legs:
-                ls = fill_by_symbol.get(leg.symbol)
-                if ls:
-                    leg.filled_qty = ls.filled_qty
-                    leg.fill_price = _to_price(ls.fill_price, _currency)
-                    leg.order_id = ls.order_id
+            _sync_fills(trade.open_legs, mgr)
             mgr.cancel_all()
             filled_legs = [leg for leg in trade.open_legs if leg.filled_qty > 0]
 
@@ -365,11 +535,11 @@ class LifecycleEngine:
             accept_partial = profile.open_best_effort_exhaustion if profile else False
 
             if filled_legs and accept_partial:
-                trade.currency = _currency
+                trade.currency = mgr.detected_currency
                 if result.total_fees:
                     trade.open_fees = result.total_fees
                 trade.state = TradeState.OPEN
-                trade.opened_at = time.time()
+                trade.opened_at = self._now()
                 logger.warning(
                     f"Trade {trade.id}: open phases exhausted — accepting partial fills "
                     f"({len(filled_legs)}/{len(trade.open_legs)} legs filled) → OPEN"
@@ -406,15 +576,8 @@ class LifecycleEngine:
                 })
 
         elif result.status == FillStatus.REQUOTED:
-            fill_by_symbol = {ls.symbol: ls for ls in mgr.legs}
-            _currency = mgr.detected_currency
-            for leg in trade.open_legs:
-                ls = fill_by_symbol.get(leg.symbol)
-                if ls:
-                    leg.order_id = ls.order_id
-                    leg.filled_qty = ls.filled_qty
-                    leg.fill_price = _to_price(ls.fill_price, _currency)
-            logger.debug(f"Trade {trade.id}: requoted unfilled open legs, continuing")
+            _sync_fills(trade.open_legs, mgr)
+            logger.debug("Trade %s: requoted unfilled open legs, continuing", trade.id)
 
     def _check_close_fills(self, trade: TradeLifecycle) -> None:
         """Delegate close-fill checking to FillManager."""
@@ -424,20 +587,11 @@ class LifecycleEngine:
             return
 
         result = mgr.check()
-
-        def _sync_fills(close_legs, fill_states):
-            """Sync fill state back to close leg objects, matched by symbol."""
-            fill_by_symbol = {ls.symbol: ls for ls in fill_states}
-            _currency = mgr.detected_currency
-            for leg in close_legs:
-                ls = fill_by_symbol.get(leg.symbol)
-                if ls:
-                    leg.filled_qty = ls.filled_qty
-                    leg.fill_price = _to_price(ls.fill_price, _currency)
-                    leg.order_id = ls.order_id
+        if result.status is FillStatus.PENDING:
+            return  # the common case on most ticks
 
         if result.status == FillStatus.FILLED:
-            _sync_fills(trade.close_legs, mgr.legs)
+            _sync_fills(trade.close_legs, mgr)
             if mgr.has_skipped_legs:
                 logger.warning(
                     f"Trade {trade.id}: placed legs filled but "
@@ -447,7 +601,7 @@ class LifecycleEngine:
                 trade.state = TradeState.PENDING_CLOSE
             else:
                 trade.state = TradeState.CLOSED
-                trade.closed_at = time.time()
+                trade.closed_at = self._now()
                 # Capture close fees
                 if result.total_fees:
                     trade.close_fees = result.total_fees
@@ -472,19 +626,19 @@ class LifecycleEngine:
 
         elif result.status == FillStatus.FAILED:
             logger.error(f"Trade {trade.id}: close fill manager exhausted phases")
-            _sync_fills(trade.close_legs, mgr.legs)
+            _sync_fills(trade.close_legs, mgr)
             mgr.cancel_all()
             trade.state = TradeState.PENDING_CLOSE
 
         elif result.status == FillStatus.REQUOTED:
-            _sync_fills(trade.close_legs, mgr.legs)
-            logger.debug(f"Trade {trade.id}: requoted unfilled close legs, continuing")
+            _sync_fills(trade.close_legs, mgr)
+            logger.debug("Trade %s: requoted unfilled close legs, continuing", trade.id)
 
     def _unwind_filled_legs(self, trade: TradeLifecycle, filled_legs: List[TradeLeg]) -> None:
         """Unwind partially-filled legs by transitioning through close cycle."""
         trade.open_legs = filled_legs
         trade.state = TradeState.OPEN
-        trade.opened_at = time.time()
+        trade.opened_at = self._now()
         trade.state = TradeState.PENDING_CLOSE
         logger.info(
             f"Trade {trade.id}: unwinding {len(filled_legs)} filled legs "
@@ -493,9 +647,16 @@ class LifecycleEngine:
 
     # ── Exit evaluation ──────────────────────────────────────────────────
 
-    def _is_trade_expired(self, trade: TradeLifecycle) -> bool:
+    def _now(self) -> float:
+        """Wall-clock time of the current tick, or time.time() outside one."""
+        return self._tick_now if self._tick_now is not None else time.time()
+
+    def _is_trade_expired(
+        self, trade: TradeLifecycle, now: Optional[datetime] = None,
+    ) -> bool:
         """True if any open leg's option has passed its 08:00 UTC expiry."""
-        now = datetime.now(timezone.utc)
+        if now is None:
+            now = datetime.now(timezone.utc)
         return any(
             (exp := option_expiry_utc(leg.symbol)) is not None and now >= exp
             for leg in trade.open_legs
@@ -525,7 +686,7 @@ class LifecycleEngine:
             if leg.filled_qty > 0
         ]
         trade.state = TradeState.CLOSED
-        trade.closed_at = time.time()
+        trade.closed_at = self._now()
         trade.metadata["expiry_settled"] = True
         trade._finalize_close()
 
@@ -573,45 +734,36 @@ class LifecycleEngine:
         Designed to be called as a PositionMonitor callback:
             position_monitor.on_update(engine.tick)
         """
+        now = time.time()
+        self._tick_now = now
+        try:
+            self._tick(account, datetime.fromtimestamp(now, tz=timezone.utc))
+        finally:
+            self._tick_now = None
+
+    def _tick(self, account: AccountSnapshot, now_utc: datetime) -> None:
         # Step 1: Poll all non-terminal orders from the exchange.
         try:
             self._order_manager.poll_all()
         except Exception as e:
             logger.error(f"OrderManager poll_all error: {e}")
 
-        for trade in self.active_trades:
+        # Walk the active-id index directly (pruning as active_trades does)
+        # rather than building the active_trades list every tick.
+        trades = self._trades
+        for trade_id in tuple(self._active_ids):
+            trade = trades[trade_id]
+            if trade.state in _TERMINAL:
+                self._retire(trade_id)
+                continue
             try:
-                if trade.state == TradeState.OPENING:
-                    self._check_open_fills(trade)
-
-                elif self._is_trade_expired(trade):
+                if trade.state != TradeState.OPENING and self._is_trade_expired(trade, now_utc):
                     # Option settled at expiry — close at zero, do not retry orders
                     self._settle_expired_trade(trade)
-
-                elif trade.state == TradeState.OPEN:
-                    pnl = trade.structure_pnl(account)
-                    hold = trade.hold_seconds or 0
-                    logger.debug(
-                        f"Trade {trade.id}: OPEN hold={hold:.0f}s PnL={pnl:+.4f} "
-                        f"— checking exit conditions"
-                    )
-                    self._evaluate_exits(trade, account)
-                    if trade.state == TradeState.PENDING_CLOSE:
-                        self.close(trade.id)
-
-                elif trade.state == TradeState.PENDING_CLOSE:
-                    # GUARD: If close orders are already live on the exchange
-                    # (from a previous tick), do NOT place new ones.
-                    if self._order_manager.has_live_orders(trade.id, OrderPurpose.CLOSE_LEG):
-                        logger.debug(
-                            f"Trade {trade.id}: PENDING_CLOSE — live close orders exist, "
-                            f"waiting for resolution"
-                        )
-                    else:
-                        self.close(trade.id)
-
-                elif trade.state == TradeState.CLOSING:
-                    self._check_close_fills(trade)
+                    continue
+                handler = self._tick_dispatch.get(trade.state)
+                if handler is not None:
+                    handler(trade, account)
 
             except Exception as e:
                 logger.error(f"Trade {trade.id}: tick error in state {trade.state.value}: {e}")
@@ -630,6 +782,30 @@ class LifecycleEngine:
             except Exception as e:
                 logger.error(f"OrderManager persist_snapshot error: {e}")
 
+    def _tick_open(self, trade: TradeLifecycle, account: AccountSnapshot) -> None:
+        """OPEN: evaluate exit conditions and start the close if one fires."""
+        # PnL/hold are computed for this line only — skip unless shown
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Trade %s: OPEN hold=%.0fs PnL=%+.4f — checking exit conditions",
+                trade.id, trade.hold_seconds or 0, trade.structure_pnl(account),
+            )
+        self._evaluate_exits(trade, account)
+        if trade.state == TradeState.PENDING_CLOSE:
+            self.close(trade.id)
+
+    def _tick_pending_close(self, trade: TradeLifecycle, account: AccountSnapshot) -> None:
+        """PENDING_CLOSE: place close orders unless some are already live."""
+        # GUARD: If close orders are already live on the exchange
+        # (from a previous tick), do NOT place new ones.
+        if self._order_manager.has_live_orders(trade.id, OrderPurpose.CLOSE_LEG):
+            logger.debug(
+                "Trade %s: PENDING_CLOSE — live close orders exist, "
+                "waiting for resolution", trade.id,
+            )
+        else:
+            self.close(trade.id)
+
     # ── Manual controls ──────────────────────────────────────────────────
 
     def force_close(self, trade_id: str) -> bool:
@@ -655,14 +831,7 @@ class LifecycleEngine:
         if state == TradeState.CLOSING:
             mgr: Optional[FillManager] = trade.metadata.get("_close_fill_mgr")
             if mgr is not None:
-                fill_by_symbol = {ls.symbol: ls for ls in mgr.legs}
-                _currency = mgr.detected_currency
-                for leg in trade.close_legs:
-                    ls = fill_by_symbol.get(leg.symbol)
-                    if ls:
-                        leg.order_id = ls.order_id
-                        leg.filled_qty = ls.filled_qty
-                        leg.fill_price = _to_price(ls.fill_price, _currency)
+                _sync_fills(trade.close_legs, mgr)
                 mgr.cancel_all()
             else:
                 self._router.cancel_placed_orders(trade.close_legs)
@@ -677,15 +846,24 @@ class LifecycleEngine:
         """Emergency termination — cancel all orders and mark every trade CLOSED."""
         killed = 0
         for trade in list(self._trades.values()):
-            if trade.state in (TradeState.CLOSED, TradeState.FAILED):
+            if trade.state in _TERMINAL:
                 continue
 
-            for leg in trade.open_legs + trade.close_legs:
-                if leg.order_id and not leg.is_filled:
-                    try:
-                        self._executor.cancel_order(leg.order_id)
-                    except Exception:
-                        pass
+            legs = trade.open_legs + trade.close_legs
+            try:
+                cancelled = self._cancel_leg_orders(legs)
+            except Exception as e:
+                logger.error(f"Trade {trade.id}: kill switch cancel error: {e}")
+                cancelled = []
+            leftover = [
+                leg.order_id for leg in legs
+                if leg.order_id and not leg.is_filled and leg.order_id not in cancelled
+            ]
+            if leftover:
+                logger.error(
+                    f"Trade {trade.id}: kill switch direct cancel failed for {leftover} "
+                    f"— check the exchange"
+                )
 
             for key in ("_open_fill_mgr", "_close_fill_mgr"):
                 mgr = trade.metadata.get(key)
@@ -697,16 +875,51 @@ class LifecycleEngine:
 
             prev_state = trade.state.value
             trade.state = TradeState.CLOSED
-            trade.closed_at = time.time()
+            trade.closed_at = self._now()
             trade.error = "Terminated by kill switch"
             killed += 1
             logger.info(f"Trade {trade.id}: killed (was {prev_state})")
 
         if killed:
-            self._persist_all_trades()
+            self._persist_all_trades(wait=True)
 
         return killed
 
+    def _cancel_leg_orders(self, legs: List[TradeLeg]) -> List[str]:
+        """Cancel the unfilled orders of *legs* directly on the executor.
+
+        One executor.cancel_orders() batch when the executor offers it;
+        ids the batch did not confirm (or all of them, without a batch
+        method) are retried one by one with cancel_order().  Each failure
+        is logged.  Returns only the order ids actually cancelled.
+        """
+        order_ids = [leg.order_id for leg in legs if leg.order_id and not leg.is_filled]
+        if not order_ids:
+            return order_ids
+        cancelled: List[str] = []
+        pending = order_ids
+        batch = getattr(self._executor, "cancel_orders", None)
+        if batch is not None:
+            try:
+                results = list(batch(order_ids))
+            except Exception as e:
+                logger.warning(f"Batch cancel failed for {order_ids}: {e}")
+                results = []
+            results += [False] * (len(order_ids) - len(results))
+            cancelled = [oid for oid, ok in zip(order_ids, results) if ok]
+            pending = [oid for oid, ok in zip(order_ids, results) if not ok]
+        for order_id in pending:
+            try:
+                ok = self._executor.cancel_order(order_id)
+            except Exception as e:
+                logger.warning(f"Cancel failed for {order_id}: {e}")
+                continue
+            if ok:
+                cancelled.append(order_id)
+            else:
+                logger.warning(f"Cancel failed for {order_id}")
+        return cancelled
+
     def cancel(self, trade_id: str) -> bool:
         """Cancel a trade that hasn't fully opened yet."""
         trade = self._trades.get(trade_id)
@@ -718,24 +931,16 @@ class LifecycleEngine:
 
         mgr: Optional[FillManager] = trade.metadata.get("_open_fill_mgr")
         if mgr is not None:
-            fill_by_symbol = {ls.symbol: ls for ls in mgr.legs}
-            _currency = mgr.detected_currency
-            for leg in trade.open_legs:
-                ls = fill_by_symbol.get(leg.symbol)
-                if ls:
-                    leg.order_id = ls.order_id
-                    leg.filled_qty = ls.filled_qty
-                    leg.fill_price = _to_price(ls.fill_price, _currency)
+            _sync_fills(trade.open_legs, mgr)
             mgr.cancel_all()
             logger.info(f"Trade {trade.id}: cancelled unfilled orders via fill manager")
         else:
-            for leg in trade.open_legs:
-                if leg.order_id and not leg.is_filled:
-                    try:
-                        self._executor.cancel_order(leg.order_id)
-                        logger.info(f"Trade {trade.id}: cancelled open order {leg.order_id} for {leg.symbol}")
-                    except Exception as e:
-                        logger.warning(f"Trade {trade.id}: cancel failed for {leg.order_id}: {e}")
+            try:
+                order_ids = self._cancel_leg_orders(trade.open_legs)
+                if order_ids:
+                    logger.info(f"Trade {trade.id}: cancelled open orders {order_ids}")
+            except Exception as e:
+                logger.warning(f"Trade {trade.id}: cancel failed for open orders: {e}")
 
         filled_legs = [l for l in trade.open_legs if l.is_filled]
         if filled_legs:
@@ -833,24 +1038,136 @@ class LifecycleEngine:
 
     # ── Persistence ──────────────────────────────────────────────────────
 
-    def _persist_all_trades(self) -> None:
+    def _persist_all_trades(self, wait: bool = False) -> None:
         """Dump all trade states to JSON for crash recovery.
 
-        Uses write-to-temp → fsync → atomic rename to prevent corruption
-        if the process or OS crashes mid-write.
+        Trades are serialized on the calling thread (so the snapshot is
+        consistent with the state machine), then handed to a background
+        writer thread so the tick loop never blocks on disk I/O.  Only the
+        newest pending snapshot is kept — an unwritten older one is simply
+        superseded.
+
+        Only the active-id index is walked and serialized; finished
+        (CLOSED/FAILED) trades are serialized once and reused, so the cost
+        tracks the active trades rather than the session's history.  A
+        snapshot identical to the previous one is not queued again — quiet
+        ticks touch no disk.
+
+        Args:
+            wait: Write synchronously on the calling thread instead of
+                queueing.  Used on shutdown and kill switch, where the
+                file must be on disk before we return.
         """
+        try:
+            active_chunks = []
+            for trade_id in tuple(self._active_ids):
+                trade = self._trades[trade_id]
+                chunk = _dumps_compact(trade.to_dict())
+                if trade.state in _TERMINAL:
+                    self._retire(trade_id)
+                    self._finished_chunks[trade_id] = chunk
+                else:
+                    active_chunks.append(chunk)
+            finished = self._finished_chunks
+            for trade_id, chunk in finished.items():
+                if chunk is None:
+                    finished[trade_id] = _dumps_compact(self._trades[trade_id].to_dict())
+            chunks = list(finished.values()) + active_chunks
+        except Exception as e:
+            logger.warning(f"Failed to serialize trade snapshot: {e}")
+            return
+
+        if not wait and chunks == self._last_chunks:
+            return
+        self._last_chunks = chunks
+
+        with self._persist_lock:
+            self._persist_seq += 1
+            payload = (self._persist_seq, time.time(), chunks)
+
+        if wait:
+            self._write_snapshot(payload)
+            return
+
+        self._ensure_persist_thread()
+        try:
+            self._persist_queue.put_nowait(payload)
+        except queue.Full:
+            try:
+                self._persist_queue.get_nowait()  # drop the stale snapshot
+            except queue.Empty:
+                pass
+            try:
+                self._persist_queue.put_nowait(payload)
+            except queue.Full:
+                pass  # writer raced us with an even newer one
+
+    def _ensure_persist_thread(self) -> None:
+        """Start the snapshot writer thread on first use."""
+        if self._persist_thread is not None and self._persist_thread.is_alive():
+            return
+        self._persist_thread = threading.Thread(
+            target=self._persist_worker,
+            name="TradeSnapshotWriter",
+            daemon=True,
+        )
+        self._persist_thread.start()
+
+    def _persist_worker(self) -> None:
+        """Background loop: write each queued snapshot to disk."""
+        while True:
+            payload = self._persist_queue.get()
+            self._write_snapshot(payload)
+
+    def _write_snapshot(self, payload) -> None:
+        """Stream one serialized snapshot to logs/trades_snapshot.json.
+
+        Uses write-to-temp → fsync → atomic rename → directory fsync, so
+        a crash mid-write leaves the previous snapshot intact and a
+        completed rename survives power loss.  Snapshots older than the
+        last one written are discarded.
+        """
+        seq, timestamp, chunks = payload
+        with self._persist_lock:
+            if seq <= self._persist_written_seq:
+                return
+        target = os.path.join("logs", "trades_snapshot.json")
+        # Per-process, per-thread temp name: neither a second instance nor a
+        # synchronous flush racing the writer thread can clobber ours
+        tmp = os.path.join(
+            "logs", f".trades_snapshot.json.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
         try:
             os.makedirs("logs", exist_ok=True)
-            trades_data = [trade.to_dict() for trade in self._trades.values()]
-            target = "logs/trades_snapshot.json"
-            tmp = target + ".tmp"
-            with open(tmp, "w") as f:
-                json.dump({"timestamp": time.time(), "trades": trades_data}, f, indent=2)
+            with open(tmp, "wb") as f:
+                f.write(b'{"timestamp":' + _dumps_compact(timestamp) + b',"trades":[')
+                for i, chunk in enumerate(chunks):
+                    if i:
+                        f.write(b",")
+                    f.write(chunk)
+                f.write(b"]}")
                 f.flush()
                 os.fsync(f.fileno())
-            os.replace(tmp, target)
+            # The lock only covers the rename, so the tick thread never
+            # waits on file I/O; a newer snapshot that landed meanwhile wins
+            with self._persist_lock:
+                stale = seq <= self._persist_written_seq
+                if not stale:
+                    os.replace(tmp, target)
+                    self._persist_written_seq = seq
         except Exception as e:
             logger.warning(f"Failed to persist trade snapshot: {e}")
+            # Let the next tick queue the same content again instead of
+            # deduplicating against a snapshot that never reached disk
+            self._last_chunks = None
+            stale = True
+        if stale:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            return
+        _fsync_dir("logs")
 
     def status_report(self, account: Optional[AccountSnapshot] = None) -> str:
         """Human-readable status of all trades."""
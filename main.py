@@ -381,11 +381,11 @@ def _recover_trades(ctx, runners):
         ctx.lifecycle_manager.restore_trade(trade)
         recovered_active += 1
 
-    # Pre-populate _known_closed_ids and _known_open_ids so runners don't re-fire callbacks
+    # Pre-mark recovered trades as known so runners don't re-fire callbacks
     for r in runners:
         for trade in r.all_trades:
             if trade.state in (TradeState.CLOSED, TradeState.FAILED):
-                r._known_closed_ids.add(trade.id)
+                r._record_closed(trade)
             if trade.state == TradeState.OPEN:
                 r._known_open_ids.add(trade.id)
 
@@ -489,7 +489,7 @@ def main():
         logger.info("Shutting down...")
         try:
             # Persist current state before anything else — critical for crash recovery
-            ctx.lifecycle_manager._persist_all_trades()
+            ctx.lifecycle_manager._persist_all_trades(wait=True)
             order_manager = ctx.lifecycle_manager.order_manager
             order_manager.persist_snapshot()
 
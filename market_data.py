@@ -7,77 +7,20 @@ the active exchange adapter (Coincall or Deribit).  The adapter is
 selected automatically from config.EXCHANGE at first use.
 
 Also contains the Coincall-specific MarketData class (used by the
-CoincallMarketDataAdapter) and TTLCache utility.
+CoincallMarketDataAdapter).  TTLCache lives in exchanges/cache.py.
 """
 
 import logging
 import requests
 import time
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any
 from config import BASE_URL, API_KEY, API_SECRET
 from auth import CoincallAuth
+from exchanges.cache import ORDERBOOK_TTL, TTLCache  # re-exported for existing imports
 
 logger = logging.getLogger(__name__)
 
 
-# Simple cache with TTL
-class TTLCache:
-    """Simple dict-based cache with time-to-live and max size."""
-
-    def __init__(self, ttl_seconds: int = 30, max_size: int = 100):
-        """
-        Initialize cache.
-
-        Args:
-            ttl_seconds: Time-to-live for entries (default 30s)
-            max_size: Maximum number of entries (default 100)
-        """
-        self.ttl_seconds = ttl_seconds
-        self.max_size = max_size
-        self._cache: Dict[str, Tuple[Any, float]] = {}
-
-    def get(self, key: str) -> Optional[Any]:
-        """Get cached value if it exists and hasn't expired."""
-        if key not in self._cache:
-            return None
-
-        value, timestamp = self._cache[key]
-        if time.time() - timestamp > self.ttl_seconds:
-            del self._cache[key]
-            return None
-
-        return value
-
-    def set(self, key: str, value: Any) -> None:
-        """Set cache entry, evicting oldest if at capacity."""
-        if len(self._cache) >= self.max_size:
-            # Evict oldest entry
-            oldest_key = min(self._cache.keys(), key=lambda k: self._cache[k][1])
-            del self._cache[oldest_key]
-
-        self._cache[key] = (value, time.time())
-
-    def fresh_items(self):
-        """Yield (key, value) pairs for entries that have NOT expired.
-
-        Also evicts any expired entries encountered during iteration,
-        keeping the internal dict clean.
-        """
-        now = time.time()
-        expired = []
-        for key, (value, ts) in list(self._cache.items()):
-            if now - ts > self.ttl_seconds:
-                expired.append(key)
-            else:
-                yield key, value
-        for key in expired:
-            del self._cache[key]
-
-    def clear(self) -> None:
-        """Clear all cache entries."""
-        self._cache.clear()
-
-
 class MarketData:
     """Handles market data retrieval with TTL caching for API resilience"""
 
@@ -90,6 +33,9 @@ class MarketData:
         self._index_cache_time = None
         self._instruments_cache = TTLCache(ttl_seconds=30, max_size=10)
         self._details_cache = TTLCache(ttl_seconds=30, max_size=200)
+        # Short-lived: shares one fetch between legs/managers pricing the
+        # same symbol in the same tick without serving stale books.
+        self._orderbook_cache = TTLCache(ttl_seconds=ORDERBOOK_TTL, max_size=200)
 
     def get_btc_futures_price(self, use_cache: bool = True) -> float:
         """
@@ -385,20 +331,36 @@ class MarketData:
 
     def get_option_orderbook(self, symbol: str) -> Optional[Dict[str, Any]]:
         """
-        Get option orderbook depth (100-level)
+        Get the option orderbook's top of book
+
+        The endpoint returns 100 levels, but only the best bid and ask
+        are kept.  Served from a ORDERBOOK_TTL cache; concurrent requests
+        for the same symbol share one fetch.
 
         Args:
             symbol: Option symbol
 
         Returns:
-            Dict with orderbook data (bids, asks) or None if failed
+            Dict with orderbook data (bids, asks; one level each) or None if failed
         """
+        return self._orderbook_cache.get_or_fetch(
+            symbol, lambda: self._fetch_option_orderbook(symbol)
+        )
+
+    def _fetch_option_orderbook(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """Fetch the orderbook from the API (uncached)."""
         try:
             # Correct endpoint per Coincall API docs
             response = self.auth.get(f'/open/option/order/orderbook/v1/{symbol}')
             
             if self.auth.is_successful(response):
                 depth = response.get('data', {})
+                # The endpoint has no depth parameter; keep only the best
+                # level (all consumers read [0]) so cached books stay small.
+                for book_side in ('bids', 'asks'):
+                    levels = depth.get(book_side)
+                    if levels:
+                        depth[book_side] = levels[:1]
                 # Enrich with mark price from option details if orderbook
                 # doesn't include it (Coincall orderbook endpoint omits mark)
                 if not depth.get('mark'):
@@ -25,8 +25,10 @@ Also exports:
 import time
 import logging
 from dataclasses import dataclass
-from datetime import datetime, timezone
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
@@ -149,10 +151,95 @@ def select_option(expiry_criteria, strike_criteria, option_type='C', underlying=
         return None
 
 
+# Single-entry cache: (instrument list, its length, index).  Market data
+# adapters return the same cached list object between refreshes, so
+# consecutive resolve_legs() calls reuse one index.  Holding the list
+# reference keeps its id() from being recycled while cached.
+_expiry_index_cache: Optional[Tuple[list, int, "_ExpiryIndex"]] = None
+
+
+class _ExpiryIndex:
+    """Structured-array view of an instrument list for vectorized expiry lookups.
+
+    Rows are (expiry, opt_type) per instrument, in list order; per option
+    type we also keep the sorted unique expiries for searchsorted().
+    """
+
+    __slots__ = ("options_list", "arr", "expiries_by_type")
+
+    _DTYPE = [('expiry', 'f8'), ('opt_type', 'U1')]
+
+    def __init__(self, options_list: list):
+        self.options_list = options_list
+        self.arr = np.array(
+            [
+                (opt.get('expirationTimestamp', 0), _option_type_char(opt.get('symbolName', '')))
+                for opt in options_list
+            ],
+            dtype=self._DTYPE,
+        )
+        self.expiries_by_type = {
+            t: np.unique(self.arr['expiry'][self.arr['opt_type'] == t]) for t in ('C', 'P')
+        }
+
+    def _expiries(self, option_type: str) -> np.ndarray:
+        exps = self.expiries_by_type.get(option_type)
+        return exps if exps is not None else np.empty(0, dtype='f8')
+
+    def expiries_between(self, lo: float, hi: float, option_type: str) -> np.ndarray:
+        """Expiries in [lo, hi] (ascending) that list at least one option_type."""
+        exps = self._expiries(option_type)
+        i = np.searchsorted(exps, lo, side='left')
+        j = np.searchsorted(exps, hi, side='right')
+        return exps[i:j]
+
+    def first_expiry_after(self, after: float, option_type: str) -> Optional[float]:
+        """Nearest expiry strictly later than *after* listing option_type."""
+        exps = self._expiries(option_type)
+        i = np.searchsorted(exps, after, side='right')
+        return float(exps[i]) if i < len(exps) else None
+
+    def options(self, expiry_ts: float, option_type: str) -> list:
+        mask = (self.arr['expiry'] == expiry_ts) & (self.arr['opt_type'] == option_type)
+        return [self.options_list[i] for i in np.flatnonzero(mask)]
+
+
+def _expiry_token(name: str) -> str:
+    """Expiry token of a BTCUSD-{EXPIRY}-{STRIKE}-{C|P} symbol ('' if malformed).
+
+    Locates the first two dashes with str.find() and slices once, rather
+    than split('-') allocating every field.
+    """
+    start = name.find('-') + 1
+    if not start:
+        return ''
+    end = name.find('-', start)
+    return name[start:end] if end != -1 else ''
+
+
+def _option_type_char(name: str) -> str:
+    """'C' / 'P' suffix of a BTCUSD-{EXPIRY}-{STRIKE}-{C|P} symbol, else ''."""
+    return name[-1] if len(name) >= 2 and name[-2] == '-' else ''
+
+
+def _expiry_index(options_list: list) -> _ExpiryIndex:
+    """Return the (cached) expiry index for an instrument list."""
+    global _expiry_index_cache
+    cached = _expiry_index_cache
+    if cached is not None and cached[0] is options_list and cached[1] == len(options_list):
+        return cached[2]
+    index = _ExpiryIndex(options_list)
+    _expiry_index_cache = (options_list, len(options_list), index)
+    return index
+
+
 def _filter_by_expiry(options_list, expiry_criteria, option_type):
     """
     Filter options by expiry criteria.
 
+    Expiry-based modes (dte / minExp+maxExp) searchsorted() a per-type array
+    of unique expiries and pick rows with a vectorized boolean mask.
+
     Args:
         options_list (list): List of option instruments
         expiry_criteria (dict): Expiry criteria
@@ -169,28 +256,20 @@ def _filter_by_expiry(options_list, expiry_criteria, option_type):
     if isinstance(expiry_criteria, dict) and 'dte' in expiry_criteria:
         dte = expiry_criteria['dte']
         now_ms = time.time() * 1000
-        today_start_ms = _utc_day_start_ms()
+        today_start_ms = _utc_day_start_ms(now_ms)
+        index = _expiry_index(options_list)
 
         if dte == "next":
             # "next" — pick the nearest available expiry that hasn't expired yet
-            valid_options = [
-                opt for opt in options_list
-                if opt.get('expirationTimestamp', 0) > now_ms
-                and opt['symbolName'].endswith('-' + option_type)
-            ]
-            if not valid_options:
+            nearest_ts = index.first_expiry_after(now_ms, option_type)
+            if nearest_ts is None:
                 logger.error(f"No unexpired options for type {option_type}")
                 return []
 
-            # Find the soonest expiry timestamp
-            nearest_ts = min(opt['expirationTimestamp'] for opt in valid_options)
-            expiry_options = [
-                opt for opt in valid_options
-                if opt['expirationTimestamp'] == nearest_ts
-            ]
+            expiry_options = index.options(nearest_ts, option_type)
             days_away = (nearest_ts - now_ms) / 86400_000
             logger.info(
-                f"DTE='next': selected expiry {expiry_options[0]['symbolName'].split('-')[1]} "
+                f"DTE='next': selected expiry {_expiry_token(expiry_options[0]['symbolName'])} "
                 f"({days_away:.1f} days away, {len(expiry_options)} strikes)"
             )
             return expiry_options
@@ -203,12 +282,8 @@ def _filter_by_expiry(options_list, expiry_criteria, option_type):
         # max is end-of-day for dte_max
         max_expiry_ms = today_start_ms + (dte_max + 1) * 86400_000 - 1
 
-        valid_options = [
-            opt for opt in options_list
-            if min_expiry_ms <= opt.get('expirationTimestamp', 0) <= max_expiry_ms
-            and opt['symbolName'].endswith('-' + option_type)
-        ]
-        if not valid_options:
+        candidates = index.expiries_between(min_expiry_ms, max_expiry_ms, option_type)
+        if not len(candidates):
             logger.error(
                 f"No options with DTE in [{dte_min}, {dte_max}] and type {option_type}"
             )
@@ -216,18 +291,14 @@ def _filter_by_expiry(options_list, expiry_criteria, option_type):
 
         # Collapse to the single nearest-DTE expiry
         target_ms = today_start_ms + dte * 86400_000 + 43200_000  # noon of target day
-        closest = min(valid_options, key=lambda x: abs(x['expirationTimestamp'] - target_ms))
-        expiry_ts = closest['expirationTimestamp']
-        expiry_options = [
-            opt for opt in valid_options
-            if opt['expirationTimestamp'] == expiry_ts
-        ]
-        return expiry_options
+        expiry_ts = candidates[np.argmin(np.abs(candidates - target_ms))]
+        return index.options(expiry_ts, option_type)
 
     elif isinstance(expiry_criteria, dict) and 'symbol' in expiry_criteria:
         sym = expiry_criteria['symbol']
         # Match symbolName containing the expiry token and option type
-        expiry_options = [opt for opt in options_list if (f"-{sym}-" in opt.get('symbolName', '')) and opt['symbolName'].endswith('-' + option_type)]
+        needle, suffix = f"-{sym}-", '-' + option_type
+        expiry_options = [opt for opt in options_list if needle in opt.get('symbolName', '') and opt['symbolName'].endswith(suffix)]
         if not expiry_options:
             logger.error(f"No options matching symbol expiry {sym} and type {option_type}")
             return []
@@ -237,17 +308,16 @@ def _filter_by_expiry(options_list, expiry_criteria, option_type):
         min_expiry = current_time + expiry_criteria['minExp'] * 86400 * 1000
         max_expiry = current_time + expiry_criteria['maxExp'] * 86400 * 1000
 
-        # Filter options by expiry range and type
-        valid_options = [opt for opt in options_list if min_expiry <= opt['expirationTimestamp'] <= max_expiry and opt['symbolName'].endswith('-' + option_type)]
-        if not valid_options:
+        index = _expiry_index(options_list)
+        candidates = index.expiries_between(min_expiry, max_expiry, option_type)
+        if not len(candidates):
             logger.error(f"No options within expiry range {expiry_criteria} and type {option_type}")
             return []
 
         # Find closest expiry and filter to that expiry
         target_expiry = (min_expiry + max_expiry) / 2
-        closest_expiry_opt = min(valid_options, key=lambda x: abs(x['expirationTimestamp'] - target_expiry))
-        expiry_date = closest_expiry_opt['expirationTimestamp']
-        expiry_options = [opt for opt in valid_options if opt['expirationTimestamp'] == expiry_date]
+        expiry_date = candidates[np.argmin(np.abs(candidates - target_expiry))]
+        expiry_options = index.options(expiry_date, option_type)
 
     return expiry_options
 
@@ -724,11 +794,16 @@ def _find_filter_delta(options: list, delta: dict) -> list:
     return result
 
 
-def _utc_day_start_ms() -> int:
-    """Return millisecond timestamp for the start of today (00:00 UTC)."""
-    now = datetime.now(timezone.utc)
-    midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
-    return int(midnight.timestamp() * 1000)
+def _utc_day_start_ms(now_ms: Optional[float] = None) -> int:
+    """Return millisecond timestamp for the start of today (00:00 UTC).
+
+    Pass *now_ms* to derive the day from a clock reading the caller
+    already took; UTC days are exactly 86 400 000 ms (Unix time has no
+    leap seconds), so this is plain integer arithmetic.
+    """
+    if now_ms is None:
+        now_ms = time.time() * 1000
+    return int(now_ms // 86400_000) * 86400_000
 
 
 def _find_rank(options: list, delta: dict, rank_by: str, index_price: float, option_type: str):
@@ -41,6 +41,7 @@ Usage:
 import json
 import logging
 import os
+import sys
 import time
 from dataclasses import dataclass, field
 from enum import Enum
@@ -105,7 +106,7 @@ _LIVE_STATUSES = frozenset({
 # Order Record
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class OrderRecord:
     """One order in the ledger. Immutable ID, mutable status fields."""
 
@@ -185,7 +186,7 @@ class OrderRecord:
             lifecycle_id=d.get("lifecycle_id", ""),
             leg_index=d.get("leg_index", 0),
             purpose=OrderPurpose(d.get("purpose", "open_leg")),
-            symbol=d.get("symbol", ""),
+            symbol=sys.intern(d.get("symbol", "")),
             side=raw_side,
             qty=d.get("qty", 0.0),
             price=Price.from_dict(d["price"]) if isinstance(d.get("price"), dict) else d.get("price", 0.0),
@@ -202,6 +203,36 @@ class OrderRecord:
         )
 
 
+@dataclass
+class _Placement:
+    """An order that passed OrderManager's checks and awaits the executor."""
+
+    lifecycle_id: str
+    leg_index: int
+    purpose: OrderPurpose
+    symbol: str
+    side: str
+    qty: float
+    price: Any
+    reduce_only: bool
+    client_order_id: str
+
+    @property
+    def key(self) -> Tuple[str, int, str]:
+        return (self.lifecycle_id, self.leg_index, self.purpose.value)
+
+    def executor_kwargs(self) -> Dict[str, Any]:
+        return {
+            "symbol": self.symbol,
+            "qty": self.qty,
+            "side": self.side,
+            "order_type": 1,
+            "price": self.price.amount if isinstance(self.price, Price) else float(self.price),
+            "client_order_id": self.client_order_id,
+            "reduce_only": self.reduce_only,
+        }
+
+
 # =============================================================================
 # Order Manager
 # =============================================================================
@@ -232,6 +263,8 @@ class OrderManager:
         # Secondary index: (lifecycle_id, leg_index, purpose) → order_id
         self._active_by_key: Dict[Tuple[str, int, str], str] = {}
         self._next_client_id: int = int(time.time() * 1000)
+        # lifecycle_id → minimum seconds between status polls (see set_poll_interval)
+        self._poll_intervals: Dict[str, float] = {}
 
     # ── Placement ────────────────────────────────────────────────────────
 
@@ -259,9 +292,84 @@ class OrderManager:
             OrderRecord on success, None on failure.
             If an existing live order is found, returns it (no new order).
         """
-        # --- Idempotency guard ---
-        key = (lifecycle_id, leg_index, purpose.value)
-        existing_id = self._active_by_key.get(key)
+        existing = self._live_for_key(lifecycle_id, leg_index, purpose, symbol)
+        if existing:
+            return existing
+
+        placement = self._prepare_placement(
+            lifecycle_id, leg_index, purpose, symbol, side, qty, price, reduce_only,
+        )
+        if placement is None:
+            return None
+
+        try:
+            result = self._executor.place_order(**placement.executor_kwargs())
+        except Exception as e:
+            logger.error(f"OrderManager: place_order raised for {symbol}: {e}")
+            result = None
+        return self._record_placement(placement, result)
+
+    def place_orders(self, orders: List[Dict[str, Any]]) -> List[Optional[OrderRecord]]:
+        """
+        Place several orders with one executor call where the exchange allows.
+
+        Each entry takes the same keyword arguments as place_order().  The
+        same idempotency, reduce_only and hard-cap rules apply per entry;
+        the caps also count earlier entries of the same batch.  Orders are
+        sent through executor.place_orders() (a single batch request on
+        Coincall) when the executor provides it, otherwise one at a time.
+
+        Returns:
+            One OrderRecord-or-None per input entry, in input order.
+        """
+        results: List[Optional[OrderRecord]] = [None] * len(orders)
+        to_send: List[Tuple[int, _Placement]] = []
+        for i, o in enumerate(orders):
+            existing = self._live_for_key(
+                o["lifecycle_id"], o["leg_index"], o["purpose"], o["symbol"],
+            )
+            if existing:
+                results[i] = existing
+                continue
+            placement = self._prepare_placement(
+                o["lifecycle_id"], o["leg_index"], o["purpose"], o["symbol"],
+                o["side"], o["qty"], o["price"], o.get("reduce_only", False),
+                in_flight=[p for _, p in to_send],
+            )
+            if placement is not None:
+                to_send.append((i, placement))
+
+        if not to_send:
+            return results
+
+        batch = getattr(self._executor, "place_orders", None)
+        if batch is None or len(to_send) == 1:
+            responses = []
+            for _, p in to_send:
+                try:
+                    responses.append(self._executor.place_order(**p.executor_kwargs()))
+                except Exception as e:
+                    logger.error(f"OrderManager: place_order raised for {p.symbol}: {e}")
+                    responses.append(None)
+        else:
+            # Orders may be live even if the batch call raised or returned a
+            # short list — a None response is resolved by client order ID.
+            try:
+                responses = list(batch([p.executor_kwargs() for _, p in to_send]))
+            except Exception as e:
+                logger.error(f"OrderManager: place_orders raised for {len(to_send)} orders: {e}")
+                responses = []
+            responses += [None] * (len(to_send) - len(responses))
+
+        for (i, placement), result in zip(to_send, responses):
+            results[i] = self._record_placement(placement, result)
+        return results
+
+    def _live_for_key(
+        self, lifecycle_id: str, leg_index: int, purpose: OrderPurpose, symbol: str,
+    ) -> Optional[OrderRecord]:
+        """Idempotency guard: the live order already filling this slot, if any."""
+        existing_id = self._active_by_key.get((lifecycle_id, leg_index, purpose.value))
         if existing_id and existing_id in self._orders:
             existing = self._orders[existing_id]
             if existing.is_live:
@@ -270,6 +378,26 @@ class OrderManager:
                     f"{existing.order_id} for {symbol} ({purpose.value})"
                 )
                 return existing
+        return None
+
+    def _prepare_placement(
+        self,
+        lifecycle_id: str,
+        leg_index: int,
+        purpose: OrderPurpose,
+        symbol: str,
+        side: str,
+        qty: float,
+        price: Any,
+        reduce_only: bool,
+        in_flight: Optional[List["_Placement"]] = None,
+    ) -> Optional["_Placement"]:
+        """Apply safety rules and assign a client order ID (no API call).
+
+        ``in_flight`` holds placements prepared earlier in the same batch,
+        which count towards the hard caps although not yet in the ledger.
+        """
+        in_flight = in_flight or []
 
         # --- Safety: force reduce_only for close/unwind ---
         if purpose in (OrderPurpose.CLOSE_LEG, OrderPurpose.UNWIND):
@@ -279,7 +407,7 @@ class OrderManager:
         lifecycle_count = sum(
             1 for r in self._orders.values()
             if r.lifecycle_id == lifecycle_id
-        )
+        ) + sum(1 for p in in_flight if p.lifecycle_id == lifecycle_id)
         if lifecycle_count >= self.MAX_ORDERS_PER_LIFECYCLE:
             logger.error(
                 f"OrderManager: hard cap hit — {lifecycle_count} orders "
@@ -291,7 +419,7 @@ class OrderManager:
         pending_for_symbol = sum(
             1 for r in self._orders.values()
             if r.symbol == symbol and r.is_live
-        )
+        ) + sum(1 for p in in_flight if p.symbol == symbol)
         if pending_for_symbol >= self.MAX_PENDING_PER_SYMBOL:
             logger.error(
                 f"OrderManager: hard cap hit — {pending_for_symbol} live orders "
@@ -311,19 +439,25 @@ class OrderManager:
                     f"expected {self._expected_denomination.value} for {symbol}"
                 )
 
-        # --- Extract numeric price for executor ---
-        price_for_executor = price.amount if isinstance(price, Price) else float(price)
-
-        # --- Place via executor ---
-        result = self._executor.place_order(
+        return _Placement(
+            lifecycle_id=lifecycle_id,
+            leg_index=leg_index,
+            purpose=purpose,
             symbol=symbol,
-            qty=qty,
             side=side,
-            order_type=1,
-            price=price_for_executor,
-            client_order_id=client_order_id,
+            qty=qty,
+            price=price,
             reduce_only=reduce_only,
+            client_order_id=client_order_id,
         )
+
+    def _record_placement(
+        self, placement: "_Placement", result: Optional[Dict[str, Any]],
+    ) -> Optional[OrderRecord]:
+        """Turn an executor placement response into a ledger record."""
+        symbol = placement.symbol
+        if not result:
+            result = self._find_lost_placement(placement)
         if not result:
             logger.error(f"OrderManager: executor failed to place order for {symbol}")
             return None
@@ -333,6 +467,9 @@ class OrderManager:
             logger.error(f"OrderManager: executor returned no orderId for {symbol}")
             return None
 
+        price = placement.price
+        qty = placement.qty
+
         # --- Extract fee from immediate fills (if any) ---
         trades = result.get("_trades", [])
         fee_currency = price.currency if isinstance(price, Price) else Currency.BTC
@@ -352,15 +489,15 @@ class OrderManager:
 
         record = OrderRecord(
             order_id=order_id,
-            client_order_id=client_order_id,
-            lifecycle_id=lifecycle_id,
-            leg_index=leg_index,
-            purpose=purpose,
+            client_order_id=placement.client_order_id,
+            lifecycle_id=placement.lifecycle_id,
+            leg_index=placement.leg_index,
+            purpose=placement.purpose,
             symbol=symbol,
-            side=side,
+            side=placement.side,
             qty=qty,
             price=price,
-            reduce_only=reduce_only,
+            reduce_only=placement.reduce_only,
             status=status,
             filled_qty=fill_qty,
             avg_fill_price=avg_price if avg_price > 0 else None,
@@ -369,26 +506,53 @@ class OrderManager:
             terminal_at=now if status == OrderStatus.FILLED else None,
         )
         self._orders[order_id] = record
-        self._active_by_key[key] = order_id
+        self._active_by_key[placement.key] = order_id
 
         self.persist_event(order_id, "placed")
         logger.info(
             f"OrderManager: placed order {order_id} — "
-            f"{symbol} {side} {qty} @ {price} "
-            f"({purpose.value}, lifecycle={lifecycle_id}, leg={leg_index})"
+            f"{symbol} {placement.side} {qty} @ {price} "
+            f"({placement.purpose.value}, lifecycle={placement.lifecycle_id}, "
+            f"leg={placement.leg_index})"
         )
         _execution_logger.info({
             "event": "ORDER_PLACED",
-            "trade_id": lifecycle_id,
+            "trade_id": placement.lifecycle_id,
             "order_id": order_id,
             "symbol": symbol,
-            "side": side,
+            "side": placement.side,
             "qty": qty,
             "price": float(price),
-            "purpose": purpose.value,
+            "purpose": placement.purpose.value,
         })
         return record
 
+    def _find_lost_placement(self, placement: "_Placement") -> Optional[Dict[str, Any]]:
+        """Check by client order ID whether a "failed" placement actually landed.
+
+        A timeout or dropped connection leaves no response even though the
+        exchange may have accepted the order.  One lookup by the unique
+        client_order_id tells the two cases apart, so a resting order is
+        tracked instead of orphaned.
+        """
+        lookup = getattr(self._executor, "get_order_by_client_id", None)
+        if lookup is None:
+            return None
+        try:
+            found = lookup(placement.client_order_id, placement.symbol)
+        except Exception as e:
+            logger.warning(
+                f"OrderManager: lookup of client id {placement.client_order_id} failed: {e}"
+            )
+            return None
+        if not isinstance(found, dict) or not found.get("orderId"):
+            return None
+        logger.warning(
+            f"OrderManager: placement response lost for {placement.symbol} — "
+            f"found order {found['orderId']} by client id {placement.client_order_id}"
+        )
+        return found
+
     # ── Cancellation ─────────────────────────────────────────────────────
 
     def cancel_order(self, order_id: str) -> bool:
@@ -419,22 +583,43 @@ class OrderManager:
 
         return success
 
+    def cancel_orders(self, order_ids: List[str]) -> int:
+        """Cancel several orders in one batch where the executor allows.
+
+        Unknown or already-terminal IDs are skipped.  Returns count cancelled.
+        """
+        records = [self._orders.get(oid) for oid in order_ids]
+        return self._cancel_many([r for r in records if r is not None and r.is_live])
+
     def cancel_all_for(self, lifecycle_id: str) -> int:
         """Cancel all live orders for a given lifecycle. Returns count cancelled."""
-        count = 0
-        for record in list(self._orders.values()):
-            if record.lifecycle_id == lifecycle_id and record.is_live:
-                if self.cancel_order(record.order_id):
-                    count += 1
-        return count
+        return self._cancel_many([
+            r for r in self._orders.values()
+            if r.lifecycle_id == lifecycle_id and r.is_live
+        ])
 
     def cancel_all(self) -> int:
         """Emergency: cancel every live order in the ledger."""
+        return self._cancel_many([r for r in self._orders.values() if r.is_live])
+
+    def _cancel_many(self, records: List[OrderRecord]) -> int:
+        """Cancel live records, batched via executor.cancel_orders() if offered."""
+        batch = getattr(self._executor, "cancel_orders", None)
+        if batch is None or len(records) <= 1:
+            return sum(1 for r in records if self.cancel_order(r.order_id))
+
         count = 0
-        for record in list(self._orders.values()):
-            if record.is_live:
-                if self.cancel_order(record.order_id):
-                    count += 1
+        results = batch([r.order_id for r in records])
+        for record, success in zip(records, results):
+            if success:
+                self._mark_terminal(record, OrderStatus.CANCELLED)
+                logger.info(f"OrderManager: cancelled order {record.order_id}")
+                count += 1
+            else:
+                logger.warning(
+                    f"OrderManager: cancel failed for {record.order_id}, polling for true state"
+                )
+                self.poll_order(record.order_id)
         return count
 
     # ── Requote (cancel + replace) ───────────────────────────────────────
@@ -495,25 +680,101 @@ class OrderManager:
             return None
 
         # 5. Link the chain
+        self._link_requote(record, replacement, new_price)
+        return replacement
+
+    def requote_orders(
+        self,
+        requotes: List[Tuple[str, Any, Optional[float]]],
+    ) -> List[Optional[OrderRecord]]:
+        """
+        Cancel-and-replace several orders together.
+
+        Takes (order_id, new_price, new_qty) tuples and follows the same
+        steps as requote_order(), but each step covers every order at once:
+        one status refresh, one batch cancel, one batch placement.  A
+        replacement is only placed once its order's cancel is confirmed.
+
+        Returns:
+            One entry per requote: the new OrderRecord, or None if the
+            order filled, was unknown, or could not be replaced.
+        """
+        results: List[Optional[OrderRecord]] = [None] * len(requotes)
+        records = [self._orders.get(order_id) for order_id, _, _ in requotes]
+        for (order_id, _, _), record in zip(requotes, records):
+            if record is None:
+                logger.warning(f"OrderManager: requote — order {order_id} not in ledger")
+
+        # 1. Poll for latest state
+        self._poll_records([r for r in records if r is not None and r.is_live])
+
+        # 2-3. Cancel the ones still worth replacing
+        to_cancel = []
+        for record in records:
+            if record is None:
+                continue
+            if record.status == OrderStatus.FILLED:
+                logger.info(f"OrderManager: requote skipped — {record.order_id} already filled")
+            elif record.qty - record.filled_qty <= 0:
+                logger.info(f"OrderManager: requote skipped — {record.order_id} no remaining qty")
+            else:
+                to_cancel.append(record)
+        self._cancel_many([r for r in to_cancel if r.is_live])
+        cancel_ids = {r.order_id for r in to_cancel}
+
+        # 4. Place replacements for confirmed cancels
+        slots, specs = [], []
+        for i, ((order_id, new_price, new_qty), record) in enumerate(zip(requotes, records)):
+            if record is None or record.order_id not in cancel_ids:
+                continue
+            if record.status != OrderStatus.CANCELLED:
+                logger.warning(
+                    f"OrderManager: requote — {order_id} not cancelled "
+                    f"({record.status.value}), no replacement placed"
+                )
+                continue
+            slots.append(i)
+            specs.append(dict(
+                lifecycle_id=record.lifecycle_id,
+                leg_index=record.leg_index,
+                purpose=record.purpose,
+                symbol=record.symbol,
+                side=record.side,
+                qty=new_qty if new_qty is not None else record.qty - record.filled_qty,
+                price=new_price,
+                reduce_only=record.reduce_only,
+            ))
+
+        for i, replacement in zip(slots, self.place_orders(specs) if specs else []):
+            order_id, new_price, _ = requotes[i]
+            if replacement is None:
+                logger.error(f"OrderManager: requote — replacement failed for {order_id}")
+                continue
+            # 5. Link the chain
+            self._link_requote(records[i], replacement, new_price)
+            results[i] = replacement
+        return results
+
+    def _link_requote(self, record: OrderRecord, replacement: OrderRecord, new_price: Any) -> None:
+        """Record old → new on both orders and log the requote."""
         record.superseded_by = replacement.order_id
         replacement.supersedes = record.order_id
 
-        self.persist_event(order_id, "superseded")
+        self.persist_event(record.order_id, "superseded")
         self.persist_event(replacement.order_id, "requoted_from")
         logger.info(
-            f"OrderManager: requoted {order_id} → {replacement.order_id} "
+            f"OrderManager: requoted {record.order_id} → {replacement.order_id} "
             f"@ {new_price} (remaining {replacement.qty})"
         )
         _execution_logger.info({
             "event": "ORDER_REQUOTED",
             "trade_id": record.lifecycle_id,
-            "old_order_id": order_id,
+            "old_order_id": record.order_id,
             "new_order_id": replacement.order_id,
             "symbol": record.symbol,
             "old_price": float(record.price),
             "new_price": float(new_price),
         })
-        return replacement
 
     # ── Status Polling ───────────────────────────────────────────────────
 
@@ -523,57 +784,105 @@ class OrderManager:
 
         Should be called ONCE at the start of each tick, BEFORE any
         lifecycle state transitions.
+
+        When the executor offers list_open_orders(), one request fetches
+        every open order and resting orders are updated from it; only
+        orders missing from that list (filled or cancelled since the last
+        tick) are queried individually.
         """
-        live_orders = [r for r in self._orders.values() if r.is_live]
-        for record in live_orders:
-            self.poll_order(record.order_id)
+        now = time.time()
+        self._poll_records([
+            r for r in self._orders.values()
+            if r.is_live and not self._polled_recently(r, now)
+        ])
+
+    def _poll_records(self, records: List[OrderRecord]) -> None:
+        """Refresh live records, via one list_open_orders() call when offered."""
+        if not records:
+            return
+
+        open_orders = None
+        list_open = getattr(self._executor, "list_open_orders", None)
+        if list_open is not None and len(records) > 1:
+            try:
+                open_orders = list_open()
+            except Exception as e:
+                logger.error(f"OrderManager: error listing open orders: {e}")
+
+        for record in records:
+            info = open_orders.get(record.order_id) if open_orders is not None else None
+            if info is None:
+                self.poll_order(record.order_id)
+            else:
+                self._apply_status(record, info)
+
+    def set_poll_interval(self, lifecycle_id: str, seconds: float) -> None:
+        """Poll this lifecycle's orders at most every ``seconds`` in poll_all().
+
+        0 restores polling on every call.
+        """
+        if seconds > 0:
+            self._poll_intervals[lifecycle_id] = seconds
+        else:
+            self._poll_intervals.pop(lifecycle_id, None)
 
-    def poll_order(self, order_id: str) -> Optional[OrderRecord]:
-        """Poll and update a single order. Returns updated record."""
+    def _polled_recently(self, record: OrderRecord, now: float) -> bool:
+        interval = self._poll_intervals.get(record.lifecycle_id)
+        return bool(interval and record.updated_at and now - record.updated_at < interval)
+
+    def poll_order(self, order_id: str, max_age: float = 0.0) -> Optional[OrderRecord]:
+        """Poll and update a single order. Returns updated record.
+
+        With ``max_age`` > 0, a record refreshed within that many seconds
+        (e.g. by poll_all() earlier in the same tick) is returned as-is
+        without another exchange request.
+        """
         record = self._orders.get(order_id)
         if not record or record.is_terminal:
             return record
+        if max_age > 0 and record.updated_at and time.time() - record.updated_at < max_age:
+            return record
 
         try:
             info = self._executor.get_order_status(order_id)
-            if not info:
-                return record
-
-            now = time.time()
-            record.updated_at = now
-
-            # Update fill data
-            fill_qty = float(info.get("fillQty", 0))
-            if fill_qty > record.filled_qty:
-                record.filled_qty = fill_qty
-                avg_price = info.get("avgPrice")
-                if avg_price:
-                    record.avg_fill_price = float(avg_price)
-
-            # Map exchange state to our status
-            state_code = info.get("state")
-            if state_code is not None:
-                # Support both int keys (Coincall) and string keys (Deribit)
-                new_status = self._state_map.get(state_code)
-                if new_status is None:
-                    try:
-                        new_status = self._state_map.get(int(state_code))
-                    except (ValueError, TypeError):
-                        pass
-                if new_status and new_status != record.status:
-                    old_status = record.status
-                    record.status = new_status
-                    if new_status in _TERMINAL_STATUSES:
-                        self._mark_terminal(record, new_status)
-                    logger.debug(
-                        f"OrderManager: {order_id} status {old_status.value} → {new_status.value}"
-                    )
-
+            if info:
+                self._apply_status(record, info)
         except Exception as e:
             logger.error(f"OrderManager: error polling order {order_id}: {e}")
 
         return record
 
+    def _apply_status(self, record: OrderRecord, info: Dict[str, Any]) -> None:
+        """Update a record from an exchange order-status dict."""
+        record.updated_at = time.time()
+
+        # Update fill data
+        fill_qty = float(info.get("fillQty", 0))
+        if fill_qty > record.filled_qty:
+            record.filled_qty = fill_qty
+            avg_price = info.get("avgPrice")
+            if avg_price:
+                record.avg_fill_price = float(avg_price)
+
+        # Map exchange state to our status
+        state_code = info.get("state")
+        if state_code is not None:
+            # Support both int keys (Coincall) and string keys (Deribit)
+            new_status = self._state_map.get(state_code)
+            if new_status is None:
+                try:
+                    new_status = self._state_map.get(int(state_code))
+                except (ValueError, TypeError):
+                    pass
+            if new_status and new_status != record.status:
+                old_status = record.status
+                record.status = new_status
+                if new_status in _TERMINAL_STATUSES:
+                    self._mark_terminal(record, new_status)
+                logger.debug(
+                    f"OrderManager: {record.order_id} status {old_status.value} → {new_status.value}"
+                )
+
     # ── Queries ──────────────────────────────────────────────────────────
 
     def get_live_orders(
@@ -6,7 +6,7 @@ Append-only log of completed trades to `logs/trade_history.jsonl`.
 One JSON object per line for easy parsing, tailing, and analytics.
 
 Active trade state is handled by LifecycleManager._persist_all_trades()
-which writes `logs/trades_snapshot.json` on every tick.
+which rewrites `logs/trades_snapshot.json` on any tick where a trade changed.
 Crash recovery reads that snapshot directly in main.py.
 """
 
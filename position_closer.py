@@ -96,7 +96,9 @@ class PositionCloser:
     PHASE2_DURATION: int = 120     # 2 minutes aggressive
     PHASE2_REPRICE: int = 15       # reprice every 15s
     PHASE2_DISCOUNT: float = 0.10  # 10% aggressive pricing
-    POLL_INTERVAL: int = 10        # check fills every 10s
+    POLL_INTERVAL: int = 10        # max gap between fill checks
+    POLL_MIN_INTERVAL: float = 1.0 # first check after (re)placing orders
+    PHASE2_POLL_INTERVAL: float = 2.0  # max gap between fill checks in phase 2
 
     def __init__(
         self,
@@ -225,6 +227,7 @@ class PositionCloser:
                 duration=self.PHASE2_DURATION,
                 reprice_interval=self.PHASE2_REPRICE,
                 price_fn=self._aggressive_price,
+                max_poll_interval=self.PHASE2_POLL_INTERVAL,
             )
 
             # 8. Finalize
@@ -250,9 +253,17 @@ class PositionCloser:
         duration: int,
         reprice_interval: int,
         price_fn,
+        max_poll_interval: Optional[float] = None,
     ) -> None:
-        """Run a single timed phase: place orders, poll fills, reprice."""
+        """Run a single timed phase: place orders, poll fills, reprice.
+
+        Fill checks back off from POLL_MIN_INTERVAL up to max_poll_interval
+        (default POLL_INTERVAL).  The aggressive phase passes a tighter cap
+        so crossing orders are seen as filled within a couple of seconds.
+        """
         phase_start = time.time()
+        if max_poll_interval is None:
+            max_poll_interval = self.POLL_INTERVAL
 
         # Initial placement
         for leg in legs:
@@ -260,16 +271,33 @@ class PositionCloser:
                 self._place_or_reprice(leg, price_fn(leg))
 
         last_reprice = time.time()
+        poll_wait = self.POLL_MIN_INTERVAL
 
         while time.time() - phase_start < duration:
-            time.sleep(self.POLL_INTERVAL)
+            # Adaptive backoff: poll soon after (re)placing or a fill, then
+            # double the gap while nothing changes, up to max_poll_interval.
+            # Never sleep past the next reprice or the end of the phase.
+            now = time.time()
+            wake_at = min(
+                now + poll_wait,
+                last_reprice + reprice_interval,
+                phase_start + duration,
+            )
+            time.sleep(max(0.0, wake_at - now))
+
+            filled_before = sum(1 for l in legs if l.filled)
             self._check_fills(legs)
 
             unfilled = [l for l in legs if not l.filled]
             if not unfilled:
                 break
 
-            filled_count = sum(1 for l in legs if l.filled)
+            filled_count = len(legs) - len(unfilled)
+            if filled_count > filled_before:
+                poll_wait = self.POLL_MIN_INTERVAL
+            else:
+                poll_wait = min(poll_wait * 2, max_poll_interval)
+
             elapsed = time.time() - phase_start
             logger.info(
                 f"Kill switch {phase_name}: {filled_count}/{len(legs)} filled, "
@@ -282,12 +310,29 @@ class PositionCloser:
                 for leg in unfilled:
                     self._place_or_reprice(leg, price_fn(leg))
                 last_reprice = time.time()
+                poll_wait = self.POLL_MIN_INTERVAL
 
     # -- Order management -----------------------------------------------------
 
     def _place_or_reprice(self, leg: _CloseLeg, price: float) -> bool:
-        """Cancel existing order (if any) and place a new limit order."""
+        """Amend the existing order in place, else cancel it and place anew.
+
+        Amending is one round-trip and keeps the order on the book; it is
+        used where the exchange adapter supports it (amend_order returns
+        None otherwise, or when the order is no longer amendable).
+        """
         if leg.order_id:
+            try:
+                amended = self._executor.amend_order(leg.order_id, leg.qty, price)
+            except Exception as e:
+                logger.warning(f"Kill switch: amend failed for {leg.order_id}: {e}")
+                amended = None
+            if amended:
+                logger.info(
+                    f"Kill switch: repriced {leg.side_label} {leg.qty}x {leg.symbol} "
+                    f"@ {_fmt_price(price)} (order {leg.order_id}, amended)"
+                )
+                return True
             try:
                 self._executor.cancel_order(leg.order_id)
             except Exception as e:
@@ -22,10 +22,10 @@ Usage:
     from rfq import RFQExecutor, OptionLeg
 
     # Open a long strangle (BUY both legs)
-    legs = [
-        OptionLeg(symbol='BTCUSD-28FEB26-100000-C', qty=0.5, side='BUY'),
-        OptionLeg(symbol='BTCUSD-28FEB26-90000-P',  qty=0.5, side='BUY'),
-    ]
+    legs = (
+        OptionLeg(instrument='BTCUSD-28FEB26-100000-C', qty=0.5, side='BUY'),
+        OptionLeg(instrument='BTCUSD-28FEB26-90000-P',  qty=0.5, side='BUY'),
+    )
     rfq = RFQExecutor()
     result = rfq.execute(legs, action='buy', timeout_seconds=60)
 
@@ -33,11 +33,13 @@ Usage:
     result = rfq.execute(legs, action='sell', timeout_seconds=60)
 """
 
+import heapq
 import logging
 import time
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List, Optional, Any
+from operator import attrgetter
+from typing import Dict, Iterable, List, Optional, Sequence, Any
 
 from config import BASE_URL, API_KEY, API_SECRET
 from auth import CoincallAuth
@@ -50,10 +52,13 @@ logger = logging.getLogger(__name__)
 # Data Classes
 # =============================================================================
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class OptionLeg:
     """
     Represents a single leg in an RFQ structure.
+
+    Immutable, so a legs tuple can be built once and shared between the
+    orderbook baseline, RFQ creation and quote comparison without copies.
     
     Attributes:
         instrument: Full option name (e.g., "BTCUSD-28FEB26-100000-C")
@@ -66,7 +71,7 @@ class OptionLeg:
     
     def __post_init__(self):
         """Validate leg parameters"""
-        self.side = self.side.upper()
+        object.__setattr__(self, "side", self.side.upper())
         if self.side not in ("BUY", "SELL"):
             raise ValueError(f"Invalid side '{self.side}', must be 'BUY' or 'SELL'")
         if self.qty <= 0:
@@ -187,6 +192,59 @@ class RFQResult:
     message: str = ""
 
 
+# =============================================================================
+# Quote Ranking
+# =============================================================================
+
+_quote_cost = attrgetter("total_cost")
+
+
+def _is_valid_buy(q: RFQQuote, cutoff_ms: int) -> bool:
+    """Open, unexpired quote that has us buying."""
+    return q.state == "OPEN" and q.is_we_buy and not (q.expiry_time and q.expiry_time < cutoff_ms)
+
+
+def _is_valid_sell(q: RFQQuote, cutoff_ms: int) -> bool:
+    """Open, unexpired quote that has us selling."""
+    return q.state == "OPEN" and q.is_we_sell and not (q.expiry_time and q.expiry_time < cutoff_ms)
+
+
+def best_quotes(
+    quotes: Iterable[RFQQuote],
+    want_to_buy: bool,
+    now_ms: int,
+    limit: Optional[int] = None,
+) -> List[RFQQuote]:
+    """
+    Filter quotes to our direction and rank them best-first in one pass.
+
+    Lower total_cost is better for both directions (pay less / receive more).
+    Quotes expiring within 1s of now_ms are skipped.
+
+    Args:
+        quotes: Quotes as returned by get_quotes()
+        want_to_buy: True to keep quotes where we buy, False where we sell
+        now_ms: Current time in epoch milliseconds
+        limit: Return at most this many quotes (None = all valid quotes)
+
+    Returns:
+        Valid quotes sorted by total_cost ascending
+    """
+    pred = _is_valid_buy if want_to_buy else _is_valid_sell
+    cutoff_ms = now_ms + 1000
+    valid = (q for q in quotes if pred(q, cutoff_ms))
+    if limit is None:
+        return sorted(valid, key=_quote_cost)
+    return heapq.nsmallest(limit, valid, key=_quote_cost)
+
+
+def _sleep_before_next_poll(poll_interval: float, deadline: float) -> None:
+    """Sleep one poll interval, but never past the deadline."""
+    remaining = deadline - time.time()
+    if remaining > 0:
+        time.sleep(min(poll_interval, remaining))
+
+
 # =============================================================================
 # RFQ Executor
 # =============================================================================
@@ -210,12 +268,12 @@ class RFQExecutor:
     # Core RFQ Operations
     # -------------------------------------------------------------------------
     
-    def create_rfq(self, legs: List[OptionLeg]) -> Optional[Dict[str, Any]]:
+    def create_rfq(self, legs: Sequence[OptionLeg]) -> Optional[Dict[str, Any]]:
         """
         Create a new RFQ request.
         
         Args:
-            legs: List of OptionLeg objects defining the structure
+            legs: OptionLeg objects defining the structure (tuple preferred)
             
         Returns:
             API response with requestId, expiryTime, state, etc.
@@ -279,13 +337,14 @@ class RFQExecutor:
                 quotes = [RFQQuote.from_api_response(q) for q in quotes_data]
                 
                 if quotes:
-                    logger.info(f"Received {len(quotes)} quote(s) for RFQ {request_id}")
-                    for q in quotes:
-                        logger.debug(f"  Quote {q.quote_id}: cost={q.total_cost:.2f}, state={q.state}")
+                    logger.info("Received %d quote(s) for RFQ %s", len(quotes), request_id)
+                    if logger.isEnabledFor(logging.DEBUG):
+                        for q in quotes:
+                            logger.debug("  Quote %s: cost=%.2f, state=%s", q.quote_id, q.total_cost, q.state)
                 
                 return quotes
             else:
-                logger.debug(f"No quotes yet for RFQ {request_id}: {response.get('msg')}")
+                logger.debug("No quotes yet for RFQ %s: %s", request_id, response.get('msg'))
                 return []
                 
         except Exception as e:
@@ -385,7 +444,7 @@ class RFQExecutor:
     # Orderbook Comparison
     # -------------------------------------------------------------------------
     
-    def get_orderbook_cost(self, legs: List[OptionLeg], action: str = "buy") -> Optional[float]:
+    def get_orderbook_cost(self, legs: Sequence[OptionLeg], action: str = "buy") -> Optional[float]:
         """
         Calculate the total cost to execute this structure on the orderbook.
 
@@ -395,7 +454,7 @@ class RFQExecutor:
           action="sell" → we sell each leg → hit the bid  → negative cost (credit)
 
         Args:
-            legs: List of OptionLeg objects defining the structure
+            legs: OptionLeg objects defining the structure (tuple preferred)
             action: "buy" or "sell" — what we want to do with every leg
 
         Returns:
@@ -470,7 +529,7 @@ class RFQExecutor:
     
     def execute(
         self,
-        legs: List[OptionLeg],
+        legs: Sequence[OptionLeg],
         action: str = "buy",
         timeout_seconds: int = 60,
         min_improvement_pct: float = -999.0,
@@ -488,7 +547,7 @@ class RFQExecutor:
           6. Accepts the best qualifying quote, or cancels if none
         
         Args:
-            legs: List of OptionLeg objects defining the structure
+            legs: OptionLeg objects defining the structure (tuple preferred)
             action: "buy" to buy the structure or "sell" to sell it
             timeout_seconds: Maximum time to wait for quotes (default: 60s)
             min_improvement_pct: Minimum improvement vs orderbook to accept.
@@ -544,38 +603,22 @@ class RFQExecutor:
             while time.time() - start_time < rfq_timeout and not accepted:
                 quotes = self.get_quotes(request_id)
                 
-                # Filter to open quotes matching our direction, not expired
+                # Open quotes matching our direction, not expired, best first
                 now_ms = int(time.time() * 1000)
-                valid_quotes = []
-                for q in quotes:
-                    if q.state != "OPEN":
-                        continue
-                    if want_to_buy and not q.is_we_buy:
-                        continue
-                    if not want_to_buy and not q.is_we_sell:
-                        continue
-                    if q.expiry_time and q.expiry_time < now_ms + 1000:
-                        logger.debug(f"Skipping expired quote {q.quote_id}")
-                        continue
-                    valid_quotes.append(q)
+                valid_quotes = best_quotes(quotes, want_to_buy, now_ms)
                 
                 if valid_quotes:
-                    # Sort: cheapest first (for buying) or most credit first (for selling)
-                    # In both cases, lower total_cost is better
-                    valid_quotes.sort(key=lambda q: q.total_cost)
-                    
                     # Log all valid quotes
-                    for i, q in enumerate(valid_quotes):
-                        tag = "BEST" if i == 0 else f"#{i+1}"
-                        action_tag = "WE BUY" if q.is_we_buy else "WE SELL"
-                        ttl = (q.expiry_time - now_ms) / 1000
-                        improvement = self.calculate_improvement(q.total_cost, orderbook_cost) if orderbook_cost is not None else 0
-                        logger.info(
-                            f"[{tag}] Quote {q.quote_id} ({action_tag}): "
-                            f"cost=${q.total_cost:.2f}, "
-                            f"vs book={improvement:+.1f}%, "
-                            f"expires in {ttl:.0f}s"
-                        )
+                    if logger.isEnabledFor(logging.INFO):
+                        for i, q in enumerate(valid_quotes):
+                            tag = "BEST" if i == 0 else f"#{i+1}"
+                            action_tag = "WE BUY" if q.is_we_buy else "WE SELL"
+                            ttl = (q.expiry_time - now_ms) / 1000
+                            improvement = self.calculate_improvement(q.total_cost, orderbook_cost) if orderbook_cost is not None else 0
+                            logger.info(
+                                "[%s] Quote %s (%s): cost=$%.2f, vs book=%+.1f%%, expires in %.0fs",
+                                tag, q.quote_id, action_tag, q.total_cost, improvement, ttl,
+                            )
                     
                     best = valid_quotes[0]
                     
@@ -584,20 +627,18 @@ class RFQExecutor:
                         improvement = self.calculate_improvement(best.total_cost, orderbook_cost)
                         if improvement < min_improvement_pct:
                             logger.info(
-                                f"Best quote {improvement:+.1f}% vs book "
-                                f"(need {min_improvement_pct:+.1f}%), "
-                                f"waiting for better quotes..."
+                                "Best quote %+.1f%% vs book (need %+.1f%%), waiting for better quotes...",
+                                improvement, min_improvement_pct,
                             )
                             # Don't accept yet, keep polling for better quotes
-                            time.sleep(poll_interval_seconds)
+                            _sleep_before_next_poll(poll_interval_seconds, start_time + rfq_timeout)
                             continue
                     
                     # Try to accept the best quote (fall through to next best on failure)
                     for q in valid_quotes:
                         logger.info(
-                            f"Accepting quote {q.quote_id}: "
-                            f"{'paying' if q.total_cost > 0 else 'receiving'} "
-                            f"${abs(q.total_cost):.2f}"
+                            "Accepting quote %s: %s $%.2f",
+                            q.quote_id, "paying" if q.total_cost > 0 else "receiving", abs(q.total_cost),
                         )
                         accept_response = self.accept_quote(request_id, q.quote_id)
                         
@@ -622,7 +663,7 @@ class RFQExecutor:
                     break
                 
                 # Wait before next poll
-                time.sleep(poll_interval_seconds)
+                _sleep_before_next_poll(poll_interval_seconds, start_time + rfq_timeout)
 
             if not accepted:
                 result.message = result.message or f"No {action} quotes accepted within timeout"
@@ -652,7 +693,7 @@ class RFQExecutor:
 
     def execute_phased(
         self,
-        legs: List[OptionLeg],
+        legs: Sequence[OptionLeg],
         action: str = "sell",
         timeout_seconds: int = 300,
         initial_wait_seconds: int = 30,
@@ -736,23 +777,12 @@ class RFQExecutor:
 
                 quotes = self.get_quotes(request_id)
 
-                # Filter valid quotes
+                # Phase 1 only logs the best quote, so skip ranking the rest
                 now_ms = int(time.time() * 1000)
-                valid_quotes = []
-                for q in quotes:
-                    if q.state != "OPEN":
-                        continue
-                    if want_to_buy and not q.is_we_buy:
-                        continue
-                    if not want_to_buy and not q.is_we_sell:
-                        continue
-                    if q.expiry_time and q.expiry_time < now_ms + 1000:
-                        continue
-                    valid_quotes.append(q)
+                limit = 1 if elapsed < initial_wait_seconds else None
+                valid_quotes = best_quotes(quotes, want_to_buy, now_ms, limit=limit)
 
                 if valid_quotes:
-                    valid_quotes.sort(key=lambda q: q.total_cost)
-
                     # Log best quote
                     best = valid_quotes[0]
                     improvement = (
@@ -763,11 +793,10 @@ class RFQExecutor:
                     # Phase 1: Initial wait — log but don't accept
                     if elapsed < initial_wait_seconds:
                         logger.info(
-                            f"[Phase 1 — waiting] {elapsed:.0f}s / "
-                            f"{initial_wait_seconds}s  |  best quote: "
-                            f"${best.total_cost:.2f} ({improvement:+.1f}% vs book)"
+                            "[Phase 1 — waiting] %.0fs / %ss  |  best quote: $%.2f (%+.1f%% vs book)",
+                            elapsed, initial_wait_seconds, best.total_cost, improvement,
                         )
-                        time.sleep(poll_interval_seconds)
+                        _sleep_before_next_poll(poll_interval_seconds, start_time + rfq_timeout)
                         continue
 
                     # Phase 2: Gated — accept only if quote beats book by min_book_improvement_pct
@@ -775,10 +804,10 @@ class RFQExecutor:
                         min_ok = min_book_improvement_pct
                         if orderbook_cost is not None and improvement < min_ok:
                             logger.info(
-                                f"[Phase 2 — gated] {elapsed:.0f}s  |  "
-                                f"best={improvement:+.1f}% (need >= {min_ok:+.1f}%), waiting..."
+                                "[Phase 2 — gated] %.0fs  |  best=%+.1f%% (need >= %+.1f%%), waiting...",
+                                elapsed, improvement, min_ok,
                             )
-                            time.sleep(poll_interval_seconds)
+                            _sleep_before_next_poll(poll_interval_seconds, start_time + rfq_timeout)
                             continue
                         phase_label = "Phase 2 — gated"
                     else:
@@ -792,8 +821,8 @@ class RFQExecutor:
                             if orderbook_cost is not None else 0.0
                         )
                         logger.info(
-                            f"[{phase_label}] Accepting quote {q.quote_id}: "
-                            f"${abs(q.total_cost):.2f} ({imp:+.1f}% vs book)"
+                            "[%s] Accepting quote %s: $%.2f (%+.1f%% vs book)",
+                            phase_label, q.quote_id, abs(q.total_cost), imp,
                         )
                         accept_response = self.accept_quote(request_id, q.quote_id)
                         if accept_response:
@@ -815,7 +844,7 @@ class RFQExecutor:
                 if accepted:
                     break
 
-                time.sleep(poll_interval_seconds)
+                _sleep_before_next_poll(poll_interval_seconds, start_time + rfq_timeout)
 
             if not accepted:
                 result.message = f"No quotes accepted within {rfq_timeout:.0f}s timeout"
@@ -45,12 +45,15 @@ Usage:
     ctx.position_monitor.start()
 """
 
+import functools
 import logging
+import operator
 import os
+import threading
 import time
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
-from typing import Any, Callable, Dict, List, Optional
+from datetime import date, datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from account_manager import AccountSnapshot, PositionMonitor
 from exchanges import build_exchange
@@ -144,6 +147,21 @@ def build_context(
     )
 
 
+# =============================================================================
+# Evaluation Clock
+# =============================================================================
+
+# StrategyRunner pins "now" for the duration of one entry evaluation so every
+# time-based condition sees the same instant and the clock is read once.
+_eval_clock = threading.local()
+
+
+def _utc_now() -> datetime:
+    """Current UTC time — the pinned evaluation instant when one is active."""
+    now = getattr(_eval_clock, "now", None)
+    return now if now is not None else datetime.now(timezone.utc)
+
+
 # =============================================================================
 # Condition Type Aliases
 # =============================================================================
@@ -155,6 +173,15 @@ EntryCondition = Callable[[AccountSnapshot], bool]
 # ExitCondition is imported from trade_lifecycle (canonical definition):
 #   Callable[[AccountSnapshot, TradeLifecycle], bool]
 
+# Relative evaluation cost of built-in entry conditions (``_check._cost``).
+# StrategyRunner evaluates cheap gates first so a failing attribute compare
+# short-circuits before clock reads or position scans.  Custom callables
+# without ``_cost`` (may hit market data / APIs) run last, in declared order.
+_COST_ATTR = 1        # compare AccountSnapshot fields
+_COST_CLOCK = 2       # read the (pinned) UTC clock
+_COST_POSITIONS = 3   # inspect the positions set
+_COST_DEFAULT = 5
+
 
 def min_available_margin_pct(pct: float) -> EntryCondition:
     """Block entry when available margin is less than pct% of equity."""
@@ -167,9 +194,24 @@ def min_available_margin_pct(pct: float) -> EntryCondition:
             logger.debug(f"min_available_margin_pct({pct}%): margin={margin_pct:.1f}% — blocked")
         return ok
     _check.__name__ = f"min_available_margin_pct({pct}%)"
+    _check._cost = _COST_ATTR
     return _check
 
 
+# Calendar gates (time_window, weekday_filter) also publish their schedule
+# as ``_check._schedule``: a 7-tuple (Mon..Sun) of 24-bit hour masks.
+# StrategyRunner ANDs them into one mask and tests a single bit per tick
+# instead of calling each gate.
+_ALL_HOURS = (1 << 24) - 1
+
+
+def _hour_bits(start_hour: int, end_hour: int) -> int:
+    """24-bit mask of hours in [start_hour, end_hour), wrapping midnight."""
+    if start_hour <= end_hour:
+        return _ALL_HOURS & ((1 << end_hour) - (1 << start_hour))
+    return _ALL_HOURS & ~((1 << start_hour) - (1 << end_hour))
+
+
 def time_window(start_hour: int, end_hour: int, tz: str = "UTC") -> EntryCondition:
     """
     Only allow entry between start_hour and end_hour (inclusive start,
@@ -177,7 +219,7 @@ def time_window(start_hour: int, end_hour: int, tz: str = "UTC") -> EntryConditi
     Times are in UTC by default.
     """
     def _check(account: AccountSnapshot) -> bool:
-        hour = datetime.now(timezone.utc).hour
+        hour = _utc_now().hour
         if start_hour <= end_hour:
             ok = start_hour <= hour < end_hour
         else:
@@ -186,9 +228,15 @@ def time_window(start_hour: int, end_hour: int, tz: str = "UTC") -> EntryConditi
             logger.debug(f"time_window({start_hour}-{end_hour}): hour={hour} — blocked")
         return ok
     _check.__name__ = f"time_window({start_hour}-{end_hour} {tz})"
+    _check._cost = _COST_CLOCK
+    _check._schedule = (_hour_bits(start_hour, end_hour),) * 7
     return _check
 
 
+_DAY_NAMES = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
+_WEEKDAY_INDEX = {name: i for i, name in enumerate(_DAY_NAMES)}
+
+
 def weekday_filter(days: List[str]) -> EntryCondition:
     """
     Only allow entry on specified weekdays.
@@ -196,22 +244,23 @@ def weekday_filter(days: List[str]) -> EntryCondition:
     Args:
         days: List of day abbreviations, e.g. ["mon", "tue", "wed"]
     """
-    day_names = ["mon", "tue", "wed", "thu", "fri", "sat", "sun"]
-    allowed = set()
+    allowed_list = []
     for d in days:
-        abbr = d.lower()[:3]
-        if abbr in day_names:
-            allowed.add(day_names.index(abbr))
-        else:
+        idx = _WEEKDAY_INDEX.get(d.lower()[:3])
+        if idx is None:
             raise ValueError(f"Unknown weekday: {d}")
+        allowed_list.append(idx)
+    allowed = frozenset(allowed_list)
 
     def _check(account: AccountSnapshot) -> bool:
-        today = datetime.now(timezone.utc).weekday()
+        today = _utc_now().weekday()
         ok = today in allowed
         if not ok:
-            logger.debug(f"weekday_filter({days}): today={day_names[today]} — blocked")
+            logger.debug("weekday_filter(%s): today=%s — blocked", days, _DAY_NAMES[today])
         return ok
     _check.__name__ = f"weekday_filter({days})"
+    _check._cost = _COST_CLOCK
+    _check._schedule = tuple(_ALL_HOURS if i in allowed else 0 for i in range(7))
     return _check
 
 
@@ -223,6 +272,7 @@ def min_equity(amount: float) -> EntryCondition:
             logger.debug(f"min_equity(${amount}): equity=${account.equity:.2f} — blocked")
         return ok
     _check.__name__ = f"min_equity(${amount})"
+    _check._cost = _COST_ATTR
     return _check
 
 
@@ -236,6 +286,7 @@ def max_account_delta(threshold: float) -> EntryCondition:
             )
         return ok
     _check.__name__ = f"max_account_delta({threshold})"
+    _check._cost = _COST_ATTR
     return _check
 
 
@@ -249,18 +300,25 @@ def max_margin_utilization(pct: float) -> EntryCondition:
             )
         return ok
     _check.__name__ = f"max_margin_utilization({pct}%)"
+    _check._cost = _COST_ATTR
     return _check
 
 
 def no_existing_position_in(symbols: List[str]) -> EntryCondition:
     """Block entry if account already holds a position in any of the given symbols."""
+    wanted = frozenset(symbols)
+
     def _check(account: AccountSnapshot) -> bool:
-        for sym in symbols:
-            if account.get_position(sym) is not None:
-                logger.debug(f"no_existing_position_in: have {sym} — blocked")
-                return False
-        return True
+        # isdisjoint() stops at the first hit and builds no temporary set
+        if account.position_symbols.isdisjoint(wanted):
+            return True
+        logger.debug(
+            "no_existing_position_in: have %s — blocked",
+            sorted(account.position_symbols & wanted),
+        )
+        return False
     _check.__name__ = f"no_existing_position_in({symbols})"
+    _check._cost = _COST_POSITIONS
     return _check
 
 
@@ -285,22 +343,24 @@ def profit_target(pct: float, pnl_mode: str = "mark") -> ExitCondition:
     Example: profit_target(50, pnl_mode="executable")
     """
     label = f"profit_target({pct}%,{pnl_mode})"
+    executable = pnl_mode == "executable"
+    limit = pct / 100.0  # compared against pnl / |entry|
 
     def _check(account: AccountSnapshot, trade: "TradeLifecycle") -> bool:
         entry = trade.total_entry_cost()
         if entry == 0:
             return False
 
-        if pnl_mode == "executable":
+        if executable:
             pnl = trade.executable_pnl()
             if pnl is None:
                 return False  # orderbook unavailable — skip this tick
         else:
             pnl = trade.structure_pnl(account)
 
-        ratio = (pnl / abs(entry)) * 100
-        triggered = ratio >= pct
+        triggered = pnl >= limit * abs(entry)
         if triggered:
+            ratio = (pnl / abs(entry)) * 100
             logger.info(
                 f"[{trade.id}] {label} triggered: PnL ratio={ratio:.1f}% "
                 f"(pnl=${pnl:.4f}, entry=${entry:.4f})"
@@ -328,22 +388,24 @@ def max_loss(pct: float, pnl_mode: str = "mark") -> ExitCondition:
     Example: max_loss(100, pnl_mode="executable")
     """
     label = f"max_loss({pct}%,{pnl_mode})"
+    executable = pnl_mode == "executable"
+    limit = pct / 100.0  # compared against pnl / |entry|
 
     def _check(account: AccountSnapshot, trade: "TradeLifecycle") -> bool:
         entry = trade.total_entry_cost()
         if entry == 0:
             return False
 
-        if pnl_mode == "executable":
+        if executable:
             pnl = trade.executable_pnl()
             if pnl is None:
                 return False  # orderbook unavailable — skip this tick
         else:
             pnl = trade.structure_pnl(account)
 
-        ratio = (pnl / abs(entry)) * 100
-        triggered = ratio <= -pct
+        triggered = pnl <= -limit * abs(entry)
         if triggered:
+            ratio = (pnl / abs(entry)) * 100
             logger.info(
                 f"[{trade.id}] {label} triggered: PnL ratio={ratio:.1f}% "
                 f"(pnl=${pnl:.4f}, entry=${entry:.4f})"
@@ -356,11 +418,13 @@ def max_loss(pct: float, pnl_mode: str = "mark") -> ExitCondition:
 
 def max_hold_hours(hours: float) -> ExitCondition:
     """Close when position has been open longer than N hours."""
+    limit_s = hours * 3600
+
     def _check(account: AccountSnapshot, trade: "TradeLifecycle") -> bool:
-        hold = trade.hold_seconds
-        if hold is None:
+        if trade.opened_at is None:
             return False
-        triggered = hold >= hours * 3600
+        hold = time.time() - trade.opened_at
+        triggered = hold >= limit_s
         if triggered:
             logger.info(f"[{trade.id}] max_hold_hours({hours}h) triggered: held {hold/3600:.1f}h")
         return triggered
@@ -380,9 +444,9 @@ def time_exit(hour: int, minute: int = 0) -> ExitCondition:
         time_exit(19, 0)  → close at or after 19:00 UTC
     """
     def _check(account: AccountSnapshot, trade: "TradeLifecycle") -> bool:
-        now = datetime.now(timezone.utc)
-        cutoff = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
-        triggered = now >= cutoff
+        now = _utc_now()
+        # Same as now >= today's HH:MM:00 cutoff, without building a datetime
+        triggered = (now.hour, now.minute) >= (hour, minute)
         if triggered:
             logger.info(
                 f"[{trade.id}] time_exit({hour:02d}:{minute:02d} UTC) triggered: "
@@ -408,7 +472,7 @@ def utc_time_window(
         end: Latest UTC datetime (exclusive) to allow entry.
     """
     def _check(account: AccountSnapshot) -> bool:
-        now = datetime.now(timezone.utc)
+        now = _utc_now()
         ok = start <= now < end
         if not ok:
             logger.debug(
@@ -419,6 +483,7 @@ def utc_time_window(
     _check.__name__ = (
         f"utc_time_window({start.strftime('%H:%M')}-{end.strftime('%H:%M')})"
     )
+    _check._cost = _COST_CLOCK
     return _check
 
 
@@ -434,7 +499,7 @@ def utc_datetime_exit(dt: "datetime") -> ExitCondition:
         dt: UTC datetime at which to trigger exit.
     """
     def _check(account: AccountSnapshot, trade: "TradeLifecycle") -> bool:
-        now = datetime.now(timezone.utc)
+        now = _utc_now()
         triggered = now >= dt
         if triggered:
             logger.info(
@@ -537,6 +602,8 @@ class StrategyConfig:
         max_concurrent_trades: Maximum active trades for this strategy
         cooldown_seconds: Minimum seconds between trade opens
         check_interval_seconds: How often to evaluate entry conditions
+        adaptive_check_interval: Stretch the interval 4× while entry gates
+            have been failing persistently (see StrategyRunner._check_interval)
         metadata: Arbitrary context passed to each trade
     """
     name: str
@@ -552,6 +619,7 @@ class StrategyConfig:
     max_trades_per_day: int = 0          # 0 = unlimited
     cooldown_seconds: float = 0.0
     check_interval_seconds: float = 60.0
+    adaptive_check_interval: bool = False
     on_trade_closed: Optional[Callable] = None   # (TradeLifecycle, AccountSnapshot) -> None
     on_trade_opened: Optional[Callable] = None   # (TradeLifecycle, AccountSnapshot) -> None
     metadata: Dict[str, Any] = field(default_factory=dict)
@@ -562,6 +630,12 @@ class StrategyConfig:
 # Strategy Runner
 # =============================================================================
 
+# Adaptive check interval: after _IDLE_MISSES consecutive evaluations in
+# which the entry gates failed (smoothed pass estimate 1/(n+2) < 3%),
+# poll every check_interval_seconds × _IDLE_BACKOFF until one passes.
+_IDLE_MISSES = 32
+_IDLE_BACKOFF = 4.0
+
 class StrategyRunner:
     """
     Executes a single strategy: evaluates entry conditions, resolves legs,
@@ -584,6 +658,31 @@ class StrategyRunner:
         self._enabled: bool = True
         self._known_closed_ids: set = set()   # tracks already-handled closed trades
         self._known_open_ids: set = set()     # tracks already-handled opened trades
+        self._open_ids: set = set()           # trades to watch for CLOSED/FAILED
+        self._open_ids_synced: bool = False   # first close check seeds _open_ids
+        # Running totals over CLOSED trades, fed by _record_closed()
+        self._closed_count: int = 0
+        self._wins: int = 0
+        self._losses: int = 0
+        self._total_pnl: float = 0.0
+        self._total_hold: float = 0.0
+        self._closed_by_day: Dict[date, List[float]] = {}   # created date → [count, pnl]
+        self._consecutive_misses: int = 0     # entry evaluations failed in a row
+        # Calendar gates fold into one weekday × hour bitmask (None if none)
+        calendar = [c for c in config.entry_conditions if hasattr(c, "_schedule")]
+        self._schedule_mask: Optional[Tuple[int, ...]] = None
+        self._schedule_names: str = ", ".join(c.__name__ for c in calendar)
+        if calendar:
+            self._schedule_mask = tuple(
+                functools.reduce(operator.and_, day_masks) for day_masks in zip(
+                    *(c._schedule for c in calendar)
+                )
+            )
+        # Remaining entry conditions, cheapest first (stable: ties keep declared order)
+        self._entry_conditions: Tuple[EntryCondition, ...] = tuple(sorted(
+            (c for c in config.entry_conditions if not hasattr(c, "_schedule")),
+            key=lambda cond: getattr(cond, "_cost", _COST_DEFAULT),
+        ))
 
         # Apply per-slot execution profile override from env
         env_profile = os.environ.get("EXECUTION_PROFILE")
@@ -619,6 +718,11 @@ class StrategyRunner:
     def strategy_id(self) -> str:
         return self._strategy_id
 
+    @property
+    def enabled(self) -> bool:
+        """False while paused via disable()/stop()."""
+        return self._enabled
+
     @property
     def active_trades(self) -> List[TradeLifecycle]:
         """Active trades belonging to this strategy."""
@@ -637,9 +741,8 @@ class StrategyRunner:
         if self.config.max_trades_per_day <= 0:
             return False  # unlimited — never "done"
         today = datetime.now(timezone.utc).date()
-        today_count = sum(
-            1 for t in self.all_trades
-            if datetime.fromtimestamp(t.created_at, tz=timezone.utc).date() == today
+        today_count = self.ctx.lifecycle_manager.count_trades_created_on(
+            self._strategy_id, today,
         )
         return today_count >= self.config.max_trades_per_day
 
@@ -664,42 +767,69 @@ class StrategyRunner:
         # by LifecycleEngine on its own tick, which also runs from callbacks).
         if hasattr(self.ctx, 'auth') and hasattr(self.ctx.auth, 'reachable'):
             if not self.ctx.auth.reachable:
-                logger.debug(f"[{self._strategy_id}] exchange unreachable — skipping entry")
+                logger.debug("[%s] exchange unreachable — skipping entry", self._strategy_id)
                 return
 
-        if not self._enabled:
-            return
-
         now = time.time()
-        if now - self._last_check_time < self.config.check_interval_seconds:
+        if now - self._last_check_time < self._check_interval():
             return
         self._last_check_time = now
 
-        # Log active-trade PnL summary (brief, once per check interval)
-        for trade in self.active_trades:
-            if trade.state == TradeState.OPEN:
-                pnl = trade.structure_pnl(account)
-                hold = trade.hold_seconds or 0
-                logger.debug(
-                    f"[{self._strategy_id}] trade {trade.id} OPEN "
-                    f"hold={hold:.0f}s PnL={pnl:+.4f}"
-                )
+        # Log active-trade PnL summary (brief, once per check interval).
+        # The PnL is computed for this line only — skip unless shown.
+        if logger.isEnabledFor(logging.DEBUG):
+            for trade in self.active_trades:
+                if trade.state == TradeState.OPEN:
+                    logger.debug(
+                        "[%s] trade %s OPEN hold=%.0fs PnL=%+.4f",
+                        self._strategy_id, trade.id,
+                        trade.hold_seconds or 0, trade.structure_pnl(account),
+                    )
 
-        if self._should_open(account):
+        should_open = self._should_open(account)
+        self._record_outcome(should_open)
+        if should_open:
             self._open_trade()
 
+    def _check_interval(self) -> float:
+        """Current entry-evaluation interval (stretched while idle)."""
+        interval = self.config.check_interval_seconds
+        if self.config.adaptive_check_interval and self._consecutive_misses >= _IDLE_MISSES:
+            return interval * _IDLE_BACKOFF
+        return interval
+
+    def _record_outcome(self, passed: bool) -> None:
+        """Track entry-gate outcomes for the adaptive check interval."""
+        if not passed:
+            self._consecutive_misses += 1
+            return
+        if self.config.adaptive_check_interval and self._consecutive_misses >= _IDLE_MISSES:
+            logger.debug(f"[{self._strategy_id}] entry gates passed — check interval reset")
+        self._consecutive_misses = 0
+
     # -- Entry Evaluation -----------------------------------------------------
 
     def _should_open(self, account: AccountSnapshot) -> bool:
-        """Evaluate all entry gates.  All must pass to open."""
-        logger.debug(f"[{self._strategy_id}] evaluating entry conditions...")
+        """Evaluate all entry gates.  All must pass to open.
+
+        The UTC clock is read once and pinned for every gate evaluated
+        during this call (see _utc_now).
+        """
+        _eval_clock.now = datetime.now(timezone.utc)
+        try:
+            return self._evaluate_entry_gates(account)
+        finally:
+            _eval_clock.now = None
+
+    def _evaluate_entry_gates(self, account: AccountSnapshot) -> bool:
+        logger.debug("[%s] evaluating entry conditions...", self._strategy_id)
 
         # Gate 1: max concurrent trades
         active = self.active_trades
         if len(active) >= self.config.max_concurrent_trades:
             logger.debug(
-                f"[{self._strategy_id}] max_concurrent_trades "
-                f"({len(active)}/{self.config.max_concurrent_trades}) — skip"
+                "[%s] max_concurrent_trades (%d/%d) — skip",
+                self._strategy_id, len(active), self.config.max_concurrent_trades,
             )
             return False
 
@@ -711,31 +841,42 @@ class StrategyRunner:
                 elapsed = time.time() - last_created
                 if elapsed < self.config.cooldown_seconds:
                     logger.debug(
-                        f"[{self._strategy_id}] cooldown "
-                        f"({elapsed:.0f}/{self.config.cooldown_seconds:.0f}s) — skip"
+                        "[%s] cooldown (%.0f/%.0fs) — skip",
+                        self._strategy_id, elapsed, self.config.cooldown_seconds,
                     )
                     return False
 
         # Gate 3: max trades per calendar day (UTC)
         if self.config.max_trades_per_day > 0:
-            today = datetime.now(timezone.utc).date()
-            today_count = sum(
-                1 for t in self.all_trades
-                if datetime.fromtimestamp(t.created_at, tz=timezone.utc).date() == today
+            today = _utc_now().date()
+            today_count = self.ctx.lifecycle_manager.count_trades_created_on(
+                self._strategy_id, today,
             )
             if today_count >= self.config.max_trades_per_day:
                 logger.debug(
-                    f"[{self._strategy_id}] max_trades_per_day "
-                    f"({today_count}/{self.config.max_trades_per_day}) — skip"
+                    "[%s] max_trades_per_day (%d/%d) — skip",
+                    self._strategy_id, today_count, self.config.max_trades_per_day,
+                )
+                return False
+
+        # Gate 4: calendar gates, pre-combined into one bitmask
+        if self._schedule_mask is not None:
+            now = _utc_now()
+            if not (self._schedule_mask[now.weekday()] >> now.hour) & 1:
+                logger.debug(
+                    "[%s] entry blocked by schedule (%s)",
+                    self._strategy_id, self._schedule_names,
                 )
                 return False
 
-        # Gate 4: user-defined entry conditions (all must pass)
-        for cond in self.config.entry_conditions:
+        # Gate 5: user-defined entry conditions (all must pass, cheapest first)
+        for cond in self._entry_conditions:
             try:
                 if not cond(account):
-                    cond_name = getattr(cond, "__name__", repr(cond))
-                    logger.debug(f"[{self._strategy_id}] entry blocked by {cond_name}")
+                    logger.debug(
+                        "[%s] entry blocked by %s",
+                        self._strategy_id, getattr(cond, "__name__", None) or repr(cond),
+                    )
                     return False
             except Exception as e:
                 logger.error(f"[{self._strategy_id}] entry condition error: {e}")
@@ -773,6 +914,7 @@ class StrategyRunner:
                 strategy_id=self._strategy_id,
                 metadata={"strategy": self._strategy_id, **self.config.metadata},
             )
+            self._open_ids.add(trade.id)
 
             # Resolve named execution profile → stash on trade for Router
             if self.config.execution_profile:
@@ -821,7 +963,7 @@ class StrategyRunner:
         all_t = self.all_trades
         lines = [
             f"Strategy: {self._strategy_id}",
-            f"  Enabled: {self._enabled}",
+            f"  Enabled: {self.enabled}",
             f"  Active trades: {len(active)}/{self.config.max_concurrent_trades}",
             f"  Total trades: {len(all_t)}",
         ]
@@ -855,31 +997,76 @@ class StrategyRunner:
         Detect trades that transitioned to CLOSED or FAILED since the last tick.
         Fire the on_trade_closed callback for each newly-closed trade.
         Persist completed trades to history log if persistence is available.
+
+        Only trades in _open_ids are looked at, so the cost is bounded by
+        the open trades rather than the whole history.  The first call
+        scans all_trades once to pick up trades restored at startup.
         """
-        for trade in self.all_trades:
-            if trade.state in (TradeState.CLOSED, TradeState.FAILED):
-                if trade.id not in self._known_closed_ids:
-                    self._known_closed_ids.add(trade.id)
-                    pnl = trade.realized_pnl if trade.realized_pnl is not None else 0.0
-                    logger.info(
-                        f"[{self._strategy_id}] trade {trade.id} → {trade.state.value} "
-                        f"(PnL={pnl:+.4f})"
+        if self._open_ids_synced:
+            lm = self.ctx.lifecycle_manager
+            trades = [lm.get(trade_id) for trade_id in self._open_ids]
+        else:
+            trades = self.all_trades
+            self._open_ids_synced = True
+
+        still_open = set()
+        for trade in trades:
+            if trade is None:
+                continue
+            if trade.state not in (TradeState.CLOSED, TradeState.FAILED):
+                still_open.add(trade.id)
+                continue
+            if trade.id in self._known_closed_ids:
+                continue
+            self._record_closed(trade)
+            pnl = trade.realized_pnl if trade.realized_pnl is not None else 0.0
+            logger.info(
+                f"[{self._strategy_id}] trade {trade.id} → {trade.state.value} "
+                f"(PnL={pnl:+.4f})"
+            )
+            # Persist to trade history log
+            if self.ctx.persistence and trade.state == TradeState.CLOSED:
+                try:
+                    self.ctx.persistence.save_completed_trade(trade)
+                except Exception as e:
+                    logger.error(
+                        f"[{self._strategy_id}] failed to persist trade {trade.id}: {e}"
+                    )
+            if self.config.on_trade_closed:
+                try:
+                    self.config.on_trade_closed(trade, account)
+                except Exception as e:
+                    logger.error(
+                        f"[{self._strategy_id}] on_trade_closed callback error: {e}"
                     )
-                    # Persist to trade history log
-                    if self.ctx.persistence and trade.state == TradeState.CLOSED:
-                        try:
-                            self.ctx.persistence.save_completed_trade(trade)
-                        except Exception as e:
-                            logger.error(
-                                f"[{self._strategy_id}] failed to persist trade {trade.id}: {e}"
-                            )
-                    if self.config.on_trade_closed:
-                        try:
-                            self.config.on_trade_closed(trade, account)
-                        except Exception as e:
-                            logger.error(
-                                f"[{self._strategy_id}] on_trade_closed callback error: {e}"
-                            )
+        self._open_ids = still_open
+
+    def _record_closed(self, trade: TradeLifecycle) -> None:
+        """
+        Mark a CLOSED/FAILED trade as handled and fold it into the stats.
+
+        Also called at startup for trades recovered already closed, so
+        their callbacks don't re-fire but they still count in stats.
+        """
+        if trade.id in self._known_closed_ids:
+            return
+        self._known_closed_ids.add(trade.id)
+        if trade.state != TradeState.CLOSED:
+            return
+        pnl = trade.realized_pnl if trade.realized_pnl is not None else 0.0
+        self._closed_count += 1
+        self._total_pnl += pnl
+        if pnl > 0:
+            self._wins += 1
+        elif pnl < 0:
+            self._losses += 1
+        if trade.opened_at is not None:
+            # Fixed at close time: hold_seconds keeps growing after close
+            self._total_hold += (trade.closed_at or time.time()) - trade.opened_at
+        day = datetime.fromtimestamp(trade.created_at, tz=timezone.utc).date()
+        bucket = self._closed_by_day.setdefault(day, [0, 0.0])
+        bucket[0] += 1
+        bucket[1] += pnl
 
     # -- Stats ----------------------------------------------------------------
 
@@ -890,45 +1077,20 @@ class StrategyRunner:
 
         Returns a dict with keys: total, wins, losses, win_rate,
         total_pnl, avg_hold_seconds, today_trades, today_pnl.
+        Read from running totals kept by _record_closed(), so the cost
+        does not grow with the trade history.
         """
-        closed = [
-            t for t in self.all_trades if t.state == TradeState.CLOSED
-        ]
-        if not closed:
-            return {
-                "total": 0, "wins": 0, "losses": 0, "win_rate": 0.0,
-                "total_pnl": 0.0, "avg_hold_seconds": 0.0,
-                "today_trades": 0, "today_pnl": 0.0,
-            }
-
-        total_hold = 0.0
-        total_pnl = 0.0
-        wins = 0
-        losses = 0
-        today = datetime.now(timezone.utc).date()
-        today_count = 0
-        today_pnl = 0.0
-
-        for t in closed:
-            pnl = t.realized_pnl if t.realized_pnl is not None else 0.0
-            total_pnl += pnl
-            if pnl > 0:
-                wins += 1
-            elif pnl < 0:
-                losses += 1
-            if t.hold_seconds is not None:
-                total_hold += t.hold_seconds
-            if datetime.fromtimestamp(t.created_at, tz=timezone.utc).date() == today:
-                today_count += 1
-                today_pnl += pnl
-
+        total = self._closed_count
+        today_count, today_pnl = self._closed_by_day.get(
+            datetime.now(timezone.utc).date(), (0, 0.0),
+        )
         return {
-            "total": len(closed),
-            "wins": wins,
-            "losses": losses,
-            "win_rate": wins / len(closed) if closed else 0.0,
-            "total_pnl": total_pnl,
-            "avg_hold_seconds": total_hold / len(closed) if closed else 0.0,
+            "total": total,
+            "wins": self._wins,
+            "losses": self._losses,
+            "win_rate": self._wins / total if total else 0.0,
+            "total_pnl": self._total_pnl,
+            "avg_hold_seconds": self._total_hold / total if total else 0.0,
             "today_trades": today_count,
             "today_pnl": today_pnl,
         }
@@ -0,0 +1,71 @@
+"""
+Unit tests for CoincallAuth request retries — no network calls.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from auth import CoincallAuth
+
+
+def _response(status, body=b'{"code":0}', headers=None):
+    resp = MagicMock()
+    resp.status_code = status
+    resp.content = body
+    resp.headers = headers or {}
+    if status >= 400:
+        resp.raise_for_status.side_effect = requests.HTTPError(
+            f"{status} error", response=resp,
+        )
+    return resp
+
+
+def _make_auth(*responses):
+    auth = CoincallAuth("key", "secret", "https://example.invalid")
+    auth.session = MagicMock()
+    auth.session.get.side_effect = list(responses)
+    auth.session.post.side_effect = list(responses)
+    return auth
+
+
+class TestRateLimit:
+    def test_429_honours_retry_after_then_succeeds(self):
+        auth = _make_auth(_response(429, headers={"Retry-After": "2"}), _response(200))
+        with patch("auth.time.sleep") as sleep:
+            result = auth.post("/open/option/order/create/v1", {"symbol": "X"})
+        assert result == {"code": 0}
+        assert auth.session.post.call_count == 2
+        assert sleep.call_args[0][0] == pytest.approx(2.0, abs=0.1)
+        assert auth.rate_limited_until > 0
+
+    def test_retry_after_is_capped(self):
+        auth = _make_auth(_response(429, headers={"Retry-After": "600"}), _response(200))
+        with patch("auth.time.sleep") as sleep:
+            auth.get("/open/account/summary/v1")
+        assert sleep.call_args[0][0] <= CoincallAuth._RETRY_AFTER_MAX
+
+    def test_other_4xx_not_retried(self):
+        auth = _make_auth(_response(400), _response(200))
+        with patch("auth.time.sleep") as sleep:
+            result = auth.get("/open/account/summary/v1")
+        assert result["code"] == 400
+        assert auth.session.get.call_count == 1
+        sleep.assert_not_called()
+
+
+class TestServerErrors:
+    def test_get_5xx_retried(self):
+        auth = _make_auth(_response(502), _response(200))
+        with patch("auth.time.sleep"):
+            result = auth.get("/open/account/summary/v1")
+        assert result == {"code": 0}
+        assert auth.session.get.call_count == 2
+
+    def test_post_5xx_not_resent(self):
+        auth = _make_auth(_response(502), _response(200))
+        with patch("auth.time.sleep"):
+            result = auth.post("/open/option/order/create/v1", {"symbol": "X"})
+        assert result["code"] == 502
+        assert auth.session.post.call_count == 1
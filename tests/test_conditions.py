@@ -163,6 +163,36 @@ class TestNoExistingPosition:
         cond = no_existing_position_in(["BTCUSD-28MAR26-100000-C"])
         assert cond(_account(positions=(pos,))) is False
 
+    def test_other_position_does_not_block(self):
+        pos = _position("BTCUSD-28MAR26-90000-P")
+        cond = no_existing_position_in(["BTCUSD-28MAR26-100000-C"])
+        acct = _account(positions=(pos,))
+        assert acct.position_symbols == frozenset({"BTCUSD-28MAR26-90000-P"})
+        assert cond(acct) is True
+
+    def test_get_position_by_symbol(self):
+        pos = _position("BTCUSD-28MAR26-90000-P")
+        acct = _account(positions=(pos,))
+        assert acct.get_position("BTCUSD-28MAR26-90000-P") is pos
+        assert acct.get_position("BTCUSD-28MAR26-100000-C") is None
+
+
+class TestScheduleMask:
+    def test_time_window_mask_matches_check(self):
+        from strategy import _hour_bits
+        for start, end in [(9, 17), (22, 6), (0, 24), (5, 5)]:
+            bits = _hour_bits(start, end)
+            for hour in range(24):
+                now = datetime(2026, 3, 30, hour, 30, tzinfo=timezone.utc)
+                with patch("strategy._utc_now", return_value=now):
+                    expected = time_window(start, end)(_account())
+                assert bool(bits >> hour & 1) is expected, (start, end, hour)
+
+    def test_weekday_filter_mask(self):
+        mask = weekday_filter(["sat", "sun"])._schedule
+        assert mask[:5] == (0,) * 5
+        assert mask[5] == mask[6] == (1 << 24) - 1
+
 
 class TestUtcTimeWindow:
     def test_within_window(self):
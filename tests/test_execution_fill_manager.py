@@ -4,6 +4,7 @@ Tests for execution.fill_manager.FillManager — the new typed fill manager.
 Uses mock OrderManager + MarketData (no API calls).
 """
 
+import dataclasses
 import time
 from unittest.mock import MagicMock
 
@@ -37,6 +38,9 @@ def _make_md(books=None):
         return _books.get(symbol, default_book)
 
     md.get_option_orderbook = MagicMock(side_effect=get_ob)
+    md.get_option_orderbooks = MagicMock(
+        side_effect=lambda symbols: {s: md.get_option_orderbook(s) for s in symbols}
+    )
     return md
 
 
@@ -60,7 +64,7 @@ def _make_om():
         om._orders[oid] = rec
         return rec
 
-    def poll_order(order_id):
+    def poll_order(order_id, max_age=0.0):
         return om._orders.get(order_id)
 
     def requote_order(order_id, new_price, new_qty):
@@ -80,8 +84,14 @@ def _make_om():
         return rec
 
     om.place_order = MagicMock(side_effect=place_order)
+    om.place_orders = MagicMock(
+        side_effect=lambda orders: [om.place_order(**o) for o in orders]
+    )
     om.poll_order = MagicMock(side_effect=poll_order)
     om.requote_order = MagicMock(side_effect=requote_order)
+    om.requote_orders = MagicMock(
+        side_effect=lambda requotes: [om.requote_order(*r) for r in requotes]
+    )
     om.cancel_order = MagicMock(return_value=True)
     return om
 
@@ -147,6 +157,16 @@ class TestPlaceAllSuccess:
         assert len(result.legs) == 2
         assert om.place_order.call_count == 2
 
+    def test_multi_leg_prefetches_books_together(self):
+        om, md = _make_om(), _make_md()
+        mgr = FillManager(om, md, profile=_profile(), direction="open")
+        legs = _legs(("CALL", 0.1, "sell"), ("PUT", 0.1, "sell"))
+
+        mgr.place_all(legs, lifecycle_id="T1", purpose=OrderPurpose.OPEN_LEG)
+
+        md.get_option_orderbooks.assert_called_once_with(["CALL", "PUT"])
+        assert md.get_option_orderbook.call_count == 2  # via the prefetch only
+
     def test_order_id_written_back(self):
         om, md = _make_om(), _make_md()
         mgr = FillManager(om, md, profile=_profile(), direction="open")
@@ -253,14 +273,14 @@ class TestPlaceAllBestEffort:
 class TestImmediateFill:
     def test_immediate_fill_returns_filled(self):
         om = MagicMock()
-        om.place_order = MagicMock(return_value=OrderRecord(
+        om.place_orders = MagicMock(return_value=[OrderRecord(
             order_id="ORD-1", client_order_id="1", lifecycle_id="T1",
             leg_index=0, purpose=OrderPurpose.OPEN_LEG,
             symbol="SYM", side="sell", qty=0.1, price=0.01,
             status=OrderStatus.FILLED, filled_qty=0.1,
             avg_fill_price=0.01, placed_at=time.time(),
             fee=Price(0.0003, Currency.BTC),
-        ))
+        )])
         md = _make_md()
         mgr = FillManager(om, md, profile=_profile(), direction="open")
 
@@ -320,7 +340,7 @@ class TestCheckPhaseAdvance:
         legs = _legs(("SYM", 0.1, "sell"))
         mgr.place_all(legs, lifecycle_id="T1", purpose=OrderPurpose.OPEN_LEG)
 
-        mgr._phase_started_at = time.time() - 15  # phase 1 expired
+        mgr._phase_started_at = time.monotonic() - 15  # phase 1 expired
 
         result = mgr.check()
         assert result.status == FillStatus.REQUOTED
@@ -335,12 +355,31 @@ class TestCheckPhaseAdvance:
         legs = _legs(("SYM", 0.1, "sell"))
         mgr.place_all(legs, lifecycle_id="T1", purpose=OrderPurpose.OPEN_LEG)
 
-        mgr._last_reprice_at = time.time() - 20
-        mgr._phase_started_at = time.time() - 20
+        mgr._last_reprice_at = time.monotonic() - 20
+        mgr._phase_started_at = time.monotonic() - 20
 
         result = mgr.check()
         assert result.status in (FillStatus.REQUOTED, FillStatus.PENDING)
 
+    def test_phase_advance_requotes_legs_in_one_batch(self):
+        om, md = _make_om(), _make_md()
+        profile = _profile(phases=[
+            PhaseConfig(pricing="fair", duration_seconds=10, reprice_interval=999),
+            PhaseConfig(pricing="aggressive", duration_seconds=30),
+        ])
+        mgr = FillManager(om, md, profile=profile, direction="open")
+        legs = _legs(("CALL", 0.1, "sell"), ("PUT", 0.1, "sell"))
+        mgr.place_all(legs, lifecycle_id="T1", purpose=OrderPurpose.OPEN_LEG)
+        old_ids = [leg.order_id for leg in legs]
+
+        mgr._phase_started_at = time.monotonic() - 15
+        mgr.check()
+
+        om.requote_orders.assert_called_once()
+        requoted = [r[0] for r in om.requote_orders.call_args[0][0]]
+        assert requoted == old_ids
+        assert all(ls.requote_count == 1 for ls in mgr._legs)
+
 
 # =============================================================================
 # check — FAILED + grace tick
@@ -355,7 +394,7 @@ class TestCheckFailed:
         mgr.place_all(legs, lifecycle_id="T1", purpose=OrderPurpose.OPEN_LEG)
 
         # Simulate all phases exhausted
-        mgr._phase_started_at = time.time() - 15
+        mgr._phase_started_at = time.monotonic() - 15
         mgr._phase_index = 1  # past last phase
 
         # First call: grace tick → PENDING
@@ -375,7 +414,7 @@ class TestCheckFailed:
         mgr.place_all(legs, lifecycle_id="T1", purpose=OrderPurpose.OPEN_LEG)
 
         oid = legs[0].order_id
-        mgr._phase_started_at = time.time() - 15
+        mgr._phase_started_at = time.monotonic() - 15
         mgr._phase_index = 1
 
         # Grace tick
@@ -389,6 +428,27 @@ class TestCheckFailed:
         r2 = mgr.check()
         assert r2.status == FillStatus.FILLED
 
+    def test_last_chance_poll_skips_cached_records(self):
+        om, md = _make_om(), _make_md()
+        profile = _profile(phases=[PhaseConfig(pricing="aggressive", duration_seconds=10)])
+        mgr = FillManager(om, md, profile=profile, direction="open")
+        legs = _legs(("SYM", 0.1, "sell"))
+        mgr.place_all(legs, lifecycle_id="T1", purpose=OrderPurpose.OPEN_LEG)
+
+        oid = legs[0].order_id
+        mgr._phase_started_at = time.monotonic() - 15
+        mgr._phase_index = 1
+        assert mgr.check().status == FillStatus.PENDING
+
+        # The fill is only visible to a fresh exchange query
+        fresh = dataclasses.replace(om._records[oid], filled_qty=0.1)
+        om.poll_order.side_effect = (
+            lambda order_id, max_age=0.0: om._records[order_id] if max_age else fresh
+        )
+
+        assert mgr.check().status == FillStatus.FILLED
+        assert om.poll_order.call_args.kwargs["max_age"] == 0
+
 
 # =============================================================================
 # cancel_all
@@ -470,13 +530,13 @@ class TestFeeCapture:
     def test_fee_from_immediate_fill(self):
         om = MagicMock()
         fee = Price(0.0005, Currency.BTC)
-        om.place_order = MagicMock(return_value=OrderRecord(
+        om.place_orders = MagicMock(return_value=[OrderRecord(
             order_id="ORD-1", client_order_id="1", lifecycle_id="T1",
             leg_index=0, purpose=OrderPurpose.OPEN_LEG,
             symbol="SYM", side="sell", qty=0.1, price=0.01,
             status=OrderStatus.PENDING, placed_at=time.time(),
             fee=fee,
-        ))
+        )])
         md = _make_md()
         mgr = FillManager(om, md, profile=_profile(), direction="open")
 
@@ -544,6 +604,18 @@ class TestBridge:
         mgr = FillManager(om, md, params=params, direction="open")
         assert mgr._profile.name == "_bridged"
 
+    def test_poll_interval_bridged_and_registered(self):
+        from trade_execution import ExecutionParams
+
+        om, md = _make_om(), _make_md()
+        params = ExecutionParams(poll_interval_seconds=60.0)
+        assert _bridge_params_to_profile(params).poll_interval_seconds == 60.0
+
+        mgr = FillManager(om, md, params=params, direction="open")
+        mgr.place_all(_legs(("SYM", 0.1, "buy")), lifecycle_id="T1",
+                      purpose=OrderPurpose.OPEN_LEG)
+        om.set_poll_interval.assert_called_once_with("T1", 60.0)
+
 
 # =============================================================================
 # _make_result correctness
@@ -36,6 +36,18 @@ class TestPhaseConfig:
 
 
 class TestLoadProfiles:
+    def test_parse_cached_until_file_changes(self, tmp_path):
+        path = tmp_path / "profiles.toml"
+        path.write_text('[profile.a]\nrfq_mode = "never"\n')
+        first = load_profiles(str(path))
+        second = load_profiles(str(path))
+        assert first["a"] is not second["a"]  # fresh objects each call
+        path.write_text('[profile.a]\nrfq_mode = "always"\n[profile.b]\n')
+        os.utime(path, ns=(1, 1))
+        reloaded = load_profiles(str(path))
+        assert reloaded["a"].rfq_mode == "always"
+        assert "b" in reloaded
+
     def test_loads_all_profiles(self):
         profiles = load_profiles(TOML_PATH)
         assert "passive_open_3phase" in profiles
@@ -30,6 +30,9 @@ def _make_md():
         "_index_price": 50000.0,
     })
     md.get_option_details = MagicMock(return_value={"markPrice": 0.0105})
+    md.get_option_orderbooks = MagicMock(
+        side_effect=lambda symbols: {s: md.get_option_orderbook(s) for s in symbols}
+    )
     return md
 
 
@@ -49,6 +52,9 @@ def _make_om():
         )
 
     om.place_order = MagicMock(side_effect=place_order)
+    om.place_orders = MagicMock(
+        side_effect=lambda orders: [om.place_order(**o) for o in orders]
+    )
     om.poll_order = MagicMock(return_value=None)
     om.cancel_order = MagicMock(return_value=True)
     om.get_live_orders = MagicMock(return_value=[])
@@ -167,6 +173,49 @@ class TestModeDetection:
         router.open(trade)
         assert trade.execution_mode == "limit"
 
+    def test_notional_fetches_each_symbol_once(self):
+        router, om, md = _make_router()
+        legs = [
+            TradeLeg(symbol="C", qty=0.1, side="sell"),
+            TradeLeg(symbol="C", qty=0.2, side="sell"),
+            TradeLeg(symbol="P", qty=0.1, side="sell"),
+        ]
+
+        notional = router._calculate_notional(legs)
+
+        md.get_option_orderbooks.assert_called_once_with(["C", "P"])
+        assert md.get_option_orderbook.call_count == 2
+        assert notional == pytest.approx(0.0105 * 0.4)
+
+    def test_estimated_notional_skips_orderbook_fetch(self):
+        router, om, md = _make_router()
+        trade = _make_trade(
+            execution_mode=None,
+            open_legs=[
+                TradeLeg(symbol="C", qty=0.1, side="sell"),
+                TradeLeg(symbol="P", qty=0.1, side="sell"),
+            ],
+            metadata={"estimated_notional": 100000.0},
+        )
+
+        assert router._determine_execution_mode(trade) == "rfq"
+        md.get_option_orderbooks.assert_not_called()
+        md.get_option_orderbook.assert_not_called()
+
+    def test_invalid_estimated_notional_falls_back_to_books(self):
+        router, om, md = _make_router()
+        trade = _make_trade(
+            execution_mode=None,
+            open_legs=[
+                TradeLeg(symbol="C", qty=0.1, side="sell"),
+                TradeLeg(symbol="P", qty=0.1, side="sell"),
+            ],
+            metadata={"estimated_notional": "lots"},
+        )
+
+        assert router._determine_execution_mode(trade) == "limit"
+        md.get_option_orderbooks.assert_called_once_with(["C", "P"])
+
 
 # =============================================================================
 # close — limit mode
@@ -328,9 +377,23 @@ class TestOpenRFQ:
         assert result.status == FillStatus.FAILED
         assert trade.state == TradeState.FAILED
 
+    def test_close_reuses_open_rfq_legs(self):
+        router, om, md = _make_router()
+        legs = [
+            TradeLeg(symbol="SYM-C", qty=0.1, side="sell"),
+            TradeLeg(symbol="SYM-P", qty=0.1, side="sell"),
+        ]
+        trade = _make_trade(open_legs=legs, execution_mode="rfq")
+
+        opened = router._rfq_legs(trade)
+        legs[0].filled_qty = 0.1
+        legs[1].filled_qty = 0.05
+        closing = router._rfq_legs(trade, filled=True)
+
+        assert closing[0] is opened[0]
+        assert closing[1].qty == 0.05
+        assert closing[1].side == "SELL"
 
-# =============================================================================
-# resolve_profile
 # =============================================================================
 
 class TestResolveProfile:
@@ -374,7 +437,7 @@ class TestCancelPlacedOrders:
 
         router.cancel_placed_orders([leg1, leg2])
 
-        om.cancel_order.assert_called_once_with("ORD-1")
+        om.cancel_orders.assert_called_once_with(["ORD-1"])
 
     def test_skips_legs_without_order_id(self):
         router, om, md = _make_router()
@@ -382,4 +445,4 @@ class TestCancelPlacedOrders:
 
         router.cancel_placed_orders([leg])
 
-        om.cancel_order.assert_not_called()
+        om.cancel_orders.assert_not_called()
@@ -5,6 +5,7 @@ Patches Router and OrderManager to test state transitions
 without exchange calls.
 """
 
+import itertools
 import time
 from unittest.mock import MagicMock, patch, PropertyMock
 
@@ -84,6 +85,17 @@ class TestCreate:
         legs = [TradeLeg(symbol="SYM-C", qty=0.1, side="buy")]
         trade = engine.create(legs=legs, metadata={"key": "val"})
         assert trade.metadata["key"] == "val"
+        assert trade.rfq_params is None
+
+    def test_create_promotes_legacy_rfq_metadata(self):
+        engine, router, om = make_engine()
+        legs = [TradeLeg(symbol="SYM-C", qty=0.1, side="buy")]
+        trade = engine.create(
+            legs=legs, metadata={"rfq_timeout_seconds": 120, "rfq_fallback": "limit"},
+        )
+        assert trade.rfq_params.timeout_seconds == 120
+        assert trade.rfq_params.min_improvement_pct == -999.0
+        assert trade.rfq_params.fallback_mode == "limit"
 
 
 # =============================================================================
@@ -162,6 +174,39 @@ class TestTradeAccess:
         assert len(active) == 1
         assert active[0].id == t1.id
 
+    def test_active_index_drops_finished_trades(self):
+        engine, router, om = make_engine()
+        legs = [TradeLeg(symbol="SYM-C", qty=0.1, side="buy")]
+        t1 = engine.create(legs=legs)
+        t2 = engine.create(legs=legs)
+        t1.state = TradeState.FAILED
+        assert engine.active_trades == [t2]
+        assert list(engine._active_ids) == [t2.id]
+
+        closed = TradeLifecycle(state=TradeState.CLOSED, open_legs=legs)
+        engine.restore_trade(closed)
+        assert engine.active_trades == [t2]
+        assert engine.get(closed.id) is closed
+
+    def test_create_many(self):
+        engine, router, om = make_engine()
+        legs = [TradeLeg(symbol="SYM-C", qty=0.1, side="buy")]
+        trades = engine.create_many([
+            {"legs": legs, "strategy_id": "s"},
+            {"legs": legs, "strategy_id": "s", "execution_mode": "limit"},
+        ])
+        assert [t.state for t in trades] == [TradeState.PENDING_OPEN] * 2
+        assert trades[1].execution_mode == "limit"
+        assert engine.get_trades_for_strategy("s") == trades
+        assert engine.create_many([]) == []
+
+    def test_create_many_bad_spec_registers_nothing(self):
+        engine, router, om = make_engine()
+        legs = [TradeLeg(symbol="SYM-C", qty=0.1, side="buy")]
+        with pytest.raises(TypeError):
+            engine.create_many([{"legs": legs}, {"legs": legs, "bogus": 1}])
+        assert engine.all_trades == []
+
     def test_get_by_id(self):
         engine, router, om = make_engine()
         legs = [TradeLeg(symbol="SYM-C", qty=0.1, side="buy")]
@@ -187,6 +232,54 @@ class TestTradeAccess:
         result = engine.active_trades_for_strategy("s")
         assert len(result) == 1
 
+    def test_active_trades_for_strategy_walks_active_index(self):
+        engine, router, om = make_engine()
+        legs = [TradeLeg(symbol="SYM-C", qty=0.1, side="buy")]
+        for _ in range(3):
+            engine.restore_trade(TradeLifecycle(
+                state=TradeState.CLOSED, open_legs=legs, strategy_id="s",
+            ))
+        live = engine.create(legs=legs, strategy_id="s")
+        other = engine.create(legs=legs, strategy_id="other")
+        assert engine.active_trades_for_strategy("s") == [live]
+        other.state = TradeState.CLOSED
+        assert engine.active_trades_for_strategy("other") == []
+
+    def test_count_trades_created_on(self):
+        from datetime import datetime, timezone, timedelta
+        engine, router, om = make_engine()
+        legs = [TradeLeg(symbol="SYM-C", qty=0.1, side="buy")]
+        engine.create(legs=legs, strategy_id="s")
+        engine.create(legs=legs, strategy_id="s")
+        engine.create(legs=legs, strategy_id="other")
+        today = datetime.now(timezone.utc).date()
+        assert engine.count_trades_created_on("s", today) == 2
+        assert engine.count_trades_created_on("s", today - timedelta(days=1)) == 0
+        assert engine.count_trades_created_on("missing", today) == 0
+
+    def test_restored_trade_from_yesterday_not_counted_today(self):
+        from datetime import datetime, timezone
+        engine, router, om = make_engine()
+        old = TradeLifecycle(
+            open_legs=[TradeLeg(symbol="SYM-C", qty=0.1, side="buy")],
+            strategy_id="s", created_at=time.time() - 2 * 86400,
+        )
+        engine.create(legs=[TradeLeg(symbol="SYM-C", qty=0.1, side="buy")], strategy_id="s")
+        engine.restore_trade(old)
+        today = datetime.now(timezone.utc).date()
+        assert engine.count_trades_created_on("s", today) == 1
+        assert len(engine.get_trades_for_strategy("s")) == 2
+
+    def test_restore_same_id_does_not_duplicate(self):
+        engine, router, om = make_engine()
+        trade = TradeLifecycle(
+            open_legs=[TradeLeg(symbol="SYM-C", qty=0.1, side="buy")],
+            strategy_id="s",
+        )
+        engine.restore_trade(trade)
+        engine.restore_trade(trade)
+        assert len(engine.get_trades_for_strategy("s")) == 1
+
 
 # =============================================================================
 # restore_trade
@@ -296,6 +389,24 @@ class TestTick:
 
         assert trade.state == TradeState.CLOSED
 
+    def test_tick_uses_one_clock_reading(self):
+        engine, router, om = make_engine()
+        legs = [TradeLeg(symbol="BTC-1JAN20-50000-C", qty=0.1, side="buy",
+                         fill_price=0.01, filled_qty=0.1)]
+        trades = [engine.create(legs=list(legs)) for _ in range(2)]
+        for t in trades:
+            t.state = TradeState.OPEN
+            t.opened_at = 1.0
+
+        # Every clock read advances one second
+        clock = itertools.count(time.time())
+        with patch("lifecycle_engine.time.time", side_effect=lambda: next(clock)):
+            engine.tick(make_account())
+
+        assert [t.state for t in trades] == [TradeState.CLOSED] * 2
+        assert trades[0].closed_at == trades[1].closed_at
+        assert engine._tick_now is None
+
 
 # =============================================================================
 # force_close
@@ -337,6 +448,35 @@ class TestCancel:
         assert result is True
         assert trade.state == TradeState.FAILED
 
+    def test_cancel_batches_unfilled_orders(self):
+        engine, router, om = make_engine()
+        engine._executor.cancel_orders = MagicMock(return_value=[True, True])
+        legs = [
+            TradeLeg(symbol="SYM-C", qty=0.1, side="buy", order_id="A"),
+            TradeLeg(symbol="SYM-P", qty=0.1, side="buy", order_id="B"),
+            TradeLeg(symbol="SYM-X", qty=0.1, side="buy"),
+        ]
+        trade = engine.create(legs=legs)
+        trade.state = TradeState.OPENING
+
+        assert engine.cancel(trade.id) is True
+        engine._executor.cancel_orders.assert_called_once_with(["A", "B"])
+        assert trade.state == TradeState.FAILED
+
+    def test_unconfirmed_batch_cancels_are_retried(self):
+        engine, router, om = make_engine()
+        engine._executor.cancel_orders = MagicMock(return_value=[False, True, False])
+        engine._executor._cancel_fail_ids.add("C")
+        legs = [
+            TradeLeg(symbol="SYM-A", qty=0.1, side="buy", order_id="A"),
+            TradeLeg(symbol="SYM-B", qty=0.1, side="buy", order_id="B"),
+            TradeLeg(symbol="SYM-C", qty=0.1, side="buy", order_id="C"),
+        ]
+
+        assert engine._cancel_leg_orders(legs) == ["B", "A"]
+        retried = [c[1]["order_id"] for c in engine._executor.calls if c[0] == "cancel_order"]
+        assert retried == ["A", "C"]
+
 
 # =============================================================================
 # kill_all
@@ -352,3 +492,184 @@ class TestKillAll:
         t2.state = TradeState.OPENING
         killed = engine.kill_all()
         assert killed == 2
+
+
+# =============================================================================
+# Snapshot persistence
+# =============================================================================
+
+class TestPersistSnapshot:
+    def test_snapshot_round_trips(self, tmp_path, monkeypatch):
+        import json
+        monkeypatch.chdir(tmp_path)
+        engine, router, om = make_engine()
+        t1 = engine.create(legs=[TradeLeg(symbol="SYM-C", qty=0.1, side="buy")], strategy_id="s1")
+        t2 = engine.create(legs=[TradeLeg(symbol="SYM-P", qty=0.2, side="sell")], strategy_id="s2")
+        engine._persist_all_trades(wait=True)
+        with open(tmp_path / "logs" / "trades_snapshot.json") as f:
+            data = json.load(f)
+        assert "timestamp" in data
+        assert [t["id"] for t in data["trades"]] == [t1.id, t2.id]
+        restored = TradeLifecycle.from_dict(data["trades"][1])
+        assert restored.open_legs[0].symbol == "SYM-P"
+
+    def test_empty_snapshot_is_valid_json(self, tmp_path, monkeypatch):
+        import json
+        monkeypatch.chdir(tmp_path)
+        engine, router, om = make_engine()
+        engine._persist_all_trades(wait=True)
+        with open(tmp_path / "logs" / "trades_snapshot.json") as f:
+            assert json.load(f)["trades"] == []
+
+    def test_background_write_lands_on_disk(self, tmp_path, monkeypatch):
+        import json
+        monkeypatch.chdir(tmp_path)
+        engine, router, om = make_engine()
+        trade = engine.create(legs=[TradeLeg(symbol="SYM-C", qty=0.1, side="buy")])
+        engine._persist_all_trades()
+        deadline = time.time() + 2.0
+        while engine._persist_written_seq < engine._persist_seq and time.time() < deadline:
+            time.sleep(0.01)
+        with open(tmp_path / "logs" / "trades_snapshot.json") as f:
+            assert json.load(f)["trades"][0]["id"] == trade.id
+
+    def test_failed_write_keeps_previous_snapshot(self, tmp_path, monkeypatch):
+        import json
+        import os
+        monkeypatch.chdir(tmp_path)
+        engine, router, om = make_engine()
+        engine._write_snapshot((1, 0.0, [b'{"id":"good"}']))
+
+        def boom(src, dst):
+            raise OSError("disk full")
+        monkeypatch.setattr(os, "replace", boom)
+        engine._write_snapshot((2, 0.0, [b'{"id":"lost"}']))
+        with open(tmp_path / "logs" / "trades_snapshot.json") as f:
+            assert json.load(f)["trades"] == [{"id": "good"}]
+        assert os.listdir(tmp_path / "logs") == ["trades_snapshot.json"]
+        assert engine._persist_written_seq == 1
+
+    def test_failed_write_allows_requeue_of_same_snapshot(self, tmp_path, monkeypatch):
+        import os
+        monkeypatch.chdir(tmp_path)
+        engine, router, om = make_engine()
+        monkeypatch.setattr(engine, "_ensure_persist_thread", lambda: None)
+        engine.create(legs=[TradeLeg(symbol="SYM-C", qty=0.1, side="buy")])
+
+        engine._persist_all_trades()
+        payload = engine._persist_queue.get_nowait()
+
+        def boom(src, dst):
+            raise OSError("disk full")
+        monkeypatch.setattr(os, "replace", boom)
+        engine._write_snapshot(payload)
+
+        engine._persist_all_trades()
+        assert not engine._persist_queue.empty()
+
+    def test_stale_snapshot_not_written_over_newer(self, tmp_path, monkeypatch):
+        import json
+        monkeypatch.chdir(tmp_path)
+        engine, router, om = make_engine()
+        engine._write_snapshot((2, 0.0, [b'{"id":"new"}']))
+        engine._write_snapshot((1, 0.0, [b'{"id":"old"}']))
+        with open(tmp_path / "logs" / "trades_snapshot.json") as f:
+            assert json.load(f)["trades"] == [{"id": "new"}]
+
+    def test_newer_snapshot_written_during_io_wins(self, tmp_path, monkeypatch):
+        import json
+        import os
+        monkeypatch.chdir(tmp_path)
+        engine, router, om = make_engine()
+        real_fsync = os.fsync
+
+        def fsync_then_newer(fd):
+            real_fsync(fd)
+            monkeypatch.setattr(os, "fsync", real_fsync)
+            assert not engine._persist_lock.locked()  # tick thread isn't blocked on I/O
+            engine._write_snapshot((2, 0.0, [b'{"id":"new"}']))
+        monkeypatch.setattr(os, "fsync", fsync_then_newer)
+        engine._write_snapshot((1, 0.0, [b'{"id":"old"}']))
+
+        with open(tmp_path / "logs" / "trades_snapshot.json") as f:
+            assert json.load(f)["trades"] == [{"id": "new"}]
+        assert os.listdir(tmp_path / "logs") == ["trades_snapshot.json"]
+        assert engine._persist_written_seq == 2
+
+    def test_snapshot_without_orjson(self, tmp_path, monkeypatch):
+        import json
+        import lifecycle_engine
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(lifecycle_engine, "orjson", None)
+        engine, router, om = make_engine()
+        trade = engine.create(legs=[TradeLeg(symbol="SYM-C", qty=0.1, side="buy")])
+        engine._persist_all_trades(wait=True)
+        with open(tmp_path / "logs" / "trades_snapshot.json") as f:
+            assert json.load(f)["trades"][0]["id"] == trade.id
+
+    def test_unchanged_snapshot_not_requeued(self, monkeypatch):
+        engine, router, om = make_engine()
+        monkeypatch.setattr(engine, "_ensure_persist_thread", lambda: None)
+        trade = engine.create(legs=[TradeLeg(symbol="SYM-C", qty=0.1, side="buy")])
+
+        engine._persist_all_trades()
+        first = engine._persist_queue.get_nowait()
+        engine._persist_all_trades()
+        assert engine._persist_queue.empty()
+
+        trade.state = TradeState.FAILED
+        engine._persist_all_trades()
+        assert engine._persist_queue.get_nowait()[0] > first[0]
+        assert trade.id in engine._finished_chunks
+
+    def test_snapshot_includes_retired_and_restored_trades(self, monkeypatch):
+        import json
+        engine, router, om = make_engine()
+        monkeypatch.setattr(engine, "_ensure_persist_thread", lambda: None)
+        legs = [TradeLeg(symbol="SYM-C", qty=0.1, side="buy")]
+        live = engine.create(legs=legs)
+        done = engine.create(legs=legs)
+        done.state = TradeState.FAILED
+        assert engine.active_trades == [live]  # prunes done from the index
+        restored = TradeLifecycle(state=TradeState.CLOSED, open_legs=legs)
+        engine.restore_trade(restored)
+
+        engine._persist_all_trades()
+        _, _, chunks = engine._persist_queue.get_nowait()
+        ids = {json.loads(c)["id"] for c in chunks}
+        assert ids == {live.id, done.id, restored.id}
+        assert list(engine._active_ids) == [live.id]
+
+
+class TestLimitFillManager:
+    def test_atomic_failure_leaves_legs_unfilled(self):
+        executor = MockExecutor()
+        executor.place_orders = lambda orders: [{"orderId": "1"}, None]
+        md = MockMarketData()
+        for sym in ("SYM-A", "SYM-B"):
+            md.set_orderbook(sym, bids=[{"price": 100, "size": 1}], asks=[{"price": 110, "size": 1}])
+        fm = LimitFillManager(executor, market_data=md)
+        legs = [TradeLeg(symbol="SYM-A", qty=0.1, side="buy"),
+                TradeLeg(symbol="SYM-B", qty=0.1, side="buy")]
+
+        assert fm.place_all(legs) is False
+        assert not fm.all_filled
+
+    def test_direct_requote_only_replaces_cancelled_orders(self):
+        executor = MockExecutor()
+        md = MockMarketData()
+        for sym in ("SYM-A", "SYM-B"):
+            md.set_orderbook(sym, bids=[{"price": 100, "size": 1}], asks=[{"price": 110, "size": 1}])
+        fm = LimitFillManager(executor, market_data=md)
+        legs = [TradeLeg(symbol="SYM-A", qty=0.1, side="buy"),
+                TradeLeg(symbol="SYM-B", qty=0.1, side="buy")]
+        assert fm.place_all(legs) is True
+        kept_id, moved_id = fm.filled_legs[0].order_id, fm.filled_legs[1].order_id
+        executor._cancel_fail_ids.add(kept_id)
+
+        fm._requote_direct([(ls, 120.0) for ls in fm.filled_legs])
+
+        places = [c for c in executor.calls if c[0] == "place_order"]
+        assert [c[1]["symbol"] for c in places[2:]] == ["SYM-B"]
+        assert fm.filled_legs[0].order_id == kept_id
+        assert fm.filled_legs[1].order_id != moved_id
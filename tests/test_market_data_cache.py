@@ -0,0 +1,104 @@
+"""
+Unit tests for exchanges.cache.TTLCache and batched orderbook fetches — no
+exchange calls.
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+
+from exchanges.cache import TTLCache
+
+
+class TestGetOrFetch:
+    def test_fetches_once_then_serves_cache(self):
+        cache = TTLCache(ttl_seconds=60)
+        calls = []
+        fetch = lambda: calls.append(1) or {"bids": []}
+        assert cache.get_or_fetch("SYM", fetch) == {"bids": []}
+        assert cache.get_or_fetch("SYM", fetch) == {"bids": []}
+        assert len(calls) == 1
+
+    def test_none_not_cached(self):
+        cache = TTLCache(ttl_seconds=60)
+        calls = []
+        fetch = lambda: calls.append(1)
+        assert cache.get_or_fetch("SYM", fetch) is None
+        assert cache.get_or_fetch("SYM", fetch) is None
+        assert len(calls) == 2
+
+    def test_expired_entry_refetched(self):
+        cache = TTLCache(ttl_seconds=0.01)
+        calls = []
+        fetch = lambda: calls.append(1) or len(calls)
+        assert cache.get_or_fetch("SYM", fetch) == 1
+        time.sleep(0.02)
+        assert cache.get_or_fetch("SYM", fetch) == 2
+
+    def test_concurrent_misses_share_one_fetch(self):
+        cache = TTLCache(ttl_seconds=60)
+        calls = []
+
+        def slow_fetch():
+            calls.append(1)
+            time.sleep(0.05)
+            return {"asks": []}
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(cache.get_or_fetch("SYM", slow_fetch)))
+            for _ in range(5)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(calls) == 1
+        assert results == [{"asks": []}] * 5
+        assert cache._key_locks == {}
+
+    def test_concurrent_expiry_and_eviction(self):
+        cache = TTLCache(ttl_seconds=0, max_size=4)
+        errors = []
+
+        def churn(offset):
+            try:
+                for i in range(500):
+                    cache.set(f"K{(i + offset) % 8}", i)
+                    cache.get(f"K{i % 8}")
+            except Exception as e:  # pragma: no cover - the failure case
+                errors.append(e)
+
+        threads = [threading.Thread(target=churn, args=(n,)) for n in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert errors == []
+        assert len(cache._cache) <= 4
+
+
+class TestOrderbookBatch:
+    @staticmethod
+    def _fetch(symbols):
+        from exchanges.base import ExchangeMarketData
+
+        md = SimpleNamespace(
+            get_option_orderbook=lambda s: {"symbol": s, "thread": threading.current_thread().name},
+        )
+        return ExchangeMarketData.get_option_orderbooks(md, symbols)
+
+    def test_single_symbol_fetched_inline(self):
+        books = self._fetch(["A"])
+        assert books["A"]["thread"] == threading.current_thread().name
+
+    def test_batches_share_one_pool(self):
+        import exchanges.base as base
+
+        first = self._fetch(["A", "B", "C"])
+        pool = base._orderbook_pool
+        second = self._fetch(["D", "E"])
+        assert base._orderbook_pool is pool
+        assert list(first) == ["A", "B", "C"] and list(second) == ["D", "E"]
+        assert all(b["thread"].startswith("orderbook") for b in [*first.values(), *second.values()])
@@ -9,7 +9,7 @@ import pytest
 
 from option_selection import (
     LegSpec, resolve_legs, select_option,
-    straddle, strangle, _filter_by_expiry,
+    straddle, strangle, _filter_by_expiry, _expiry_token,
 )
 
 
@@ -87,6 +87,45 @@ class TestFilterByExpiry:
         assert len(result) == 1
         assert "29MAR26" in result[0]["symbolName"]
 
+    def test_numeric_dte_picks_matching_expiry_and_type(self):
+        from option_selection import _utc_day_start_ms
+        today = _utc_day_start_ms()
+        instruments = [
+            _make_instrument("BTCUSD-D1-90000-C", 90000, today + 86400_000 + 8 * 3600_000),
+            _make_instrument("BTCUSD-D1-90000-P", 90000, today + 86400_000 + 8 * 3600_000, "P"),
+            _make_instrument("BTCUSD-D3-90000-C", 90000, today + 3 * 86400_000 + 8 * 3600_000),
+            _make_instrument("BTCUSD-D3-95000-C", 95000, today + 3 * 86400_000 + 8 * 3600_000),
+        ]
+        result = _filter_by_expiry(instruments, {"dte": 3}, "C")
+        assert [r["symbolName"] for r in result] == ["BTCUSD-D3-90000-C", "BTCUSD-D3-95000-C"]
+        assert _filter_by_expiry(instruments, {"dte": 3}, "P") == []
+        assert _filter_by_expiry(instruments, {"dte": 2}, "C") == []
+
+    def test_utc_day_start_ms(self):
+        from datetime import datetime, timezone
+        from option_selection import _utc_day_start_ms
+        noonish = datetime(2026, 3, 29, 13, 45, tzinfo=timezone.utc).timestamp() * 1000
+        midnight = datetime(2026, 3, 29, tzinfo=timezone.utc).timestamp() * 1000
+        assert _utc_day_start_ms(noonish) == midnight
+        assert _utc_day_start_ms(midnight) == midnight
+
+    def test_expiry_token(self):
+        assert _expiry_token("BTCUSD-29MAR26-90000-C") == "29MAR26"
+        assert _expiry_token("BTCUSD") == ""
+        assert _expiry_token("BTCUSD-29MAR26") == ""
+
+    def test_index_rebuilt_when_list_grows(self):
+        import time
+        now_ms = time.time() * 1000
+        instruments = [
+            _make_instrument("BTCUSD-05APR26-90000-C", 90000, now_ms + 7 * 86400_000),
+        ]
+        assert "05APR26" in _filter_by_expiry(instruments, {"dte": "next"}, "C")[0]["symbolName"]
+        instruments.append(
+            _make_instrument("BTCUSD-29MAR26-90000-C", 90000, now_ms + 86400_000))
+        result = _filter_by_expiry(instruments, {"dte": "next"}, "C")
+        assert "29MAR26" in result[0]["symbolName"]
+
 
 # ── Structure templates ──────────────────────────────────────────────────
 
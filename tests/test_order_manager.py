@@ -274,6 +274,34 @@ class TestPollOrder:
         assert r.status == OrderStatus.FILLED
         assert r.is_terminal
 
+    def test_poll_interval_throttles_poll_all(self):
+        om, mock = fresh_om()
+        r = om.place_order(
+            lifecycle_id="trade-slow", leg_index=0, purpose=OrderPurpose.OPEN_LEG,
+            symbol="BTCUSD-28MAR26-100000-C", side="buy", qty=1.0, price=500.0,
+        )
+        om.set_poll_interval("trade-slow", 60.0)
+        om.poll_all()
+        om.poll_all()
+        assert [c[0] for c in mock.calls].count("get_order_status") == 1
+
+        om.set_poll_interval("trade-slow", 0)
+        om.poll_all()
+        assert [c[0] for c in mock.calls].count("get_order_status") == 2
+
+    def test_max_age_reuses_fresh_record(self):
+        om, mock = fresh_om()
+        r = om.place_order(
+            lifecycle_id="trade-poll", leg_index=0, purpose=OrderPurpose.OPEN_LEG,
+            symbol="BTCUSD-28MAR26-100000-C", side="buy", qty=1.0, price=500.0,
+        )
+        om.poll_all()
+        mock.calls.clear()
+        om.poll_order(r.order_id, max_age=5.0)
+        assert mock.calls == []
+        om.poll_order(r.order_id)
+        assert [c[0] for c in mock.calls] == ["get_order_status"]
+
 
 # ── Test 9: poll_all ─────────────────────────────────────────────────────
 
@@ -381,6 +409,225 @@ class TestCancelAllFor:
         assert om.has_live_orders("trade-other", OrderPurpose.OPEN_LEG)
 
 
+# ── Test 12b: Batched placement / cancellation ──────────────────────────
+
+class BatchingExecutor(MockExecutor):
+    """MockExecutor with batch endpoints, recording one call per batch."""
+
+    def place_orders(self, orders):
+        self.calls.append(("place_orders", {"count": len(orders)}))
+        return [MockExecutor.place_order(self, **o) for o in orders]
+
+    def cancel_orders(self, order_ids):
+        self.calls.append(("cancel_orders", {"order_ids": list(order_ids)}))
+        return [MockExecutor.cancel_order(self, oid) for oid in order_ids]
+
+
+def _batch_specs(lifecycle_id="trade-b", purpose=OrderPurpose.OPEN_LEG):
+    return [
+        dict(lifecycle_id=lifecycle_id, leg_index=0, purpose=purpose,
+             symbol="BTCUSD-28MAR26-100000-C", side="buy", qty=0.1, price=500.0),
+        dict(lifecycle_id=lifecycle_id, leg_index=1, purpose=purpose,
+             symbol="BTCUSD-28MAR26-90000-P", side="sell", qty=0.1, price=300.0),
+    ]
+
+
+class TestBatchPlacement:
+    def test_single_executor_call_for_batch(self):
+        mock = BatchingExecutor()
+        om = OrderManager(mock)
+        records = om.place_orders(_batch_specs())
+        assert [r.leg_index for r in records] == [0, 1]
+        assert [c[0] for c in mock.calls].count("place_orders") == 1
+        assert all(r.is_live for r in records)
+
+    def test_falls_back_to_single_placement(self):
+        om, mock = fresh_om()
+        records = om.place_orders(_batch_specs())
+        assert all(records)
+        assert [c[0] for c in mock.calls] == ["place_order", "place_order"]
+
+    def test_idempotent_entries_not_resent(self):
+        mock = BatchingExecutor()
+        om = OrderManager(mock)
+        first = om.place_orders(_batch_specs())
+        second = om.place_orders(_batch_specs())
+        assert [r.order_id for r in first] == [r.order_id for r in second]
+        assert [c[0] for c in mock.calls].count("place_orders") == 1
+
+    def test_close_legs_forced_reduce_only(self):
+        mock = BatchingExecutor()
+        om = OrderManager(mock)
+        om.place_orders(_batch_specs(purpose=OrderPurpose.CLOSE_LEG))
+        placed = [c[1] for c in mock.calls if c[0] == "place_order"]
+        assert all(p["reduce_only"] for p in placed)
+
+    def test_symbol_cap_counts_batch_entries(self):
+        mock = BatchingExecutor()
+        om = OrderManager(mock)
+        om.MAX_PENDING_PER_SYMBOL = 1
+        specs = _batch_specs()
+        specs[1]["symbol"] = specs[0]["symbol"]
+        records = om.place_orders(specs)
+        assert records[0] is not None
+        assert records[1] is None
+
+    def test_cancel_all_batched(self):
+        mock = BatchingExecutor()
+        om = OrderManager(mock)
+        records = om.place_orders(_batch_specs())
+        mock._cancel_fail_ids.add(records[1].order_id)
+        assert om.cancel_all() == 1
+        assert [c[0] for c in mock.calls].count("cancel_orders") == 1
+        assert records[0].status == OrderStatus.CANCELLED
+        assert records[1].is_live
+
+    def test_requote_orders_batches_cancel_and_place(self):
+        mock = BatchingExecutor()
+        om = OrderManager(mock)
+        r1, r2 = om.place_orders(_batch_specs())
+        mock.calls.clear()
+
+        results = om.requote_orders([
+            (r1.order_id, 510.0, None),
+            (r2.order_id, 310.0, 0.05),
+            ("nope", 1.0, None),
+        ])
+        assert results[2] is None
+        assert [r.price for r in results[:2]] == [510.0, 310.0]
+        assert results[1].qty == 0.05
+        assert r1.superseded_by == results[0].order_id
+        assert results[0].supersedes == r1.order_id
+        names = [c[0] for c in mock.calls]
+        assert names.count("cancel_orders") == 1 and names.count("place_orders") == 1
+        assert names.index("cancel_orders") < names.index("place_orders")
+
+    def test_requote_orders_skips_filled(self):
+        mock = BatchingExecutor()
+        om = OrderManager(mock)
+        r1, r2 = om.place_orders(_batch_specs())
+        mock.simulate_fill(r2.order_id, filled_qty=0.1, avg_price=299.0, full=True)
+        results = om.requote_orders([(r1.order_id, 510.0, None), (r2.order_id, 310.0, None)])
+        assert results[0] is not None
+        assert results[1] is None
+        assert r2.status == OrderStatus.FILLED
+
+    def test_requote_orders_no_replacement_when_cancel_fails(self):
+        mock = BatchingExecutor()
+        om = OrderManager(mock)
+        r1, r2 = om.place_orders(_batch_specs())
+        mock._cancel_fail_ids.add(r1.order_id)
+        results = om.requote_orders([(r1.order_id, 510.0, None), (r2.order_id, 310.0, None)])
+        assert results[0] is None
+        assert results[1] is not None
+        assert r1.superseded_by is None
+
+    def test_cancel_orders_by_id_skips_unknown_and_terminal(self):
+        mock = BatchingExecutor()
+        om = OrderManager(mock)
+        records = om.place_orders(_batch_specs())
+        om.cancel_order(records[0].order_id)
+        count = om.cancel_orders([records[0].order_id, records[1].order_id, "nope"])
+        assert count == 1
+        assert records[1].status == OrderStatus.CANCELLED
+
+
+class ListingExecutor(MockExecutor):
+    """MockExecutor whose open-order listing mirrors the pending endpoint."""
+
+    def list_open_orders(self):
+        self.calls.append(("list_open_orders", {}))
+        return {
+            oid: dict(s) for oid, s in self._order_statuses.items()
+            if s["state"] in (0, 2)
+        }
+
+
+class TestPollAllListing:
+    def test_resting_orders_polled_in_one_call(self):
+        mock = ListingExecutor()
+        om = OrderManager(mock)
+        records = om.place_orders(_batch_specs())
+        mock.simulate_fill(records[0].order_id, 0.05, 510.0, full=False)
+        mock.calls.clear()
+
+        om.poll_all()
+
+        assert [c[0] for c in mock.calls] == ["list_open_orders"]
+        assert records[0].status == OrderStatus.PARTIAL
+        assert records[0].filled_qty == 0.05
+
+    def test_missing_orders_queried_individually(self):
+        mock = ListingExecutor()
+        om = OrderManager(mock)
+        records = om.place_orders(_batch_specs())
+        mock.simulate_fill(records[1].order_id, 0.1, 300.0)
+        mock.calls.clear()
+
+        om.poll_all()
+
+        assert [c[0] for c in mock.calls] == ["list_open_orders", "get_order_status"]
+        assert records[1].status == OrderStatus.FILLED
+        assert records[0].is_live
+
+
+class LostResponseExecutor(MockExecutor):
+    """MockExecutor whose placements land but whose responses are lost."""
+
+    def __init__(self, land=True):
+        super().__init__()
+        self._land = land
+        self._by_client_id = {}
+
+    def place_order(self, **kwargs):
+        result = super().place_order(**kwargs)
+        if self._land:
+            self._by_client_id[kwargs["client_order_id"]] = result["orderId"]
+        raise ConnectionError("read timed out")
+
+    def get_order_by_client_id(self, client_order_id, symbol):
+        self.calls.append(("get_order_by_client_id", {"client_order_id": client_order_id}))
+        oid = self._by_client_id.get(client_order_id)
+        return self._order_statuses.get(oid) if oid else None
+
+
+class TestLostPlacement:
+    def test_landed_order_recovered_by_client_id(self):
+        mock = LostResponseExecutor()
+        om = OrderManager(mock)
+        record = om.place_order(
+            lifecycle_id="t1", leg_index=0, purpose=OrderPurpose.OPEN_LEG,
+            symbol="BTC-P", side="sell", qty=0.5, price=500.0,
+        )
+        assert record is not None
+        assert record.order_id == "1001"
+        assert record.is_live
+        assert mock.calls[-1] == ("get_order_by_client_id",
+                                  {"client_order_id": record.client_order_id})
+
+    def test_order_not_found_is_a_failure(self):
+        om = OrderManager(LostResponseExecutor(land=False))
+        record = om.place_order(
+            lifecycle_id="t1", leg_index=0, purpose=OrderPurpose.OPEN_LEG,
+            symbol="BTC-P", side="sell", qty=0.5, price=500.0,
+        )
+        assert record is None
+
+    def test_batch_that_raises_recovers_by_client_id(self):
+        class LostBatchExecutor(LostResponseExecutor):
+            def place_orders(self, orders):
+                for o in orders:
+                    try:
+                        self.place_order(**o)
+                    except ConnectionError:
+                        pass
+                raise KeyError(0)  # unparseable batch response
+
+        om = OrderManager(LostBatchExecutor())
+        records = om.place_orders(_batch_specs())
+        assert [r is not None and r.is_live for r in records] == [True, True]
+
+
 # ── Test 13: Persistence round-trip ──────────────────────────────────────
 
 class TestPersistence:
@@ -34,6 +34,7 @@ def _make_closer(exchange="deribit", positions=None):
     executor.place_order.return_value = {"orderId": "order-1"}
     executor.cancel_order.return_value = True
     executor.get_order_status.return_value = None
+    executor.amend_order.return_value = None  # adapter default: unsupported
 
     lm = MagicMock()
     lm.kill_all.return_value = 3
@@ -120,6 +121,25 @@ class TestSideHandling:
         _, kwargs = executor.place_order.call_args
         assert kwargs["side"] == 2    # sell = 2
 
+    def test_reprice_amends_in_place_when_supported(self):
+        closer, _, executor, _, pc = _make_closer("deribit", [_deribit_position()])
+        executor.amend_order.return_value = {"orderId": "order-1"}
+        leg = pc._CloseLeg(symbol="BTC-X", qty=0.5, close_side="buy",
+                           mark_price=0.01, order_id="order-1")
+        assert closer._place_or_reprice(leg, 0.012) is True
+        executor.amend_order.assert_called_once_with("order-1", 0.5, 0.012)
+        executor.cancel_order.assert_not_called()
+        executor.place_order.assert_not_called()
+        assert leg.order_id == "order-1"
+
+    def test_reprice_falls_back_to_cancel_replace(self):
+        closer, _, executor, _, pc = _make_closer("coincall", [_coincall_position()])
+        leg = pc._CloseLeg(symbol="BTC-X", qty=1, close_side="sell",
+                           mark_price=300, order_id="old")
+        closer._place_or_reprice(leg, 290)
+        executor.cancel_order.assert_called_once_with("old")
+        executor.place_order.assert_called_once()
+
     def test_reduce_only_always_set(self):
         closer, _, executor, _, pc = _make_closer("deribit", [_deribit_position()])
         leg = pc._CloseLeg(symbol="BTC-X", qty=0.5, close_side="buy", mark_price=0.01)
@@ -322,3 +342,70 @@ class TestFinalize:
         assert "still open" in closer.status
         summary_msg = notifier.send.call_args[0][0]
         assert "WARNING" in summary_msg
+
+
+# ─── Phase runner: adaptive fill polling ────────────────────────────────────
+
+class TestRunPhasePolling:
+
+    def test_backs_off_then_stops_when_filled(self):
+        closer, _, executor, _, pc = _make_closer("deribit")
+        leg = pc._CloseLeg(symbol="BTC-X", qty=0.5, close_side="buy", mark_price=0.01)
+        executor.get_order_status.side_effect = [
+            {"state": "open", "fillQty": 0},
+            {"state": "open", "fillQty": 0},
+            {"state": "filled", "fillQty": 0.5, "avgPrice": 0.011},
+        ]
+        clock = [1000.0]
+        sleeps = []
+
+        def fake_sleep(secs):
+            sleeps.append(secs)
+            clock[0] += secs
+
+        with patch("position_closer.time.sleep", side_effect=fake_sleep), \
+             patch("position_closer.time.time", side_effect=lambda: clock[0]):
+            closer._run_phase([leg], "phase1", duration=300, reprice_interval=30,
+                              price_fn=lambda l: l.mark_price)
+
+        assert leg.filled
+        assert sleeps == [1.0, 2.0, 4.0]  # filled after 7s instead of 30s
+
+    def test_sleep_capped_at_reprice_deadline(self):
+        closer, _, executor, _, pc = _make_closer("deribit")
+        leg = pc._CloseLeg(symbol="BTC-X", qty=0.5, close_side="buy", mark_price=0.01)
+        executor.get_order_status.return_value = {"state": "open", "fillQty": 0}
+        clock = [1000.0]
+        sleeps = []
+
+        def fake_sleep(secs):
+            sleeps.append(secs)
+            clock[0] += secs
+
+        with patch("position_closer.time.sleep", side_effect=fake_sleep), \
+             patch("position_closer.time.time", side_effect=lambda: clock[0]):
+            closer._run_phase([leg], "phase1", duration=20, reprice_interval=15,
+                              price_fn=lambda l: l.mark_price)
+
+        # 1+2+4+8 lands on the 15s reprice; backoff restarts, capped at phase end
+        assert sleeps == [1.0, 2.0, 4.0, 8.0, 1.0, 2.0, 2.0]
+        assert executor.place_order.call_count == 2
+
+    def test_aggressive_phase_uses_tighter_poll_cap(self):
+        closer, _, executor, _, pc = _make_closer("deribit")
+        leg = pc._CloseLeg(symbol="BTC-X", qty=0.5, close_side="buy", mark_price=0.01)
+        executor.get_order_status.return_value = {"state": "open", "fillQty": 0}
+        clock = [1000.0]
+        sleeps = []
+
+        def fake_sleep(secs):
+            sleeps.append(secs)
+            clock[0] += secs
+
+        with patch("position_closer.time.sleep", side_effect=fake_sleep), \
+             patch("position_closer.time.time", side_effect=lambda: clock[0]):
+            closer._run_phase([leg], "phase2", duration=9, reprice_interval=15,
+                              price_fn=lambda l: l.mark_price,
+                              max_poll_interval=closer.PHASE2_POLL_INTERVAL)
+
+        assert sleeps == [1.0, 2.0, 2.0, 2.0, 2.0]
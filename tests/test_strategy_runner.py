@@ -20,6 +20,7 @@ def make_ctx():
     ctx = MagicMock()
     ctx.lifecycle_manager.active_trades_for_strategy.return_value = []
     ctx.lifecycle_manager.get_trades_for_strategy.return_value = []
+    ctx.lifecycle_manager.count_trades_created_on.return_value = 0
     ctx.lifecycle_manager.create.return_value = TradeLifecycle(
         open_legs=[TradeLeg(symbol="SYM-C", qty=0.1, side="buy")],
         strategy_id="test",
@@ -113,11 +114,12 @@ class TestEntryGates:
     @patch("strategy.resolve_legs")
     def test_blocked_by_max_trades_per_day(self, mock_resolve):
         runner, ctx = make_runner(max_trades_per_day=1)
-        trade = MagicMock()
-        trade.created_at = time.time()  # today
-        ctx.lifecycle_manager.get_trades_for_strategy.return_value = [trade]
+        ctx.lifecycle_manager.count_trades_created_on.return_value = 1  # one today
         runner.tick(make_account())
         ctx.lifecycle_manager.create.assert_not_called()
+        sid, day = ctx.lifecycle_manager.count_trades_created_on.call_args.args
+        assert sid == "test_strat"
+        assert day == datetime.now(timezone.utc).date()
 
     @patch("strategy.resolve_legs")
     def test_blocked_by_entry_condition(self, mock_resolve):
@@ -135,6 +137,51 @@ class TestEntryGates:
         runner.tick(make_account())
         ctx.lifecycle_manager.create.assert_not_called()
 
+    @patch("strategy.resolve_legs")
+    def test_conditions_share_pinned_clock(self, mock_resolve):
+        from strategy import _utc_now
+        mock_resolve.return_value = [TradeLeg(symbol="SYM-C", qty=0.1, side="buy")]
+        seen = []
+
+        def record(account):
+            seen.append(_utc_now())
+            return True
+        runner, ctx = make_runner(entry_conditions=[record, record])
+        runner.tick(make_account())
+        assert len(seen) == 2 and seen[0] is seen[1]
+        # Pin is released once evaluation finishes
+        assert _utc_now() is not seen[0]
+
+    def test_calendar_gates_fold_into_schedule_mask(self):
+        from strategy import time_window, weekday_filter
+        runner, ctx = make_runner(entry_conditions=[
+            weekday_filter(["mon", "fri"]), time_window(22, 2),
+        ])
+        night = (1 << 22) | (1 << 23) | (1 << 0) | (1 << 1)
+        assert runner._schedule_mask == (night, 0, 0, 0, night, 0, 0)
+        assert runner._entry_conditions == ()
+
+    @patch("strategy.resolve_legs")
+    def test_schedule_mask_blocks_outside_window(self, mock_resolve):
+        from strategy import time_window
+        hour = datetime.now(timezone.utc).hour
+        runner, ctx = make_runner(entry_conditions=[time_window(hour, hour)])  # empty window
+        runner.tick(make_account())
+        ctx.lifecycle_manager.create.assert_not_called()
+
+    @patch("strategy.resolve_legs")
+    def test_cheap_conditions_run_first(self, mock_resolve):
+        from strategy import min_equity
+        calls = []
+
+        def custom(account):
+            calls.append("custom")
+            return True
+        runner, ctx = make_runner(entry_conditions=[custom, min_equity(10**9)])
+        runner.tick(make_account())
+        ctx.lifecycle_manager.create.assert_not_called()
+        assert calls == []  # min_equity failed before the custom check ran
+
 
 # =============================================================================
 # Tick throttling
@@ -153,6 +200,27 @@ class TestThrottling:
         runner.tick(make_account())
         ctx.lifecycle_manager.create.assert_not_called()
 
+    def test_adaptive_interval_stretches_while_idle(self):
+        from strategy import _IDLE_BACKOFF, _IDLE_MISSES
+        runner, ctx = make_runner(
+            check_interval_seconds=10, adaptive_check_interval=True,
+            entry_conditions=[lambda account: False],
+        )
+        for _ in range(_IDLE_MISSES):
+            runner._last_check_time = 0.0
+            runner.tick(make_account())
+        assert runner._check_interval() == 10 * _IDLE_BACKOFF
+
+        runner._record_outcome(True)
+        assert runner._check_interval() == 10
+
+    def test_fixed_interval_by_default(self):
+        from strategy import _IDLE_MISSES
+        runner, ctx = make_runner(check_interval_seconds=10)
+        for _ in range(_IDLE_MISSES):
+            runner._record_outcome(False)
+        assert runner._check_interval() == 10
+
 
 # =============================================================================
 # Enable / disable / stop
@@ -180,7 +248,7 @@ class TestControls:
         active = [MagicMock(id="t1"), MagicMock(id="t2")]
         ctx.lifecycle_manager.active_trades_for_strategy.return_value = active
         runner.stop()
-        assert not runner._enabled
+        assert not runner.enabled
         assert ctx.lifecycle_manager.force_close.call_count == 2
 
 
@@ -218,6 +286,27 @@ class TestCallbacks:
         runner.tick(make_account())
         callback.assert_called_once()
 
+    def test_close_check_watches_only_open_trades(self):
+        callback = MagicMock()
+        runner, ctx = make_runner(on_trade_closed=callback)
+
+        trade = TradeLifecycle(open_legs=[], strategy_id="test_strat")
+        trade.state = TradeState.OPEN
+        ctx.lifecycle_manager.get_trades_for_strategy.return_value = [trade]
+        ctx.lifecycle_manager.get.side_effect = {trade.id: trade}.get
+
+        runner._check_closed_trades(make_account())
+        assert runner._open_ids == {trade.id}
+        callback.assert_not_called()
+
+        trade.state = TradeState.CLOSED
+        runner._check_closed_trades(make_account())
+        runner._check_closed_trades(make_account())
+        callback.assert_called_once()
+        assert runner._open_ids == set()
+        # Only the first check scans the full trade list
+        assert ctx.lifecycle_manager.get_trades_for_strategy.call_count == 1
+
     def test_on_trade_opened_fires_for_open_trade(self):
         callback = MagicMock()
         runner, ctx = make_runner(on_trade_opened=callback)
@@ -243,6 +332,50 @@ class TestCallbacks:
         runner.tick(make_account())  # should not raise
 
 
+# =============================================================================
+# Stats
+# =============================================================================
+
+def _closed_trade(pnl, hold=60.0, created_at=None):
+    trade = TradeLifecycle(
+        open_legs=[TradeLeg(symbol="SYM-C", qty=0.1, side="buy")],
+        strategy_id="test_strat",
+    )
+    if created_at is not None:
+        trade.created_at = created_at
+    trade.opened_at = trade.created_at
+    trade.closed_at = trade.opened_at + hold
+    trade.state = TradeState.CLOSED
+    trade.realized_pnl = pnl
+    return trade
+
+
+class TestStats:
+    def test_empty(self):
+        runner, _ = make_runner()
+        assert runner.stats["total"] == 0
+        assert runner.stats["avg_hold_seconds"] == 0.0
+
+    def test_accumulates_closed_trades(self):
+        runner, ctx = make_runner()
+        old = _closed_trade(-0.02, hold=30.0, created_at=time.time() - 3 * 86400)
+        new = _closed_trade(0.05, hold=90.0)
+        failed = TradeLifecycle(open_legs=[], strategy_id="test_strat")
+        failed.state = TradeState.FAILED
+        ctx.lifecycle_manager.get_trades_for_strategy.return_value = [old, new, failed]
+
+        runner.tick(make_account())
+        runner.tick(make_account())  # second tick must not double-count
+
+        stats = runner.stats
+        assert stats["total"] == 2
+        assert (stats["wins"], stats["losses"]) == (1, 1)
+        assert stats["total_pnl"] == pytest.approx(0.03)
+        assert stats["avg_hold_seconds"] == pytest.approx(60.0)
+        assert stats["today_trades"] == 1
+        assert stats["today_pnl"] == pytest.approx(0.05)
+
+
 # =============================================================================
 # is_done
 # =============================================================================
@@ -260,9 +393,7 @@ class TestIsDone:
     def test_done_when_quota_exhausted(self):
         runner, ctx = make_runner(max_trades_per_day=1)
         ctx.lifecycle_manager.active_trades_for_strategy.return_value = []
-        trade = MagicMock()
-        trade.created_at = time.time()  # today
-        ctx.lifecycle_manager.get_trades_for_strategy.return_value = [trade]
+        ctx.lifecycle_manager.count_trades_created_on.return_value = 1  # one today
         assert runner.is_done
 
 
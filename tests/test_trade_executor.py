@@ -0,0 +1,103 @@
+"""
+Unit tests for TradeExecutor order-status lookups — auth is mocked, no
+network calls.
+"""
+
+import threading
+from unittest.mock import MagicMock
+
+from trade_execution import TradeExecutor
+
+
+def _make_executor(pending):
+    executor = TradeExecutor()
+    executor.OPEN_ORDERS_LISTING = True
+    executor.auth = MagicMock()
+    executor.auth.is_successful.side_effect = lambda r: r.get("code") == 0
+    threads = []
+
+    def get(endpoint):
+        if endpoint.startswith("/open/option/order/pending/v1"):
+            return {"code": 0, "data": {"list": pending}}
+        threads.append(threading.current_thread().name)
+        order_id = endpoint.rsplit("=", 1)[1]
+        return {"code": 0, "data": {"orderId": order_id, "state": 1, "fillQty": 1}}
+
+    executor.auth.get.side_effect = get
+    return executor, threads
+
+
+class TestGetOrderStatuses:
+    def test_open_orders_come_from_listing(self):
+        pending = [{"orderId": 1, "state": 0}, {"orderId": 2, "state": 2}]
+        executor, threads = _make_executor(pending)
+        statuses = executor.get_order_statuses(["1", "2"])
+        assert statuses["1"]["state"] == 0 and statuses["2"]["state"] == 2
+        assert executor.auth.get.call_count == 1
+
+    def test_missing_orders_queried_concurrently(self):
+        executor, threads = _make_executor([{"orderId": 1, "state": 0}])
+        statuses = executor.get_order_statuses(["1", "2", "3"])
+        assert statuses["2"]["state"] == 1 and statuses["3"]["state"] == 1
+        assert len(threads) == 2
+        assert all(name.startswith("order-status") for name in threads)
+
+    def test_single_order_skips_listing(self):
+        executor, threads = _make_executor([])
+        statuses = executor.get_order_statuses(["7"])
+        assert statuses == {"7": {"orderId": "7", "state": 1, "fillQty": 1}}
+        assert threads == [threading.current_thread().name]
+
+    def test_listing_disabled_by_default(self):
+        executor, threads = _make_executor([{"orderId": 1, "state": 0}])
+        del executor.OPEN_ORDERS_LISTING
+        assert executor.list_open_orders() is None
+        statuses = executor.get_order_statuses(["1", "2"])
+        assert set(statuses) == {"1", "2"} and len(threads) == 2
+
+    def test_cached_listing_dropped_on_cancel(self):
+        executor, threads = _make_executor([{"orderId": 1, "state": 0}])
+        executor.auth.post.return_value = {"code": 0}
+        assert "1" in executor.list_open_orders()
+        executor.cancel_order("1")
+        executor.list_open_orders()
+        assert executor.auth.get.call_count == 2
+
+
+def _batch_executor(response):
+    executor = TradeExecutor()
+    executor.auth = MagicMock()
+    executor.auth.is_successful.side_effect = lambda r: r.get("code") == 0
+    executor.auth.post.return_value = response
+    return executor
+
+
+class TestBatchResponses:
+    def test_unparseable_create_response_yields_none(self):
+        executor = _batch_executor({"code": 0, "data": {"orderId": 5}})
+        orders = [
+            {"symbol": "A", "qty": 1, "side": 1, "price": 1.0, "client_order_id": "1"},
+            {"symbol": "B", "qty": 1, "side": 2, "price": 1.0, "client_order_id": "2"},
+        ]
+        assert executor.place_orders_batch(orders) == [None, None]
+
+    def test_cancel_needs_per_order_confirmation(self):
+        executor = _batch_executor({"code": 0, "data": [{"orderId": 1}, {"orderId": 2, "code": 1}]})
+        assert executor.cancel_orders_batch(["1", "2", "3"]) == [True, False, False]
+
+    def test_request_level_success_alone_confirms_nothing(self):
+        executor = _batch_executor({"code": 0, "data": None})
+        assert executor.cancel_orders_batch(["1", "2"]) == [False, False]
+
+
+
+class TestGetOrderByClientId:
+    def test_matching_order_returned(self):
+        executor = _batch_executor({})
+        executor.auth.get.return_value = {"code": 0, "data": {"orderId": 9, "clientOrderId": 42}}
+        assert executor.get_order_by_client_id("42")["orderId"] == 9
+
+    def test_mismatched_client_id_discarded(self):
+        executor = _batch_executor({})
+        executor.auth.get.return_value = {"code": 0, "data": {"orderId": 9, "clientOrderId": 7}}
+        assert executor.get_order_by_client_id("42") is None
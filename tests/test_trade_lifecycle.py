@@ -57,6 +57,20 @@ class TestTradeLeg:
         leg2 = TradeLeg(symbol="X", qty=1, side=2)
         assert leg2.side == "sell"
 
+    def test_slotted(self):
+        leg = TradeLeg(symbol="X", qty=1, side="buy")
+        with pytest.raises(AttributeError):
+            leg.not_a_field = 1
+        assert not hasattr(TradeLifecycle(), "__dict__")
+
+    def test_symbol_and_strategy_id_interned(self):
+        sym = "".join(["BTCUSD-28MAR26-", "100000-C"])  # built at runtime, not a literal
+        a = TradeLeg(symbol=sym, qty=1, side="buy")
+        b = TradeLeg(symbol="BTCUSD-28MAR26-100000-C", qty=1, side="buy")
+        assert a.symbol is b.symbol
+        sid = "".join(["short_", "strangle"])
+        assert TradeLifecycle(strategy_id=sid).strategy_id is TradeLifecycle(strategy_id="short_strangle").strategy_id
+
     def test_fill_price_accepts_price_object(self):
         """TradeLeg accepts Price objects for fill_price (Phase 3)."""
         from execution.currency import Price, Currency
@@ -211,6 +225,22 @@ class TestPnLMath:
         assert greeks["theta"] == pytest.approx(-0.05)
         assert greeks["vega"] == pytest.approx(0.1)
 
+    def test_structure_aggregates_memoized_per_snapshot(self):
+        pos = _make_position("A", qty=1.0, unrealized_pnl=10.0, delta=0.4)
+        account = _make_account(positions=(pos,))
+        t = TradeLifecycle(open_legs=[
+            TradeLeg(symbol="A", qty=0.5, side="buy", filled_qty=0.5),
+        ])
+        agg = t.structure_aggregates(account)
+        assert agg["pnl"] == pytest.approx(5.0)
+        assert agg["delta"] == pytest.approx(0.2)
+        assert t.structure_aggregates(account) is agg
+        assert t.structure_delta(account) == pytest.approx(0.2)
+
+        # A new snapshot (next tick) is recomputed
+        pos2 = _make_position("A", qty=1.0, unrealized_pnl=20.0, delta=0.4)
+        assert t.structure_pnl(_make_account(positions=(pos2,))) == pytest.approx(10.0)
+
 
 # ── Serialization ────────────────────────────────────────────────────────
 
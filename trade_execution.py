@@ -5,7 +5,9 @@ Trade Execution Module — Transport & Fill Management Layer
 Provides three building blocks used by ExecutionRouter for limit-mode trades:
 
   TradeExecutor      — thin Coincall REST client: place_order, cancel_order,
-                       get_order_status.  Not used for Deribit — that exchange
+                       get_order_status, plus place_orders_batch /
+                       cancel_orders_batch (batchCreate / batchCancel)
+                       and list_open_orders (one-call status poll, off by default).  Not used for Deribit — that exchange
                        uses DeribitExecutorAdapter in exchanges/deribit/executor.py
                        which shares the ExchangeExecutor interface.
 
@@ -32,23 +34,56 @@ is injected — the same code drives Coincall and Deribit without modification.
 
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any
 from config import BASE_URL, API_KEY, API_SECRET
 from auth import CoincallAuth
 from execution.currency import Currency, OrderbookSnapshot, Price
+from execution.fill_manager import _normalize_legs
 from execution.pricing import PricingEngine
 
 logger = logging.getLogger(__name__)
 _execution_logger = logging.getLogger("ct.execution")  # structured JSONL → logs/execution.jsonl
 
+# Order states after which an order can no longer fill: Coincall codes
+# (see TradeExecutor.get_order_status) and Deribit order_state strings.
+_TERMINAL_ORDER_STATES = frozenset({1, 3, 6, 10, "filled", "cancelled", "rejected"})
+
 
 class TradeExecutor:
     """Executes trades and manages orders"""
 
+    # Orders per batchCreate / batchCancel request (exchange limit).
+    BATCH_MAX_ORDERS = 20
+
+    # Seconds a list_open_orders() response is reused, so pollers that
+    # overlap within one tick share a single request.
+    OPEN_ORDERS_TTL = 0.2
+
+    # Off until /open/option/order/pending/v1 is verified for status
+    # polling: it is not in docs/API_REFERENCE.md, its per-order fields
+    # and any pagination are unconfirmed.  While off, list_open_orders()
+    # returns None and every order is polled with singleQuery.
+    OPEN_ORDERS_LISTING = False
+
+    # Concurrent singleQuery requests in get_order_statuses().
+    STATUS_FETCH_WORKERS = 4
+
     def __init__(self):
         """Initialize trade executor with authenticated API client"""
         self.auth = CoincallAuth(API_KEY, API_SECRET, BASE_URL)
+        self._open_orders: Optional[Dict[str, Dict[str, Any]]] = None
+        self._open_orders_at: float = 0.0
+        # Threads start on first submit, so this costs nothing until used
+        self._status_pool = ThreadPoolExecutor(
+            max_workers=self.STATUS_FETCH_WORKERS, thread_name_prefix="order-status",
+        )
+
+    @property
+    def rate_limited_until(self) -> float:
+        """Epoch seconds until which Coincall asked us to back off (0 if never)."""
+        return self.auth.rate_limited_until
 
     def place_order(
         self,
@@ -80,6 +115,7 @@ class TradeExecutor:
                 payload['clientOrderId'] = int(client_order_id)
             
             response = self.auth.post('/open/option/order/create/v1', payload)
+            self._open_orders = None
             
             if self.auth.is_successful(response):
                 order_id = response.get('data')
@@ -93,6 +129,120 @@ class TradeExecutor:
             logger.error(f"Exception placing order for {symbol}: {e}")
             return None
 
+    def place_orders_batch(self, orders: List[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Place several orders via POST /open/option/order/batchCreate/v1.
+
+        Each dict takes place_order() keyword arguments (int side).  The
+        orders are sent in chunks of BATCH_MAX_ORDERS, one signed request
+        per chunk.  Returns one {'orderId': ...} dict or None per input,
+        in input order; a failed chunk yields None for each of its orders.
+        """
+        results: List[Optional[Dict[str, Any]]] = []
+        for start in range(0, len(orders), self.BATCH_MAX_ORDERS):
+            chunk = orders[start:start + self.BATCH_MAX_ORDERS]
+            payload = []
+            for o in chunk:
+                item = {
+                    'symbol': o['symbol'],
+                    'qty': o['qty'],
+                    'tradeSide': o['side'],
+                    'tradeType': o.get('order_type', 1),
+                }
+                if o.get('price') is not None:
+                    item['price'] = o['price']
+                if o.get('reduce_only'):
+                    item['reduceOnly'] = 1
+                if o.get('client_order_id'):
+                    item['clientOrderId'] = int(o['client_order_id'])
+                payload.append(item)
+
+            try:
+                response = self.auth.post(
+                    '/open/option/order/batchCreate/v1', {'orderList': payload},
+                )
+                self._open_orders = None
+            except Exception as e:
+                logger.error(f"Exception placing batch of {len(chunk)} orders: {e}")
+                results.extend([None] * len(chunk))
+                continue
+
+            if not self.auth.is_successful(response):
+                logger.error(f"Batch order failed ({len(chunk)} orders): {response.get('msg')}")
+                results.extend([None] * len(chunk))
+                continue
+
+            # Response shape is not documented: anything other than a list
+            # of per-order entries yields None for the chunk, and the
+            # OrderManager resolves what was placed by clientOrderId.
+            data = response.get('data')
+            if not isinstance(data, list):
+                logger.error(
+                    f"Batch order response unparseable ({len(chunk)} orders): {data!r}"
+                )
+                results.extend([None] * len(chunk))
+                continue
+            for i, o in enumerate(chunk):
+                try:
+                    entry = data[i] if i < len(data) else None
+                    order_id = entry.get('orderId') if isinstance(entry, dict) else entry
+                    if order_id and not isinstance(order_id, (str, int)):
+                        raise TypeError(f"unexpected orderId {order_id!r}")
+                except Exception as e:
+                    logger.error(f"Batch order entry unparseable for {o['symbol']}: {e}")
+                    results.append(None)
+                    continue
+                if order_id:
+                    logger.info(f"Order placed: {order_id} for {o['symbol']} (batch)")
+                    results.append({'orderId': order_id})
+                else:
+                    msg = entry.get('msg') if isinstance(entry, dict) else None
+                    logger.error(f"Order failed for {o['symbol']} (batch): {msg}")
+                    results.append(None)
+        return results
+
+    def cancel_orders_batch(self, order_ids: List[str]) -> List[bool]:
+        """
+        Cancel several orders via POST /open/option/order/batchCancel/v1.
+
+        Not wired into the Coincall adapter: the endpoint is not in
+        docs/API_REFERENCE.md and its response shape is unverified.  An
+        order only counts as cancelled when ``data`` carries a per-order
+        entry for it without an error code — a request-level success is
+        not trusted for the whole chunk.  Callers poll every False to
+        learn the true state (the order may have filled meanwhile).
+        """
+        results: List[bool] = []
+        for start in range(0, len(order_ids), self.BATCH_MAX_ORDERS):
+            chunk = order_ids[start:start + self.BATCH_MAX_ORDERS]
+            confirmed: set = set()
+            try:
+                response = self.auth.post(
+                    '/open/option/order/batchCancel/v1',
+                    {'orderIds': [int(oid) for oid in chunk]},
+                )
+                self._open_orders = None
+                if self.auth.is_successful(response):
+                    data = response.get('data')
+                    if isinstance(data, list):
+                        confirmed = {
+                            str(e['orderId']) for e in data
+                            if isinstance(e, dict) and e.get('orderId') is not None
+                            and not e.get('code')
+                        }
+                else:
+                    logger.error(f"Failed to cancel orders {chunk}: {response.get('msg')}")
+            except Exception as e:
+                logger.error(f"Exception cancelling orders {chunk}: {e}")
+            for oid in chunk:
+                ok = str(oid) in confirmed
+                if ok:
+                    logger.info(f"Order cancelled: {oid} (batch)")
+                else:
+                    logger.warning(f"Cancel of {oid} not confirmed by batch response")
+                results.append(ok)
+        return results
+
     def cancel_order(self, order_id: str) -> bool:
         """
         Cancel an order by ID
@@ -105,6 +255,7 @@ class TradeExecutor:
         """
         try:
             response = self.auth.post('/open/option/order/cancel/v1', {'orderId': int(order_id)})
+            self._open_orders = None
             
             if self.auth.is_successful(response):
                 logger.info(f"Order cancelled: {order_id}")
@@ -150,6 +301,112 @@ class TradeExecutor:
             logger.error(f"Exception getting order status for {order_id}: {e}")
             return None
 
+    def get_order_by_client_id(self, client_order_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get order status by the clientOrderId it was placed with.
+
+        Same singleQuery endpoint and response as get_order_status().
+        Used to resolve placements whose response was lost.
+
+        Unverified: docs/API_REFERENCE.md documents singleQuery with
+        orderId only.  A response whose clientOrderId does not match the
+        one asked for is discarded, so if Coincall ignores the parameter
+        this returns None and the caller treats the placement as lost.
+
+        Returns:
+            Order information dict, or None if not found or on error
+        """
+        try:
+            response = self.auth.get(
+                f'/open/option/order/singleQuery/v1?clientOrderId={int(client_order_id)}'
+            )
+            if self.auth.is_successful(response):
+                data = response.get('data') or None
+                if isinstance(data, dict) and str(data.get('clientOrderId')) != str(client_order_id):
+                    logger.warning(
+                        f"singleQuery for clientOrderId {client_order_id} returned "
+                        f"clientOrderId {data.get('clientOrderId')} — ignoring"
+                    )
+                    return None
+                return data
+            logger.debug(f"No order for clientOrderId {client_order_id}: {response.get('msg')}")
+            return None
+
+        except Exception as e:
+            logger.error(f"Exception looking up clientOrderId {client_order_id}: {e}")
+            return None
+
+    def list_open_orders(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        Get every open order on the account in one request.
+
+        Uses GET /open/option/order/pending/v1 and returns
+        {orderId: order dict}; the dicts carry the same fields as
+        get_order_status() (fillQty, avgPrice, state, ...).  Orders that
+        filled or were cancelled are absent.  Responses are reused for
+        OPEN_ORDERS_TTL seconds; placing or cancelling drops the cached one.
+
+        The endpoint is undocumented (AccountManager.get_open_orders reads
+        it for reconciliation only), so this is gated by
+        OPEN_ORDERS_LISTING.  Pagination is unknown; an order missing from
+        a truncated list is still safe, as callers query it individually.
+
+        Returns:
+            Dict keyed by string order ID, or None when disabled or on error
+        """
+        if not self.OPEN_ORDERS_LISTING:
+            return None
+
+        now = time.monotonic()
+        if self._open_orders is not None and now - self._open_orders_at < self.OPEN_ORDERS_TTL:
+            return self._open_orders
+
+        try:
+            response = self.auth.get('/open/option/order/pending/v1')
+
+            if self.auth.is_successful(response):
+                orders = (response.get('data') or {}).get('list', [])
+                self._open_orders = {str(o.get('orderId')): o for o in orders}
+                self._open_orders_at = now
+                return self._open_orders
+            else:
+                logger.error(f"Failed to list open orders: {response.get('msg')}")
+                return None
+
+        except Exception as e:
+            logger.error(f"Exception listing open orders: {e}")
+            return None
+
+    def get_order_statuses(self, order_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get status for several orders with as few requests as possible.
+
+        Orders still open are read from one list_open_orders() response;
+        any missing from it (filled, cancelled) are queried individually,
+        since only singleQuery reports their final fill.  Those queries
+        run concurrently, so they cost about one round-trip, not N.
+
+        Args:
+            order_ids: Order IDs to look up
+
+        Returns:
+            {order_id: order dict}; IDs whose lookup failed are omitted
+        """
+        statuses: Dict[str, Dict[str, Any]] = {}
+        if len(order_ids) > 1:
+            listing = self.list_open_orders()
+            if listing:
+                statuses = {oid: listing[oid] for oid in order_ids if oid in listing}
+        missing = [oid for oid in order_ids if oid not in statuses]
+        if len(missing) > 1:
+            infos = self._status_pool.map(self.get_order_status, missing)
+        else:
+            infos = map(self.get_order_status, missing)
+        for oid, info in zip(missing, infos):
+            if info:
+                statuses[oid] = info
+        return statuses
+
 
 # =============================================================================
 # Execution Parameters — configurable per-trade
@@ -243,29 +500,48 @@ class ExecutionParams:
         aggressive_buffer_pct: (Legacy) % beyond best price. Ignored if phases set.
         max_requote_rounds: (Legacy) Max requote cycles. Ignored if phases set.
         phases: Ordered list of ExecutionPhase objects. None = use legacy flat fields.
+        poll_interval_seconds: Minimum seconds between fill-status polls for
+            this trade's orders.  0 (default) = every tick.  Fills are polled
+            on the engine tick, so values below the tick interval change
+            nothing; larger values spare the rate limit for slow trades.
     """
     fill_timeout_seconds: float = 30.0
     aggressive_buffer_pct: float = 2.0
     max_requote_rounds: int = 10
     phases: Optional[List[ExecutionPhase]] = None
+    poll_interval_seconds: float = 0.0
+
+
+# Shared default for managers created without params.  LimitFillManager only
+# reads its params, so one instance serves every trade.
+_DEFAULT_EXECUTION_PARAMS = ExecutionParams()
 
 
 # =============================================================================
 # Limit Fill Manager — tracks pending orders, polls fills, requotes on timeout
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class _LegFillState:
     """Internal: tracks one leg's order and fill progress."""
     symbol: str
     qty: float
     side: str          # "buy" or "sell"
     order_id: Optional[str] = None
+    price: Optional[float] = None  # limit price of the current order
     filled_qty: float = 0.0
     fill_price: Optional[float] = None
     requote_count: int = 0
-    started_at: float = field(default_factory=time.time)
+    started_at: float = field(default_factory=time.monotonic)
     _fill_baseline: float = 0.0  # cumulative fills before the current order was placed
+    # order_id last seen in a terminal state — not polled again until a
+    # requote gives the leg a new order_id
+    _terminal_order_id: Optional[str] = None
+
+    @property
+    def is_dead(self) -> bool:
+        """Current order is terminal (cancelled/invalid) — nothing to poll."""
+        return self.order_id is not None and self.order_id == self._terminal_order_id
 
     @property
     def is_filled(self) -> bool:
@@ -275,10 +551,6 @@ class _LegFillState:
     def remaining_qty(self) -> float:
         return max(0.0, self.qty - self.filled_qty)
 
-    @property
-    def side_label(self) -> str:
-        return self.side
-
 
 class LimitFillManager:
     """
@@ -315,19 +587,25 @@ class LimitFillManager:
     def __init__(self, executor: "TradeExecutor", params: Optional[ExecutionParams] = None,
                  order_manager: Optional[Any] = None, market_data=None):
         self._executor = executor
-        self._params = params or ExecutionParams()
+        self._params = params or _DEFAULT_EXECUTION_PARAMS
+        # Timeout/reprice bookkeeping is on time.monotonic() so a wall-clock
+        # step (NTP) can't trigger or postpone a requote.
+        self._last_poll_at: float = 0.0
         self._order_manager = order_manager
         self._market_data = market_data
         self._pricing_engine = PricingEngine()
+        # Orderbooks fetched during the current place_all()/check() pass
+        self._books: Dict[str, Optional[dict]] = {}
         self._legs: List[_LegFillState] = []
+        self._unfilled_count: int = 0  # legs not yet filled; kept by place_all() and _set_filled()
         self._skipped_symbols: List[str] = []
-        self._round_started_at: float = time.time()
+        self._round_started_at: float = time.monotonic()
 
         # Phased execution state
         self._using_phases: bool = self._params.phases is not None and len(self._params.phases) > 0
         self._phase_index: int = 0
-        self._phase_started_at: float = time.time()
-        self._last_reprice_at: float = time.time()
+        self._phase_started_at: float = time.monotonic()
+        self._last_reprice_at: float = time.monotonic()
 
         # OrderManager context (set by place_all when order_manager is active)
         self._lifecycle_id: Optional[str] = None
@@ -376,10 +654,12 @@ class LimitFillManager:
         """
         self._lifecycle_id = lifecycle_id
         self._purpose = purpose
+        self._books = {}
         self._legs = []
+        self._unfilled_count = 0
         self._skipped_symbols = []
         self._reduce_only = reduce_only  # BUG-2026-03-05: remember for requotes
-        now = time.time()
+        now = time.monotonic()
         self._round_started_at = now
         self._phase_started_at = now
         self._last_reprice_at = now
@@ -404,10 +684,7 @@ class LimitFillManager:
         # Pre-validate all prices before placing any orders.
         # In best_effort mode, skip legs with bad prices rather than aborting.
         leg_data = []
-        for leg in legs:
-            symbol = leg.symbol if hasattr(leg, 'symbol') else leg['symbol']
-            qty = leg.qty if hasattr(leg, 'qty') else leg['qty']
-            side = leg.side if hasattr(leg, 'side') else leg['side']
+        for symbol, qty, side, leg in _normalize_legs(legs):
             price = self._get_price_for_current_mode(symbol, side)
             if price is None:
                 if best_effort:
@@ -429,32 +706,39 @@ class LimitFillManager:
             logger.error("LimitFillManager: no placeable legs (all skipped or bad prices)")
             return False
 
-        for idx, (leg, symbol, qty, side, price) in enumerate(leg_data):
-            result = self._place_single(symbol, qty, side, price, reduce_only, idx)
+        # All legs go out together so none rests while the others wait
+        results = self._place_many(leg_data, reduce_only)
+        failed_symbol = None
+        for (leg, symbol, qty, side, price), result in zip(leg_data, results):
             if not result:
                 if best_effort:
                     logger.warning(f"LimitFillManager: placement rejected for {symbol} — skipping leg (best_effort)")
                     self._skipped_symbols.append(symbol)
                     continue
-                logger.error(f"LimitFillManager: failed to place order for {symbol}")
-                self.cancel_all()
-                return False
+                failed_symbol = failed_symbol or symbol
+                continue
 
             state = _LegFillState(
-                symbol=symbol, qty=qty, side=side,
+                symbol=symbol, qty=qty, side=side, price=price,
                 order_id=str(result.get('orderId', '') if isinstance(result, dict) else getattr(result, 'order_id', '')),
             )
             self._legs.append(state)
+            self._unfilled_count += 1
 
             # Write order_id back to the caller's leg object
             if hasattr(leg, 'order_id'):
                 leg.order_id = state.order_id
-            side_label = state.side_label
             logger.info(
-                f"LimitFillManager: placed {side_label} {qty}x {symbol} @ ${price} "
-                f"(order {state.order_id}) [{phase_label}]"
+                "LimitFillManager: placed %s %sx %s @ $%s (order %s) [%s]",
+                side, qty, symbol, price, state.order_id, phase_label,
             )
 
+        if failed_symbol:
+            # Atomic mode: take down whatever the batch did place
+            logger.error(f"LimitFillManager: failed to place order for {failed_symbol}")
+            self.cancel_all()
+            return False
+
         if not self._legs:
             logger.error("LimitFillManager: no orders were successfully placed")
             return False
@@ -478,11 +762,16 @@ class LimitFillManager:
             "failed"   — max requote rounds exhausted or unrecoverable error
             "pending"  — still waiting for fills
         """
-        # 1. Poll each unfilled leg
-        self._poll_fills()
+        self._books = {}  # prices computed this tick use fresh books
+
+        # 1. Poll each unfilled leg (at most every poll_interval_seconds)
+        now = time.monotonic()
+        if now - self._last_poll_at >= self._params.poll_interval_seconds:
+            self._last_poll_at = now
+            self._poll_fills()
 
         # 2. All filled?
-        if all(ls.is_filled for ls in self._legs):
+        if self._unfilled_count == 0:
             return "filled"
 
         # 3. Timeout / phase advancement
@@ -505,7 +794,7 @@ class LimitFillManager:
                 return "pending"
             # Grace tick has elapsed — one final poll, then commit to failed
             self._poll_fills()
-            if all(ls.is_filled for ls in self._legs):
+            if self._unfilled_count == 0:
                 logger.info(
                     "LimitFillManager: last-chance poll caught late fill(s) — returning 'filled'"
                 )
@@ -518,54 +807,82 @@ class LimitFillManager:
 
         When OrderManager is active, reads status from the ledger (which was
         already updated by poll_all() at the top of tick).  Otherwise, polls
-        the exchange directly via TradeExecutor.
+        the exchange directly with one TradeExecutor.get_order_statuses() call.
         """
-        for ls in self._legs:
-            if ls.is_filled or not ls.order_id:
-                continue
+        pending = [
+            ls for ls in self._legs
+            if not ls.is_filled and ls.order_id and not ls.is_dead
+        ]
+        if not pending:
+            return
+
+        if not self._order_manager:
+            # One batched lookup for every leg instead of a request per leg
             try:
-                if self._order_manager:
-                    record = self._order_manager.poll_order(ls.order_id)
-                    if record:
-                        new_total = ls._fill_baseline + record.filled_qty
-                        if new_total > ls.filled_qty:
-                            ls.filled_qty = new_total
-                            ls.fill_price = record.avg_fill_price or ls.fill_price
-                            logger.info(
-                                f"LimitFillManager: {ls.symbol} filled "
-                                f"{ls.filled_qty}/{ls.qty} @ {ls.fill_price}"
-                            )
-                        if record.is_terminal and not ls.is_filled:
-                            logger.warning(
-                                f"LimitFillManager: {ls.symbol} order {ls.order_id} "
-                                f"reached terminal state {record.status.value} "
-                                f"(filled {ls.filled_qty}/{ls.qty})"
-                            )
-                else:
-                    info = self._executor.get_order_status(ls.order_id)
-                    if info:
-                        executed = float(info.get('fillQty', 0))
-                        new_total = ls._fill_baseline + executed
-                        if new_total > ls.filled_qty:
-                            ls.filled_qty = new_total
-                            ls.fill_price = float(info.get('avgPrice', 0)) or ls.fill_price
-                            logger.info(
-                                f"LimitFillManager: {ls.symbol} filled "
-                                f"{ls.filled_qty}/{ls.qty} @ {ls.fill_price}"
-                            )
-                        # Detect externally-cancelled orders
-                        state_code = info.get('state')
-                        if state_code == 3 and not ls.is_filled:
-                            logger.warning(
-                                f"LimitFillManager: {ls.symbol} order {ls.order_id} was cancelled externally "
-                                f"(filled {ls.filled_qty}/{ls.qty})"
-                            )
+                statuses = self._executor.get_order_statuses([ls.order_id for ls in pending])
             except Exception as e:
-                logger.error(f"LimitFillManager: error checking {ls.order_id}: {e}")
+                logger.error(f"LimitFillManager: error checking orders: {e}")
+                return
+            for ls in pending:
+                info = statuses.get(ls.order_id)
+                if info:
+                    self._apply_exchange_status(ls, info)
+            return
+
+        for ls in pending:
+            try:
+                record = self._order_manager.poll_order(ls.order_id)
+                if record:
+                    new_total = ls._fill_baseline + record.filled_qty
+                    if new_total > ls.filled_qty:
+                        self._set_filled(ls, new_total, record.avg_fill_price)
+                        logger.info(
+                            "LimitFillManager: %s filled %s/%s @ %s",
+                            ls.symbol, ls.filled_qty, ls.qty, ls.fill_price,
+                        )
+                    if record.is_terminal and not ls.is_filled:
+                        ls._terminal_order_id = ls.order_id
+                        logger.warning(
+                            "LimitFillManager: %s order %s reached terminal state %s "
+                            "(filled %s/%s) — no longer polled",
+                            ls.symbol, ls.order_id, record.status.value,
+                            ls.filled_qty, ls.qty,
+                        )
+            except Exception as e:
+                logger.error("LimitFillManager: error checking %s: %s", ls.order_id, e)
+
+    def _set_filled(self, ls: _LegFillState, filled_qty: float,
+                    fill_price: Optional[float]) -> None:
+        """Update a leg's fills, keeping _unfilled_count in step."""
+        was_filled = ls.is_filled
+        ls.filled_qty = filled_qty
+        ls.fill_price = fill_price or ls.fill_price
+        if ls.is_filled and not was_filled:
+            self._unfilled_count -= 1
+
+    def _apply_exchange_status(self, ls: _LegFillState, info: Dict[str, Any]) -> None:
+        """Update a leg from a raw exchange order dict (fillQty, avgPrice, state)."""
+        executed = float(info.get('fillQty', 0))
+        new_total = ls._fill_baseline + executed
+        if new_total > ls.filled_qty:
+            self._set_filled(ls, new_total, float(info.get('avgPrice', 0)))
+            logger.info(
+                "LimitFillManager: %s filled %s/%s @ %s",
+                ls.symbol, ls.filled_qty, ls.qty, ls.fill_price,
+            )
+        # Detect externally-cancelled / rejected orders
+        state_code = info.get('state')
+        if state_code in _TERMINAL_ORDER_STATES and not ls.is_filled:
+            ls._terminal_order_id = ls.order_id
+            logger.warning(
+                "LimitFillManager: %s order %s ended in state %s "
+                "(filled %s/%s) — no longer polled",
+                ls.symbol, ls.order_id, state_code, ls.filled_qty, ls.qty,
+            )
 
     def _check_legacy(self) -> str:
         """Original timeout-based requoting logic (when phases is None)."""
-        elapsed = time.time() - self._round_started_at
+        elapsed = time.monotonic() - self._round_started_at
         if elapsed > self._params.fill_timeout_seconds:
             unfilled = [ls for ls in self._legs if not ls.is_filled]
             if any(ls.requote_count >= self._params.max_requote_rounds for ls in unfilled):
@@ -586,7 +903,7 @@ class LimitFillManager:
 
     def _check_phased(self) -> str:
         """Phase-based execution: advance through phases, reprice within phases."""
-        now = time.time()
+        now = time.monotonic()
         phase = self._current_phase
 
         if phase is None:
@@ -644,21 +961,29 @@ class LimitFillManager:
         return "pending"
 
     def cancel_all(self) -> None:
-        """Cancel any outstanding unfilled orders."""
-        for ls in self._legs:
-            if ls.order_id and not ls.is_filled:
-                try:
-                    if self._order_manager:
-                        self._order_manager.cancel_order(ls.order_id)
-                    else:
-                        self._executor.cancel_order(ls.order_id)
-                    logger.info(f"LimitFillManager: cancelled {ls.order_id} for {ls.symbol}")
-                except Exception as e:
-                    logger.warning(f"LimitFillManager: cancel failed for {ls.order_id}: {e}")
+        """Cancel any outstanding unfilled orders in one batch."""
+        order_ids = [ls.order_id for ls in self._legs if ls.order_id and not ls.is_filled]
+        if not order_ids:
+            return
+        try:
+            if self._order_manager:
+                self._order_manager.cancel_orders(order_ids)
+            else:
+                self._cancel_direct(order_ids)
+            logger.info(f"LimitFillManager: cancelled {', '.join(order_ids)}")
+        except Exception as e:
+            logger.warning(f"LimitFillManager: cancel failed for {order_ids}: {e}")
+
+    def _cancel_direct(self, order_ids: List[str]) -> List[bool]:
+        """Cancel on the exchange, batched via executor.cancel_orders() if offered."""
+        batch = getattr(self._executor, "cancel_orders", None)
+        if batch is not None and len(order_ids) > 1:
+            return batch(order_ids)
+        return [self._executor.cancel_order(oid) for oid in order_ids]
 
     @property
     def all_filled(self) -> bool:
-        return all(ls.is_filled for ls in self._legs)
+        return self._unfilled_count == 0
 
     @property
     def filled_legs(self) -> List[_LegFillState]:
@@ -687,28 +1012,40 @@ class LimitFillManager:
 
     # -- Internal -------------------------------------------------------------
 
-    def _place_single(self, symbol: str, qty: float, side: str,
-                      price: float, reduce_only: bool, leg_index: int) -> Optional[Any]:
-        """Place a single order — routes through OrderManager if available."""
+    def _place_many(self, leg_data: List[tuple], reduce_only: bool) -> List[Optional[Any]]:
+        """Place every (leg, symbol, qty, side, price) at once.
+
+        Routes through OrderManager.place_orders() if available, otherwise
+        the executor's place_orders() batch (falling back to one
+        place_order() per leg).  Returns one result or None per entry.
+        """
         if self._order_manager and self._lifecycle_id and self._purpose:
-            record = self._order_manager.place_order(
-                lifecycle_id=self._lifecycle_id,
-                leg_index=leg_index,
-                purpose=self._purpose,
-                symbol=symbol,
-                side=side,
-                qty=qty,
-                price=price,
-                reduce_only=reduce_only,
-            )
-            if record:
-                return {"orderId": record.order_id}
-            return None
-        else:
-            return self._executor.place_order(
+            records = self._order_manager.place_orders([
+                dict(
+                    lifecycle_id=self._lifecycle_id,
+                    leg_index=idx,
+                    purpose=self._purpose,
+                    symbol=symbol,
+                    side=side,
+                    qty=qty,
+                    price=price,
+                    reduce_only=reduce_only,
+                )
+                for idx, (_leg, symbol, qty, side, price) in enumerate(leg_data)
+            ])
+            return [{"orderId": r.order_id} if r else None for r in records]
+
+        orders = [
+            dict(
                 symbol=symbol, qty=qty, side=side, order_type=1, price=price,
                 reduce_only=reduce_only,  # BUG-2026-03-05: pass reduce_only to exchange
             )
+            for _leg, symbol, qty, side, price in leg_data
+        ]
+        batch = getattr(self._executor, "place_orders", None)
+        if batch is not None and len(orders) > 1:
+            return batch(orders)
+        return [self._executor.place_order(**o) for o in orders]
 
     def _requote_unfilled(self, is_phase_transition: bool = False) -> None:
         """Cancel stale orders and re-place at fresh prices (phase-aware).
@@ -721,7 +1058,8 @@ class LimitFillManager:
                 moving the price in the wrong direction (lower for sell, higher for
                 buy) would harm fill quality without any strategic benefit.
         """
-        self._round_started_at = time.time()  # reset timeout for legacy mode
+        self._round_started_at = time.monotonic()  # reset timeout for legacy mode
+        stale: List[tuple] = []  # (leg, new price)
 
         for idx, ls in enumerate(self._legs):
             if ls.is_filled:
@@ -734,98 +1072,159 @@ class LimitFillManager:
                 logger.error(f"LimitFillManager: no price for {ls.symbol} on requote")
                 continue
 
-            # Skip requote if price hasn't changed — avoids unnecessary cancel+replace API calls
-            if self._order_manager:
-                current_record = self._order_manager._orders.get(ls.order_id)
-                if current_record and current_record.price > 0:
-                    # Use relative tolerance (0.1%) to handle both USD and BTC prices
-                    if abs(current_record.price - price) / current_record.price < 0.001:
+            # Skip requote if price hasn't changed — avoids unnecessary cancel+replace
+            # API calls.  ls.price is the resting order's price on both paths.
+            current = ls.price
+            if current and current > 0:
+                # Use relative tolerance (0.1%) to handle both USD and BTC prices
+                if abs(current - price) / current < 0.001:
+                    logger.info(
+                        "LimitFillManager: skipping requote for %s — price unchanged @ %s",
+                        ls.symbol, price,
+                    )
+                    continue
+
+                # Directional guard (within-phase only): never reprice to a worse level.
+                # For sell orders, worse = lower price (less premium collected).
+                # For buy orders, worse = higher price (more cost to close).
+                # Phase transitions bypass this guard — they are intentional aggression steps.
+                if not is_phase_transition:
+                    if ls.side == "sell" and price < current:
                         logger.info(
-                            f"LimitFillManager: skipping requote for {ls.symbol} — "
-                            f"price unchanged @ {price}"
+                            "LimitFillManager: skipping within-phase reprice for %s — "
+                            "new price $%.4f < current $%.4f (sell directional guard)",
+                            ls.symbol, price, current,
                         )
                         continue
-
-                    # Directional guard (within-phase only): never reprice to a worse level.
-                    # For sell orders, worse = lower price (less premium collected).
-                    # For buy orders, worse = higher price (more cost to close).
-                    # Phase transitions bypass this guard — they are intentional aggression steps.
-                    if not is_phase_transition:
-                        if ls.side == "sell" and price < current_record.price:
-                            logger.info(
-                                f"LimitFillManager: skipping within-phase reprice for {ls.symbol} — "
-                                f"new price ${price:.4f} < current ${current_record.price:.4f} "
-                                f"(sell directional guard)"
-                            )
-                            continue
-                        elif ls.side == "buy" and price > current_record.price:
-                            logger.info(
-                                f"LimitFillManager: skipping within-phase reprice for {ls.symbol} — "
-                                f"new price ${price:.4f} > current ${current_record.price:.4f} "
-                                f"(buy directional guard)"
-                            )
-                            continue
-
-            if self._order_manager:
-                # Use OrderManager's atomic requote (cancel + replace + chain)
-                try:
-                    new_record = self._order_manager.requote_order(
-                        ls.order_id, new_price=price, new_qty=ls.remaining_qty,
-                    )
-                    if new_record:
-                        ls._fill_baseline = ls.filled_qty  # snapshot before linking new order
-                        ls.order_id = new_record.order_id
-                        ls.requote_count += 1
-                        # Sync any fills captured during the poll inside requote
-                        if new_record.filled_qty > 0:
-                            ls.filled_qty += new_record.filled_qty
+                    elif ls.side == "buy" and price > current:
                         logger.info(
-                            f"LimitFillManager: requoted {ls.side_label} "
-                            f"{ls.remaining_qty}x {ls.symbol} @ {price} "
-                            f"(round {ls.requote_count}) [via OrderManager]"
+                            "LimitFillManager: skipping within-phase reprice for %s — "
+                            "new price $%.4f > current $%.4f (buy directional guard)",
+                            ls.symbol, price, current,
                         )
-                    else:
-                        # requote returned None — check if order was actually filled
-                        old_record = self._order_manager._orders.get(ls.order_id)
-                        if old_record and old_record.status.value == "filled":
-                            logger.info(f"LimitFillManager: {ls.symbol} filled during requote")
-                        else:
-                            logger.warning(f"LimitFillManager: {ls.symbol} requote failed (cancel+replace failed)")
-                except Exception as e:
-                    logger.error(f"LimitFillManager: requote exception for {ls.symbol}: {e}")
+                        continue
+
+            stale.append((ls, price))
+
+        if not stale:
+            return
+        if self._order_manager:
+            self._requote_via_order_manager(stale)
+        else:
+            self._requote_direct(stale)
+
+    def _requote_via_order_manager(self, stale: List[tuple]) -> None:
+        """Batched cancel + replace + chain through OrderManager.requote_orders()."""
+        try:
+            new_records = self._order_manager.requote_orders([
+                (ls.order_id, price, ls.remaining_qty) for ls, price in stale
+            ])
+        except Exception as e:
+            logger.error(
+                f"LimitFillManager: requote exception for "
+                f"{', '.join(ls.symbol for ls, _ in stale)}: {e}"
+            )
+            return
+
+        for (ls, price), new_record in zip(stale, new_records):
+            if new_record:
+                ls._fill_baseline = ls.filled_qty  # snapshot before linking new order
+                ls.order_id = new_record.order_id
+                ls.price = price
+                ls.requote_count += 1
+                # Sync any fills captured during the poll inside requote
+                if new_record.filled_qty > 0:
+                    self._set_filled(ls, ls.filled_qty + new_record.filled_qty, None)
+                logger.info(
+                    "LimitFillManager: requoted %s %sx %s @ %s (round %d) [via OrderManager]",
+                    ls.side, ls.remaining_qty, ls.symbol, price, ls.requote_count,
+                )
             else:
-                # Legacy path: direct cancel + re-place
-                try:
-                    self._executor.cancel_order(ls.order_id)
-                    logger.info(f"LimitFillManager: cancelled stale order {ls.order_id} for {ls.symbol}")
-                except Exception as e:
-                    logger.warning(f"LimitFillManager: cancel failed for {ls.order_id}: {e}")
+                # requote returned None — check if order was actually filled
+                old_record = self._order_manager._orders.get(ls.order_id)
+                if old_record and old_record.status.value == "filled":
+                    logger.info(f"LimitFillManager: {ls.symbol} filled during requote")
+                else:
+                    logger.warning(f"LimitFillManager: {ls.symbol} requote failed (cancel+replace failed)")
 
-                try:
-                    result = self._executor.place_order(
-                        symbol=ls.symbol,
-                        qty=ls.remaining_qty,
-                        side=ls.side,
-                        order_type=1,
-                        price=price,
-                        reduce_only=getattr(self, '_reduce_only', False),  # BUG-2026-03-05
-                    )
-                    if result:
-                        ls._fill_baseline = ls.filled_qty  # snapshot before linking new order
-                        ls.order_id = str(result.get('orderId', ''))
-                        ls.requote_count += 1
-                        logger.info(
-                            f"LimitFillManager: requoted {ls.side_label} "
-                            f"{ls.remaining_qty}x {ls.symbol} @ ${price} "
-                            f"(round {ls.requote_count})"
-                        )
-                    else:
-                        logger.error(f"LimitFillManager: requote failed for {ls.symbol}")
-                except Exception as e:
-                    logger.error(f"LimitFillManager: requote exception for {ls.symbol}: {e}")
+    def _requote_direct(self, stale: List[tuple]) -> None:
+        """Legacy path: one batch cancel, then one batch of replacements.
+
+        As in OrderManager.requote_orders(), a replacement is only placed
+        for an order whose cancel succeeded; the rest keep their order and
+        are polled (and retried) on later ticks.
+        """
+        stale_ids = [ls.order_id for ls, _ in stale]
+        try:
+            cancelled = self._cancel_direct(stale_ids)
+        except Exception as e:
+            logger.warning(f"LimitFillManager: cancel failed for {stale_ids}: {e}")
+            return
+        kept = []
+        for (ls, price), ok in zip(stale, cancelled):
+            if ok:
+                kept.append((ls, price))
+            else:
+                logger.warning(
+                    f"LimitFillManager: cancel of {ls.order_id} ({ls.symbol}) "
+                    f"not confirmed — no replacement placed"
+                )
+        stale = kept
+        if not stale:
+            return
+        logger.info(
+            f"LimitFillManager: cancelled stale orders {', '.join(ls.order_id for ls, _ in stale)}"
+        )
+
+        orders = [
+            dict(
+                symbol=ls.symbol,
+                qty=ls.remaining_qty,
+                side=ls.side,
+                order_type=1,
+                price=price,
+                reduce_only=getattr(self, '_reduce_only', False),  # BUG-2026-03-05
+            )
+            for ls, price in stale
+        ]
+        batch = getattr(self._executor, "place_orders", None)
+        try:
+            if batch is not None and len(orders) > 1:
+                results = batch(orders)
+            else:
+                results = [self._executor.place_order(**o) for o in orders]
+        except Exception as e:
+            logger.error(
+                f"LimitFillManager: requote exception for "
+                f"{', '.join(ls.symbol for ls, _ in stale)}: {e}"
+            )
+            return
+
+        for (ls, price), result in zip(stale, results):
+            if result:
+                ls._fill_baseline = ls.filled_qty  # snapshot before linking new order
+                ls.order_id = str(result.get('orderId', ''))
+                ls.price = price
+                ls.requote_count += 1
+                logger.info(
+                    "LimitFillManager: requoted %s %sx %s @ $%s (round %d)",
+                    ls.side, ls.remaining_qty, ls.symbol, price, ls.requote_count,
+                )
+            else:
+                logger.error(f"LimitFillManager: requote failed for {ls.symbol}")
 
     # -- Pricing Helpers -------------------------------------------------------
 
+    def _get_orderbook(self, symbol: str) -> Optional[dict]:
+        """Orderbook for symbol, fetched at most once per place_all()/check() pass.
+
+        Legs sharing a symbol, and a requote following a phase advance in
+        the same tick, reuse one fetch instead of hitting the exchange again.
+        """
+        if symbol not in self._books:
+            self._books[symbol] = self._market_data.get_option_orderbook(symbol)
+        return self._books[symbol]
+
     def _get_price_for_current_mode(self, symbol: str, side: str) -> Optional[float]:
         """
         Get order price based on the current execution mode.
@@ -850,7 +1249,7 @@ class LimitFillManager:
         OrderbookSnapshot before calling the engine.
         """
         try:
-            ob = self._market_data.get_option_orderbook(symbol)
+            ob = self._get_orderbook(symbol)
             if not ob:
                 return None
 
@@ -920,7 +1319,7 @@ class LimitFillManager:
     def _get_aggressive_price(self, symbol: str, side: str) -> Optional[float]:
         """Fetch best bid/ask and apply aggressive buffer (legacy mode)."""
         try:
-            ob = self._market_data.get_option_orderbook(symbol)
+            ob = self._get_orderbook(symbol)
             if not ob:
                 return None
 
@@ -17,8 +17,9 @@ execution/router.py (Router).
 
 import json
 import logging
+import os
+import sys
 import time
-import uuid
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Callable, Dict, List, Optional
@@ -72,8 +73,19 @@ class RFQParams:
     min_improvement_pct: float = -999.0
     fallback_mode: Optional[str] = None
 
+    @classmethod
+    def from_metadata(cls, metadata: Dict[str, Any]) -> Optional["RFQParams"]:
+        """Build from the legacy metadata keys, or None if none are set."""
+        if not any(k in metadata for k in ("rfq_timeout_seconds", "rfq_min_improvement_pct", "rfq_fallback")):
+            return None
+        return cls(
+            timeout_seconds=metadata.get("rfq_timeout_seconds", 60.0),
+            min_improvement_pct=metadata.get("rfq_min_improvement_pct", -999.0),
+            fallback_mode=metadata.get("rfq_fallback"),
+        )
 
-@dataclass
+
+@dataclass(slots=True)
 class TradeLeg:
     """
     A single leg within a trade lifecycle.
@@ -98,21 +110,23 @@ class TradeLeg:
     # Populated when matched to exchange position
     position_id: Optional[str] = None
 
+    # Opposite side for closing this leg — derived from side at construction
+    close_side: str = field(init=False, repr=False, compare=False)
+
     def __post_init__(self):
-        """Normalize side to string."""
+        """Normalize side to string, derive close_side and intern the symbol."""
         # Backward compat: convert legacy int side (1/2) to string
         if isinstance(self.side, int):
             self.side = "buy" if self.side == 1 else "sell"
+        self.close_side = "sell" if self.side == "buy" else "buy"
+        # Many trades/legs share a handful of symbols — keep one copy each
+        if type(self.symbol) is str:
+            self.symbol = sys.intern(self.symbol)
 
     @property
     def is_filled(self) -> bool:
         return self.filled_qty >= self.qty
 
-    @property
-    def close_side(self) -> str:
-        """Opposite side for closing this leg."""
-        return "sell" if self.side == "buy" else "buy"
-
     @property
     def side_label(self) -> str:
         return self.side
@@ -124,6 +138,15 @@ ExitCondition = Callable[[AccountSnapshot, "TradeLifecycle"], bool]
 
 # ─── Standalone PnL helpers (no I/O inside TradeLifecycle) ───────────────
 
+def _signed_fill_notional(legs: List[TradeLeg]) -> float:
+    """Sum of fill_price * filled_qty over filled legs; buy = debit (+), sell = credit (-)."""
+    return sum(
+        ((leg.filled_qty if leg.side == "buy" else -leg.filled_qty) * float(leg.fill_price)
+         for leg in legs if leg.fill_price is not None),
+        0.0,
+    )
+
+
 def executable_pnl(legs: List[TradeLeg], market_data: Any) -> Optional[float]:
     """PnL if the structure were closed at current best bid/ask prices.
 
@@ -179,7 +202,7 @@ def executable_pnl(legs: List[TradeLeg], market_data: Any) -> Optional[float]:
     return total_exit_value
 
 
-@dataclass
+@dataclass(slots=True)
 class TradeLifecycle:
     """
     Tracks one trade (possibly multi-leg) from intent through close.
@@ -200,7 +223,7 @@ class TradeLifecycle:
         close_rfq_result: RFQResult from close (if RFQ mode)
         metadata:         Arbitrary strategy-provided context
     """
-    id: str = field(default_factory=lambda: str(uuid.uuid4())[:12])
+    id: str = field(default_factory=lambda: os.urandom(6).hex())
     strategy_id: Optional[str] = None
     state: TradeState = TradeState.PENDING_OPEN
     open_legs: List[TradeLeg] = field(default_factory=list)
@@ -232,6 +255,13 @@ class TradeLifecycle:
 
     # Non-serialized: injected by LifecycleEngine for exchange-agnostic orderbook access
     _market_data: Any = field(default=None, repr=False, compare=False)
+    # Non-serialized: (snapshot, aggregates) from the last structure_aggregates()
+    _aggregates_cache: Optional[tuple] = field(default=None, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Every trade of a strategy carries the same id — keep one copy
+        if type(self.strategy_id) is str:
+            self.strategy_id = sys.intern(self.strategy_id)
 
     # -- Helpers --------------------------------------------------------------
 
@@ -268,14 +298,34 @@ class TradeLifecycle:
         our_qty = leg.filled_qty if leg.filled_qty > 0 else leg.qty
         return min(our_qty / pos.qty, 1.0)
 
-    def structure_pnl(self, account: AccountSnapshot) -> float:
-        """Unrealised PnL for THIS lifecycle's legs only (pro-rated)."""
-        total = 0.0
+    def structure_aggregates(self, account: AccountSnapshot) -> Dict[str, float]:
+        """
+        PnL and Greeks for THIS lifecycle's legs in a single pass (pro-rated).
+
+        Each leg's position is looked up and its share computed once, rather
+        than once per metric.  AccountSnapshot is frozen and rebuilt every
+        tick, so the result is memoized for the snapshot it was computed from.
+        """
+        cached = self._aggregates_cache
+        if cached is not None and cached[0] is account:
+            return cached[1]
+        pnl = d = g = t = v = 0.0
         for leg in self.open_legs:
             pos = account.get_position(leg.symbol)
             if pos:
-                total += pos.unrealized_pnl * self._our_share(leg, pos)
-        return total
+                share = self._our_share(leg, pos)
+                pnl += pos.unrealized_pnl * share
+                d += pos.delta * share
+                g += pos.gamma * share
+                t += pos.theta * share
+                v += pos.vega * share
+        result = {"pnl": pnl, "delta": d, "gamma": g, "theta": t, "vega": v}
+        self._aggregates_cache = (account, result)
+        return result
+
+    def structure_pnl(self, account: AccountSnapshot) -> float:
+        """Unrealised PnL for THIS lifecycle's legs only (pro-rated)."""
+        return self.structure_aggregates(account)["pnl"]
 
     def executable_pnl(self) -> Optional[float]:
         """PnL if closed at current best bid/ask. Delegates to standalone function."""
@@ -283,34 +333,17 @@ class TradeLifecycle:
 
     def structure_delta(self, account: AccountSnapshot) -> float:
         """Delta for THIS lifecycle's legs only (pro-rated)."""
-        total = 0.0
-        for leg in self.open_legs:
-            pos = account.get_position(leg.symbol)
-            if pos:
-                total += pos.delta * self._our_share(leg, pos)
-        return total
+        return self.structure_aggregates(account)["delta"]
 
     def structure_greeks(self, account: AccountSnapshot) -> Dict[str, float]:
         """Aggregated Greeks for THIS lifecycle's legs only (pro-rated)."""
-        d = g = t = v = 0.0
-        for leg in self.open_legs:
-            pos = account.get_position(leg.symbol)
-            if pos:
-                share = self._our_share(leg, pos)
-                d += pos.delta * share
-                g += pos.gamma * share
-                t += pos.theta * share
-                v += pos.vega * share
-        return {"delta": d, "gamma": g, "theta": t, "vega": v}
+        agg = self.structure_aggregates(account)
+        return {"delta": agg["delta"], "gamma": agg["gamma"],
+                "theta": agg["theta"], "vega": agg["vega"]}
 
     def total_entry_cost(self) -> float:
         """Sum of fill_price * qty across all open legs (signed by side)."""
-        total = 0.0
-        for leg in self.open_legs:
-            if leg.fill_price is not None:
-                sign = 1 if leg.side == "buy" else -1  # buy = debit, sell = credit
-                total += sign * float(leg.fill_price) * leg.filled_qty
-        return total
+        return _signed_fill_notional(self.open_legs)
 
     def total_exit_cost(self) -> float:
         """Sum of fill_price * qty across all close legs (signed by side).
@@ -319,12 +352,7 @@ class TradeLifecycle:
         becomes a SELL close.  The sign convention matches total_entry_cost:
         buy = debit (+), sell = credit (-).
         """
-        total = 0.0
-        for leg in self.close_legs:
-            if leg.fill_price is not None:
-                sign = 1 if leg.side == "buy" else -1
-                total += sign * float(leg.fill_price) * leg.filled_qty
-        return total
+        return _signed_fill_notional(self.close_legs)
 
     def _finalize_close(self) -> None:
         """Capture realized PnL at close time.
@@ -344,7 +372,7 @@ class TradeLifecycle:
 
     def summary(self, account: Optional[AccountSnapshot] = None) -> str:
         legs_str = ", ".join(
-            f"{l.side_label} {l.qty}x {l.symbol}" for l in self.open_legs
+            f"{l.side} {l.qty}x {l.symbol}" for l in self.open_legs
         )
         prefix = f"[{self.id}]"
         if self.strategy_id: